@@ -0,0 +1,75 @@
+"""
+ecs_schema.py
+
+Benchmarks AoS against SoA layouts of the same component schema.
+
+Each run registers a 'RigidBody' schema (position, velocity, mass, flags) in both
+layouts, then times a single-field pass (scale every mass) and a multi-field pass
+(integrate positions from velocities of entities with a flag set).
+
+Usage:
+    python -m astraltrail.benchmarks.ecs_schema
+    python -m astraltrail.benchmarks.ecs_schema --sizes 10000 100000 --repeats 10
+"""
+
+import argparse
+
+import numpy as np
+
+from astraltrail.benchmarks.ecs_storage import DEFAULT_SIZES, DT, best_of
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.schema import ComponentSchema
+
+FIELDS = {
+    "position": (np.float32, (3,)),
+    "velocity": (np.float32, (3,)),
+    "mass": np.float32,
+    "flags": np.uint8,
+}
+
+
+def populate(layout: str, n: int) -> ComponentManager:
+    cm = ComponentManager(n)
+    cm.register_schema("RigidBody", ComponentSchema(FIELDS, layout=layout))
+    cm.add_components(
+        np.arange(n),
+        "RigidBody",
+        {
+            "velocity": np.ones((n, 3), dtype=np.float32),
+            "mass": 1.0,
+            "flags": np.arange(n) % 2,
+        },
+    )
+    return cm
+
+
+def scale_mass(cm) -> None:
+    cm.view("RigidBody").mass *= 1.0001
+
+
+def integrate(cm) -> None:
+    body = cm.view("RigidBody")
+    moving = body.flags == 1
+    body.position[moving] += body.velocity[moving] * DT
+
+
+def run(sizes, repeats: int) -> None:
+    print(f"{'entities':>10} {'layout':>8} {'one field ms':>13} {'integrate ms':>13}")
+    for n in sizes:
+        for layout in ("aos", "soa"):
+            cm = populate(layout, n)
+            field_ms = best_of(lambda: scale_mass(cm), repeats) * 1000
+            integrate_ms = best_of(lambda: integrate(cm), repeats) * 1000
+            print(f"{n:>10} {layout:>8} {field_ms:>13.3f} {integrate_ms:>13.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare AoS and SoA component schema layouts")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
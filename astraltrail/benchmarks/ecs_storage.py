@@ -0,0 +1,104 @@
+"""
+ecs_storage.py
+
+Benchmarks the default ComponentManager (one array per component) against
+ArchetypeComponentManager (one SoA table per component signature).
+
+Each run populates N entities with a dense 'Position', gives half of them a sparse
+'Velocity', then times the query and a `Position += Velocity * dt` integration pass.
+
+Usage:
+    python -m astraltrail.benchmarks.ecs_storage
+    python -m astraltrail.benchmarks.ecs_storage --sizes 10000 100000 --repeats 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from astraltrail.src.engine.ecs.component import create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+DT = 1.0 / 60.0
+
+
+def populate(storage: str, n: int):
+    em = EntityManager(max_entities=n)
+    cm = create_component_manager(n, storage=storage)
+    cm.register_component("Position", shape=(3,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(3,), dtype=np.float32, sparse=True)
+
+    ids = em.create_entities(n)
+
+    moving = ids[::2]
+    still = ids[1::2]
+    velocity = np.ones((len(moving), 3), dtype=np.float32)
+
+    if storage == "archetype":
+        cm.add_entities(moving, {"Position": 0.0, "Velocity": velocity})
+        cm.add_entities(still, {"Position": 0.0})
+    else:
+        cm.add_components(moving, "Velocity", velocity)
+
+    return em, cm
+
+
+def integrate(storage: str, cm, em) -> None:
+    if storage == "archetype":
+        for table in cm.query_tables(["Position", "Velocity"]):
+            table.column("Position")[:] += table.column("Velocity") * DT
+    else:
+        ids = cm.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+        positions = cm.get_component_data("Position")
+        rows = cm.component_rows("Velocity", ids)
+        positions[ids] += cm.get_component_data("Velocity")[rows] * DT
+
+
+def best_of(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeats: int) -> None:
+    print(
+        f"{'entities':>10} {'storage':>10} {'populate ms':>12} "
+        f"{'query ms':>10} {'integrate ms':>13}"
+    )
+    for n in sizes:
+        for storage in ("soa", "archetype"):
+            start = time.perf_counter()
+            em, cm = populate(storage, n)
+            populate_ms = (time.perf_counter() - start) * 1000
+
+            if storage == "archetype":
+                query = lambda: cm.query_tables(["Position", "Velocity"])
+            else:
+                query = lambda: cm.query_entities_with(
+                    ["Position", "Velocity"], alive_mask=em.alive_mask
+                )
+
+            query_ms = best_of(query, repeats) * 1000
+            integrate_ms = best_of(lambda: integrate(storage, cm, em), repeats) * 1000
+
+            print(
+                f"{n:>10} {storage:>10} {populate_ms:>12.2f} "
+                f"{query_ms:>10.3f} {integrate_ms:>13.3f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ECS component storage modes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
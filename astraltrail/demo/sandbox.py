@@ -3,13 +3,16 @@ import pyglet.gl as gl
 from pyglet.window import key
 import numpy as np
 import ctypes as ct
+import os
 from scipy.ndimage import distance_transform_edt as edt 
 from scipy.ndimage import zoom, gaussian_filter
 import skfmm
 
 from astraltrail.src.engine.ecs.component import ComponentManager
 from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.loop import FixedStepLoop
 from astraltrail.src.engine.ecs.system import SystemManager
+from astraltrail.src.engine.ecs.replay import InputRecorder, InputState, ReplayDriver
 from marching_cubes_triangle_table import TRIANGLE_TABLE, EDGE_TABLE
 
 corner_offsets = np.array([
@@ -54,6 +57,15 @@ mouse = {
     'left': False,
     'right': False
 }
+input_state = InputState(
+    buttons=['W', 'A', 'S', 'D', 'SPACE', 'LCTRL'],
+    axes=['mouse_dx', 'mouse_dy']
+)
+# ASTRAL_RECORD=<path> records the input of every simulation step;
+# ASTRAL_REPLAY=<path> replays a recording headlessly and prints the final camera pose
+record_path = os.environ.get('ASTRAL_RECORD')
+replay_path = os.environ.get('ASTRAL_REPLAY')
+recorder = None
 x_rate = 3
 y_rate = 3
 z_rate = 3
@@ -148,6 +160,26 @@ camera = {
 def main(mode='minecraft'):
     print(f'[SANDBOX]-{mode.upper()}')
     
+    em = EntityManager(max_entities=1024)
+    cm = ComponentManager(max_entities=1024)
+    sm = SystemManager()
+    loop = FixedStepLoop(sm, cm, em, step=1 / fps)
+
+    if replay_path is None:
+        sm.register(input_system, phase='pre')
+    sm.register(camera_system, phase='update')
+    sm.register(render_system, phase='render')
+
+    if replay_path is not None:
+        steps = ReplayDriver(replay_path, loop, input_state).run()
+        print(f'[REPLAY] {steps} steps, camera pos={camera["pos"].tolist()} '
+              f'yaw={camera["yaw"]:.4f} pitch={camera["pitch"]:.4f}')
+        return
+
+    global recorder
+    if record_path is not None:
+        recorder = InputRecorder(record_path, input_state, step=loop.step)
+
     voxel_scale = 0.1
     sdf_zoom = 4
 
@@ -181,8 +213,12 @@ def main(mode='minecraft'):
         on_draw=on_draw
     )
 
-    pyglet.clock.schedule_interval(update, 1 / fps)
-    pyglet.app.run()
+    pyglet.clock.schedule_interval(loop.advance, 1 / fps)
+    try:
+        pyglet.app.run()
+    finally:
+        if recorder is not None:
+            recorder.close()
 
 def compute_normal(sdf, pos, delta=0.5):
     dx = trilinear_sdf_sample(sdf, pos + [delta, 0, 0]) - trilinear_sdf_sample(sdf, pos - [delta, 0, 0])
@@ -269,11 +305,27 @@ def trilinear_sdf_sample(sdf, pos):
     coords = np.array(pos, dtype=np.float32).reshape(3, 1)
     return map_coordinates(sdf, coords, order=1, mode='nearest')[0]
 
-def update(dt):
-    update_uniforms(dt)
+def sample_input():
+    for name in input_state.buttons:
+        input_state.set_button(name, keys[getattr(key, name)])
+    input_state.set_axis('mouse_dx', mouse['dx'])
+    input_state.set_axis('mouse_dy', mouse['dy'])
     mouse['dx'] = 0
     mouse['dy'] = 0
 
+# Systems run by the FixedStepLoop: input is sampled (and recorded) once per
+# simulation step, the camera moves by the fixed step, and rendering reads the result
+def input_system(cm, em, dt):
+    sample_input()
+    if recorder is not None:
+        recorder.record()
+
+def camera_system(cm, em, dt):
+    update_camera(dt)
+
+def render_system(cm, em, alpha):
+    update_uniforms()
+
 def initiate_uniforms(program):
     gl.glUseProgram(program)
 
@@ -327,26 +379,26 @@ def get_camera_movement_state():
     if keys[key.ESCAPE]:
         window.close()
 
-    if keys[key.W]:
+    if input_state.down('W'):
         dz = 1
 
-    if keys[key.A]:
+    if input_state.down('A'):
         dx = 1
 
-    if keys[key.S]:
+    if input_state.down('S'):
         dz = -1
 
-    if keys[key.D]:
+    if input_state.down('D'):
         dx = -1
 
-    if keys[key.SPACE]:
+    if input_state.down('SPACE'):
         dy = 1
 
-    if keys[key.LCTRL]:
+    if input_state.down('LCTRL'):
         dy = -1
 
-    dyaw = mouse['dx']
-    dpitch = -mouse['dy']
+    dyaw = input_state.axis('mouse_dx')
+    dpitch = -input_state.axis('mouse_dy')
 
     rotation = (dyaw, dpitch, droll)
     movement = (dx, dy, dz)        
@@ -489,12 +541,12 @@ def generate_proj_matrix(fov, aspect, near, far):
     
     return proj
 
-def update_uniforms(delta_t):
+def update_uniforms():
     global rast_program, light_position
     view_loc = gl.glGetUniformLocation(rast_program, b'view')
     light_loc = gl.glGetUniformLocation(rast_program, b'lightPos')
 
-    pos, yaw, pitch, roll = update_camera(delta_t)
+    pos, yaw, pitch, roll = camera['pos'], camera['yaw'], camera['pitch'], camera['roll']
 
     view = generate_view_matrix(pos, yaw, pitch, roll)
 
@@ -0,0 +1,379 @@
+"""
+archetype.py
+
+Provides an archetype-based alternative to the single-array-per-component layout
+of ComponentManager. Entities are grouped by their exact component signature into
+Archetype tables, each of which stores its components as contiguous SoA columns.
+
+Systems iterate whole tables (every row holds every component of the signature),
+so no masks or gathers are needed in the inner loop. The price is a row move
+between tables whenever an entity gains or loses a component.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class Archetype:
+    """
+    A table of entities sharing one component signature.
+
+    Rows are packed: the first `count` rows of every column are live, and removal
+    swaps the last row into the freed slot so the table never has holes.
+
+    Attributes:
+        index (int): Position of this archetype in its manager's archetype list.
+        signature (frozenset[str]): Component names stored by this table.
+        columns (dict[str, np.ndarray]): Backing SoA arrays, one per component.
+        entities (NDArray[np.uint32]): Entity ID stored in each row.
+        count (int): Number of live rows.
+    """
+
+    def __init__(self, index: int, signature: frozenset, meta: dict, capacity: int = 64) -> None:
+        self.index: int = index
+        self.signature: frozenset = signature
+        self.capacity: int = max(1, capacity)
+        self.count: int = 0
+        self.entities: NDArray[np.uint32] = np.empty(self.capacity, dtype=np.uint32)
+        self.columns: dict = {
+            name: np.zeros((self.capacity, *meta[name]["shape"]), dtype=meta[name]["dtype"])
+            for name in signature
+        }
+
+        # Cached transitions to neighbouring archetypes: {component_name: Archetype}
+        self.add_edges: dict = {}
+        self.remove_edges: dict = {}
+
+    @property
+    def ids(self) -> NDArray[np.uint32]:
+        """Entity IDs of the live rows, in row order."""
+        return self.entities[: self.count]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a view of the live rows of one component column.
+
+        Args:
+            name (str): Component name; must be part of this table's signature.
+
+        Returns:
+            np.ndarray: Contiguous view of shape (count, *component_shape).
+        """
+        return self.columns[name][: self.count]
+
+    def reserve(self, extra: int) -> None:
+        """
+        Make room for at least `extra` more rows, doubling capacity as needed.
+        """
+        needed = self.count + extra
+        if needed <= self.capacity:
+            return
+
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+
+        entities = np.empty(capacity, dtype=np.uint32)
+        entities[: self.count] = self.entities[: self.count]
+        self.entities = entities
+
+        for name, column in self.columns.items():
+            grown = np.zeros((capacity, *column.shape[1:]), dtype=column.dtype)
+            grown[: self.count] = column[: self.count]
+            self.columns[name] = grown
+
+        self.capacity = capacity
+
+    def append(self, eid: int) -> int:
+        """
+        Append a row for an entity and return its row index. Column values are zeroed.
+        """
+        self.reserve(1)
+        row = self.count
+        self.entities[row] = eid
+        for column in self.columns.values():
+            column[row] = 0
+        self.count += 1
+        return row
+
+    def append_many(self, eids: NDArray) -> slice:
+        """
+        Append a block of rows for several entities and return the slice they occupy.
+        """
+        n = len(eids)
+        self.reserve(n)
+        rows = slice(self.count, self.count + n)
+        self.entities[rows] = eids
+        for column in self.columns.values():
+            column[rows] = 0
+        self.count += n
+        return rows
+
+    def swap_remove(self, row: int):
+        """
+        Remove a row by moving the last row into its place.
+
+        Returns:
+            int | None: The entity ID that was moved into `row`, or None if the
+            removed row was the last one.
+        """
+        last = self.count - 1
+        self.count = last
+        if row == last:
+            return None
+
+        self.entities[row] = self.entities[last]
+        for column in self.columns.values():
+            column[row] = column[last]
+        return int(self.entities[row])
+
+
+class ArchetypeComponentManager:
+    """
+    Component storage that groups entities into Archetype tables by component signature.
+
+    Implements the per-entity and bulk add/remove/cleanup calls and entity queries of
+    ComponentManager, so the two can be swapped via
+    `create_component_manager(..., storage="archetype")` for code that sticks to
+    them (systems, CommandBuffer, prefabs). Unlike ComponentManager, every component
+    is owned explicitly: the dense/sparse flag is kept in `meta` for compatibility
+    but an entity only holds the components it was given.
+
+    Not supported in archetype mode: whole-array access (`components`,
+    `get_component_data`, `query_mask`), change tracking (`changed_ticks`,
+    `track_changes`), cached query views (`register_query`), schemas, and the tools
+    built on them (introspect, snapshots, delta streams, rewind).
+
+    Attributes:
+        max_entities (int): Upper bound on entity IDs.
+        meta (dict): {component_name: {"shape": ..., "dtype": ..., "sparse": ...}}
+        archetypes (list[Archetype]): All tables created so far, including empty ones.
+        entity_archetype (NDArray[np.int32]): Table index per entity (-1 if none).
+        entity_row (NDArray[np.int64]): Row index within that table per entity.
+    """
+
+    def __init__(self, max_entities: int) -> None:
+        self.max_entities: int = max_entities
+        self.meta: dict = {}
+        self.archetypes: list = []
+        self._by_signature: dict = {}
+        self.entity_archetype: NDArray[np.int32] = np.full(max_entities, -1, dtype=np.int32)
+        self.entity_row: NDArray[np.int64] = np.zeros(max_entities, dtype=np.int64)
+
+    def register_component(
+        self, name: str, shape: tuple, dtype=np.float32, sparse: bool = False
+    ) -> None:
+        """
+        Register a new component type. Storage is allocated lazily per archetype.
+        """
+        if name in self.meta:
+            raise ValueError(f"Component '{name}' is already registered.")
+
+        self.meta[name] = {"shape": shape, "dtype": dtype, "sparse": sparse}
+
+    def _check_registered(self, name: str) -> None:
+        if name not in self.meta:
+            raise KeyError(f"Component '{name}' is not registered.")
+
+    def get_archetype(self, signature) -> Archetype:
+        """
+        Return the table for a component signature, creating it on first use.
+        """
+        signature = frozenset(signature)
+        archetype = self._by_signature.get(signature)
+        if archetype is None:
+            for name in signature:
+                self._check_registered(name)
+            archetype = Archetype(len(self.archetypes), signature, self.meta)
+            self.archetypes.append(archetype)
+            self._by_signature[signature] = archetype
+        return archetype
+
+    def _archetype_of(self, entity_id: int):
+        index = self.entity_archetype[entity_id]
+        return None if index < 0 else self.archetypes[index]
+
+    def _move(self, entity_id: int, src, dst) -> None:
+        """
+        Move an entity's row from table `src` to table `dst`, copying shared columns.
+        Either side may be None (entering or leaving archetype storage).
+        """
+        if dst is not None:
+            row_dst = dst.append(entity_id)
+
+        if src is not None:
+            row_src = int(self.entity_row[entity_id])
+            if dst is not None:
+                for name in src.signature & dst.signature:
+                    dst.columns[name][row_dst] = src.columns[name][row_src]
+            moved = src.swap_remove(row_src)
+            if moved is not None:
+                self.entity_row[moved] = row_src
+
+        if dst is None:
+            self.entity_archetype[entity_id] = -1
+        else:
+            self.entity_archetype[entity_id] = dst.index
+            self.entity_row[entity_id] = row_dst
+
+    def add_component(self, entity_id: int, name: str, value) -> None:
+        """
+        Assign a component value to an entity, moving it to the archetype that
+        includes the component if it did not hold it yet.
+        """
+        self._check_registered(name)
+
+        src = self._archetype_of(entity_id)
+        if src is None or name not in src.signature:
+            if src is None:
+                dst = self.get_archetype((name,))
+            else:
+                dst = src.add_edges.get(name)
+                if dst is None:
+                    dst = self.get_archetype(src.signature | {name})
+                    src.add_edges[name] = dst
+            self._move(entity_id, src, dst)
+            src = dst
+
+        src.columns[name][self.entity_row[entity_id]] = value
+
+    def add_entities(self, entity_ids, values: dict) -> Archetype:
+        """
+        Insert a batch of entities that hold no components yet directly into the
+        archetype for `values.keys()`, writing each column with one block copy.
+
+        Args:
+            entity_ids (array-like): IDs of the entities to insert.
+            values (dict): {component_name: value or per-entity array of values}.
+
+        Returns:
+            Archetype: The table the entities were placed in.
+
+        Raises:
+            ValueError: If `values` is empty, an ID is repeated, or any of the entities
+                already has components.
+        """
+        if not values:
+            raise ValueError("add_entities() requires at least one component")
+        entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        if np.unique(entity_ids).size != entity_ids.size:
+            raise ValueError("add_entities() received duplicate entity IDs")
+        if np.any(self.entity_archetype[entity_ids] >= 0):
+            raise ValueError("add_entities() requires entities without components")
+
+        archetype = self.get_archetype(values.keys())
+        rows = archetype.append_many(entity_ids)
+        for name, value in values.items():
+            archetype.columns[name][rows] = value
+
+        self.entity_archetype[entity_ids] = archetype.index
+        self.entity_row[entity_ids] = np.arange(rows.start, rows.stop)
+        return archetype
+
+    def has_component(self, entity_id: int, name: str) -> bool:
+        """
+        Check whether an entity currently holds a given component.
+        """
+        archetype = self._archetype_of(entity_id)
+        return archetype is not None and name in archetype.signature
+
+    def get_component(self, entity_id: int, name: str) -> np.ndarray:
+        """
+        Return a view of one entity's component value.
+        """
+        self._check_registered(name)
+        archetype = self._archetype_of(entity_id)
+        if archetype is None or name not in archetype.signature:
+            raise KeyError(f"Entity {entity_id} has no component '{name}'.")
+        return archetype.columns[name][self.entity_row[entity_id]]
+
+    def remove_component(self, entity_id: int, name: str) -> None:
+        """
+        Remove a component from an entity, moving it to the archetype without it.
+
+        Raises:
+            KeyError: If the component is not registered or the entity does not hold it.
+        """
+        self._check_registered(name)
+
+        src = self._archetype_of(entity_id)
+        if src is None or name not in src.signature:
+            raise KeyError(f"Entity {entity_id} has no component '{name}'.")
+
+        if name in src.remove_edges:
+            dst = src.remove_edges[name]
+        else:
+            signature = src.signature - {name}
+            dst = self.get_archetype(signature) if signature else None
+            src.remove_edges[name] = dst
+        self._move(entity_id, src, dst)
+
+    def query_tables(self, component_names: list[str]) -> list:
+        """
+        Return the non-empty archetypes whose signature includes all given components.
+        Systems can iterate `table.column(name)` for each one without masks or gathers.
+        """
+        for name in component_names:
+            self._check_registered(name)
+
+        required = frozenset(component_names)
+        return [
+            archetype
+            for archetype in self.archetypes
+            if archetype.count and required <= archetype.signature
+        ]
+
+    def query_entities_with(self, component_names: list[str], alive_mask=None) -> np.ndarray:
+        """
+        Return a sorted array of entity IDs that hold all of the specified components.
+        If alive_mask is given, only entities marked alive are returned.
+        """
+        if not component_names:
+            return np.empty(0, dtype=np.intp)
+
+        tables = self.query_tables(component_names)
+        if not tables:
+            return np.empty(0, dtype=np.intp)
+
+        ids = np.sort(np.concatenate([table.ids for table in tables]).astype(np.intp))
+        if alive_mask is not None:
+            ids = ids[alive_mask[ids]]
+        return ids
+
+    def cleanup_entity(self, entity_id: int) -> None:
+        """
+        Remove every component associated with a deleted or recycled entity.
+        """
+        archetype = self._archetype_of(entity_id)
+        if archetype is not None:
+            self._move(entity_id, archetype, None)
+
+    def add_components(self, entity_ids, name: str, values) -> None:
+        """
+        Assign a component to many entities. `values` may be a single value (shared
+        by all) or one value per entity.
+        """
+        self._check_registered(name)
+        entity_ids = np.asarray(entity_ids, dtype=np.intp).ravel()
+        meta = self.meta[name]
+        values = np.broadcast_to(
+            np.asarray(values, dtype=meta["dtype"]), (len(entity_ids), *meta["shape"])
+        )
+        for eid, value in zip(entity_ids.tolist(), values):
+            self.add_component(eid, name, value)
+
+    def remove_components(self, entity_ids, name: str) -> None:
+        """
+        Remove a component from many entities. Entities that do not hold it are ignored.
+        """
+        self._check_registered(name)
+        for eid in np.unique(np.asarray(entity_ids, dtype=np.intp)).tolist():
+            if self.has_component(eid, name):
+                self.remove_component(eid, name)
+
+    def cleanup_entities(self, entity_ids) -> None:
+        """
+        Bulk version of cleanup_entity. Pair with EntityManager.destroy_entities.
+        """
+        for eid in np.unique(np.asarray(entity_ids, dtype=np.intp)).tolist():
+            self.cleanup_entity(eid)
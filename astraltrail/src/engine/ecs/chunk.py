@@ -0,0 +1,106 @@
+"""
+chunk.py
+
+Splits the entity ID space into contiguous ranges so systems can work on
+cache-sized batches instead of the full `max_entities` arrays or scattered IDs.
+
+A system registered with `chunk_size` is called once per range with an extra
+`chunk` argument:
+
+    def integrate(cm, em, dt, chunk):
+        pos, vel = chunk["Position"], chunk["Velocity"]
+        pos[chunk.alive] += vel[chunk.alive] * dt
+
+Component access through a chunk returns zero-copy views of the dense arrays, so
+writes land in the component storage. With paged storage, iter_chunks() also splits
+ranges at page boundaries (pick a chunk size that divides the page size to keep
+chunks even), and the pages a chunk reads are allocated so its views are writable.
+"""
+
+import numpy as np
+
+from .paged import PagedArray
+
+
+def split_range(start: int, stop: int, size: int) -> list:
+    """
+    Split [start, stop) into consecutive (start, stop) pairs of at most `size` rows.
+    """
+    if size <= 0:
+        raise ValueError("chunk size must be positive")
+    return [(lo, min(lo + size, stop)) for lo in range(start, stop, size)]
+
+
+class Chunk:
+    """
+    A contiguous range of entity IDs with views into the component arrays.
+
+    Attributes:
+        start (int): First entity ID in the range.
+        stop (int): One past the last entity ID in the range.
+        cm (ComponentManager): Source of the component arrays.
+        alive (NDArray[np.bool_] | None): View of the alive mask over the range
+            (None when the system was run without an EntityManager).
+    """
+
+    def __init__(self, cm, start: int, stop: int, alive=None) -> None:
+        self.cm = cm
+        self.start: int = start
+        self.stop: int = stop
+        self.alive = alive
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Entity IDs covered by the chunk."""
+        return np.arange(self.start, self.stop)
+
+    def __getitem__(self, name: str):
+        """
+        Return the rows [start, stop) of a dense component.
+
+        Raises:
+            KeyError: If the component is not registered.
+            ValueError: If the component is sparse, or paged and the range crosses a
+                page boundary (which could only be served as a copy).
+        """
+        if name not in self.cm.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+        if self.cm.meta[name]["sparse"]:
+            raise ValueError(f"Component '{name}' is sparse and has no entity-indexed rows")
+
+        data = self.cm.components[name]
+        if isinstance(data, PagedArray) and self.stop > self.start:
+            if self.start // data.page_size != (self.stop - 1) // data.page_size:
+                raise ValueError(
+                    f"Chunk [{self.start}, {self.stop}) crosses a page boundary of '{name}'"
+                )
+            data.grow_to(self.stop)
+        return data[self.start : self.stop]
+
+    def views(self, names) -> list:
+        """Return views for several components, in order."""
+        return [self[name] for name in names]
+
+
+def iter_chunks(cm, em, size: int):
+    """
+    Yield Chunks covering every entity ID in use (up to `em.next_id`, or the whole
+    capacity without an EntityManager). With paged storage no chunk crosses a page.
+    """
+    stop = cm.max_entities if em is None else em.next_id
+    page_size = getattr(cm, "page_size", None)
+    if page_size:
+        ranges = [
+            pair
+            for page in range(0, stop, page_size)
+            for pair in split_range(page, min(page + page_size, stop), size)
+        ]
+    else:
+        ranges = split_range(0, stop, size)
+
+    for lo, hi in ranges:
+        alive = None if em is None else em.alive_mask[lo:hi]
+        yield Chunk(cm, lo, hi, alive)
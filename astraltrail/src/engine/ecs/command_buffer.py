@@ -0,0 +1,187 @@
+"""
+command_buffer.py
+
+Provides CommandBuffer, which records structural ECS changes (spawn, destroy,
+add component, remove component) while systems iterate and applies them later in
+sorted, batched form. Deferring the changes keeps the ID arrays systems are
+iterating valid, and flushing them grouped per component turns thousands of
+single-entity calls into one scatter per component array.
+
+SystemManager owns a buffer (`sm.commands`) and flushes it at the end of every
+phase it runs.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class PendingSpawn:
+    """
+    Placeholder returned by CommandBuffer.spawn.
+
+    Attributes:
+        n (int): Number of entities requested.
+        components (dict): Component values to assign after creation.
+        ids (NDArray[np.intp] | None): Entity IDs, filled in when the buffer is flushed.
+    """
+
+    def __init__(self, n: int, components: dict) -> None:
+        self.n: int = n
+        self.components: dict = components
+        self.ids = None
+
+
+class CommandBuffer:
+    """
+    A queue of deferred structural changes, applied in bulk by flush().
+
+    Flush order is fixed: destroys, then component removals, then component
+    additions, then spawns. Additions and removals aimed at entities destroyed in
+    the same flush are dropped, and when an entity receives the same component
+    several times the last recorded value wins.
+
+    Usage:
+        def explode(cm, em, dt):
+            dead = cm.query_entities_with(["Health"], alive_mask=em.alive_mask)
+            sm.commands.destroy(dead)
+            sm.commands.spawn({"Particle": [0.0, 0.0]}, n=100)
+    """
+
+    def __init__(self) -> None:
+        self._destroys: list = []
+        self._removes: dict = {}
+        self._adds: dict = {}
+        self._spawns: list = []
+
+    def __len__(self) -> int:
+        """Number of recorded commands."""
+        return (
+            len(self._destroys)
+            + sum(len(entries) for entries in self._removes.values())
+            + sum(len(entries) for entries in self._adds.values())
+            + len(self._spawns)
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._destroys or self._removes or self._adds or self._spawns)
+
+    def clear(self) -> None:
+        """Discard all recorded commands without applying them."""
+        self._destroys.clear()
+        self._removes.clear()
+        self._adds.clear()
+        self._spawns.clear()
+
+    # --- recording ---
+
+    def spawn(self, components: dict | None = None, n: int = 1) -> PendingSpawn:
+        """
+        Record the creation of `n` entities carrying the given component values.
+        Values may be shared by all instances or given per instance.
+        """
+        pending = PendingSpawn(n, dict(components or {}))
+        self._spawns.append(pending)
+        return pending
+
+    def destroy(self, entity_ids) -> None:
+        """Record the destruction of one or more entities."""
+        self._destroys.append(np.atleast_1d(np.asarray(entity_ids, dtype=np.intp)))
+
+    def add(self, entity_ids, name: str, value) -> None:
+        """Record assigning a component value to one or more entities."""
+        ids = np.atleast_1d(np.asarray(entity_ids, dtype=np.intp))
+        self._adds.setdefault(name, []).append((ids, value))
+
+    def remove(self, entity_ids, name: str) -> None:
+        """Record removing a sparse component from one or more entities."""
+        ids = np.atleast_1d(np.asarray(entity_ids, dtype=np.intp))
+        self._removes.setdefault(name, []).append(ids)
+
+    # --- applying ---
+
+    @staticmethod
+    def _gather_adds(cm, name: str, entries: list, destroyed) -> tuple:
+        """
+        Merge the recorded additions for one component into sorted, unique IDs
+        with their values (last write wins), skipping destroyed entities.
+        """
+        shape = tuple(cm.meta[name]["shape"])
+        dtype = cm.meta[name]["dtype"]
+
+        schema = getattr(cm, "schemas", {}).get(name)
+
+        ids = np.concatenate([entry_ids for entry_ids, _ in entries])
+        values = np.concatenate(
+            [
+                (
+                    schema.records(value, len(entry_ids))
+                    if schema is not None
+                    else np.broadcast_to(np.asarray(value, dtype=dtype), (len(entry_ids), *shape))
+                )
+                for entry_ids, value in entries
+            ]
+        )
+
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        values = values[order]
+
+        last = np.ones(len(ids), dtype=np.bool_)
+        last[:-1] = ids[1:] != ids[:-1]
+        if destroyed is not None:
+            last &= ~np.isin(ids, destroyed)
+        return ids[last], values[last]
+
+    def flush(self, em, cm) -> None:
+        """
+        Apply every recorded command to the managers and empty the buffer.
+        Destroys of entities that are no longer alive are dropped. The buffer is
+        emptied even if applying a command raises, so a bad command is not retried
+        on every later flush.
+
+        Args:
+            em (EntityManager): Receives bulk destroy/create calls.
+            cm (ComponentManager): Receives bulk cleanup/add/remove calls.
+        """
+        try:
+            self._apply(em, cm)
+        finally:
+            self.clear()
+
+    def _apply(self, em, cm) -> None:
+        """Apply the recorded commands in flush order."""
+        destroyed = None
+        if self._destroys:
+            destroyed = np.unique(np.concatenate(self._destroys))
+            # Already-dead IDs are stale; out-of-range ones still raise below
+            valid = (destroyed >= 0) & (destroyed < em.max_entities)
+            dead = np.zeros(len(destroyed), dtype=np.bool_)
+            dead[valid] = ~em.alive_mask[destroyed[valid]]
+            em.destroy_entities(destroyed[~dead])
+            cm.cleanup_entities(destroyed[~dead])
+
+        for name, entries in self._removes.items():
+            ids = np.concatenate(entries)
+            if destroyed is not None:
+                ids = ids[~np.isin(ids, destroyed)]
+            cm.remove_components(ids, name)
+
+        for name, entries in self._adds.items():
+            ids, values = self._gather_adds(cm, name, entries, destroyed)
+            cm.add_components(ids, name, values)
+
+        if self._spawns:
+            total = sum(pending.n for pending in self._spawns)
+            ids = em.create_entities(total)
+
+            spawned_adds: dict = {}
+            start = 0
+            for pending in self._spawns:
+                pending.ids = ids[start : start + pending.n]
+                start += pending.n
+                for name, value in pending.components.items():
+                    spawned_adds.setdefault(name, []).append((pending.ids, value))
+
+            for name, entries in spawned_adds.items():
+                spawn_ids, values = self._gather_adds(cm, name, entries, None)
+                cm.add_components(spawn_ids, name, values)
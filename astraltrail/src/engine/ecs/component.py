@@ -1,9 +1,35 @@
 import numpy as np
 
+from .archetype import ArchetypeComponentManager
+from .paged import DEFAULT_PAGE_SIZE, PagedArray
+from .query import QueryView
+from .schema import ComponentSchema, SchemaView
+
+STORAGE_MODES = ("soa", "archetype", "paged")
+
+# Initial number of packed rows allocated for a sparse component
+SPARSE_INITIAL_CAPACITY = 64
+
+
 class ComponentManager:
     """
     Manages component data for all entities using a Struct-of-Arrays (SoA) layout.
     Supports both sparse (opt-in) and dense (defaulted) storage modes.
+
+    Dense components hold one row per entity slot, indexed by entity ID.
+    Sparse components use a sparse set: `sparse_index` maps entity IDs to rows of a
+    packed value array whose first `sparse_counts[name]` rows are live, with
+    `sparse_owners` recording the entity in each row. Memory scales with the number
+    of owners and removal swaps the last row into the hole.
+
+    If `page_size` is given, dense components are stored as PagedArrays: fixed-size
+    pages allocated on first touch that never move, so capacity starts at zero and
+    grows without copies. Use iter_pages() to walk any component page by page.
+    Sparse components are not paged: their packed arrays still grow by doubling
+    (a copy), so views into them are invalidated when they grow.
+
+    Multi-field components are declared with register_schema() and read through
+    named field views (`cm.view("RigidBody").mass`); see schema.py.
     
     Responsibilities:
     - Registering and initializing component arrays
@@ -13,22 +39,48 @@ class ComponentManager:
     - Maintaining high-performance layout for simulation
     """
 
-    def __init__(self, max_entities: int):
+    def __init__(self, max_entities: int, page_size: int | None = None):
         self.max_entities = max_entities
 
+        # Rows per page for dense components (None = one contiguous array each)
+        self.page_size = page_size
+
         # Registered component arrays: {component_name: np.ndarray}
+        # (full-size for dense components, packed and growable for sparse ones)
         self.components = {}
 
-        # Sparse entity masks: {component_name: set(entity_id)}
+        # Sparse sets: entity -> packed row (-1 if absent), packed row -> entity, live rows
+        self.sparse_index = {}
+        self.sparse_owners = {}
+        self.sparse_counts = {}
+
+        # Sparse entity masks: {component_name: np.ndarray[bool] of length max_entities}
         self.entity_masks = {}
 
-        # Component metadata: {component_name: {"shape": ..., "dtype": ..., "sparse": ...}}
+        # Component metadata:
+        # {component_name: {"shape": ..., "dtype": ..., "sparse": ..., "track_changes": ...}}
         self.meta = {}
 
-    def register_component(self, name: str, shape: tuple, dtype=np.float32, sparse: bool = False):
+        # Change tracking: current tick and
+        # {component_name: np.ndarray[uint32] tick of last write per entity}
+        self.tick = 1
+        self.changed_ticks = {}
+
+        # Multi-field component schemas: {component_name: ComponentSchema}
+        self.schemas = {}
+
+        # Persistent query views: {(component_names, em): QueryView}
+        self.queries = {}
+
+        # Views affected by each sparse component: {component_name: [QueryView]}
+        self._views_by_component = {}
+
+    def register_component(self, name: str, shape: tuple, dtype=np.float32, sparse: bool = False,
+                           track_changes: bool = False):
         """
         Register a new component type with its shape, dtype, and sparsity mode.
         Allocates memory in a flat SoA-compatible format.
+        With track_changes, writes are stamped with the current tick (see query_changed).
         """
         if name in self.components:
             raise ValueError(f"Component '{name}' is already registered.")
@@ -36,15 +88,163 @@ class ComponentManager:
         self.meta[name] = {
             "shape": shape,
             "dtype": dtype,
-            "sparse": sparse
+            "sparse": sparse,
+            "track_changes": track_changes
         }
 
-        # Allocate component storage array (always full size)
-        self.components[name] = np.zeros((self.max_entities, *shape), dtype=dtype)
+        if track_changes:
+            self.changed_ticks[name] = np.zeros(self.max_entities, dtype=np.uint32)
+
+        if not sparse:
+            # Dense storage holds a row for every entity slot
+            self.components[name] = self._allocate_dense(name, shape, dtype)
+            return
+
+        # Sparse storage only holds packed rows for owners, grown on demand
+        capacity = min(SPARSE_INITIAL_CAPACITY, self.max_entities)
+        self.components[name] = np.zeros((capacity, *shape), dtype=dtype)
+        self.sparse_owners[name] = np.empty(capacity, dtype=np.uint32)
+        self.sparse_index[name] = np.full(self.max_entities, -1, dtype=np.int32)
+        self.sparse_counts[name] = 0
+        self.entity_masks[name] = np.zeros(self.max_entities, dtype=np.bool_)
+
+    def register_schema(self, name: str, schema: ComponentSchema, sparse: bool = False,
+                        track_changes: bool = False):
+        """
+        Register a multi-field component described by a ComponentSchema.
+        AoS schemas are stored as one structured-dtype component; SoA schemas store each
+        field as a hidden "<name>.<field>" component next to a zero-width component
+        `name` that carries membership (for queries, sparse sets and change ticks).
+        `meta[name]` describes that membership storage; the record dtype of the
+        component's values is `schemas[name].dtype`.
+        """
+        columns = (
+            [schema.column(name, field) for field in schema.fields]
+            if schema.layout == "soa"
+            else []
+        )
+        for component in (name, *columns):
+            if component in self.components:
+                raise ValueError(f"Component '{component}' is already registered.")
+        if schema.layout == "aos" and self.page_size and not sparse:
+            raise ValueError(
+                "Dense AoS schemas need contiguous storage; use layout='soa' with paged storage"
+            )
+
+        if schema.layout == "aos":
+            self.register_component(
+                name, (), schema.dtype, sparse=sparse, track_changes=track_changes
+            )
+        else:
+            for field, column in zip(schema.fields, columns):
+                dtype, shape = schema.fields[field]
+                self.register_component(column, shape, dtype, sparse=sparse)
+            self.register_component(
+                name, (0,), np.bool_, sparse=sparse, track_changes=track_changes
+            )
+
+        self.schemas[name] = schema
+
+    def view(self, name: str) -> SchemaView:
+        """
+        Return named, zero-copy field views of a schema component.
+        """
+        if name not in self.schemas:
+            raise KeyError(f"Component '{name}' has no schema.")
+        return SchemaView(self, name)
+
+    def _allocate_dense(self, name: str, shape: tuple, dtype):
+        """
+        Allocate zeroed storage for a dense component (override for custom backends).
+        """
+        if self.page_size:
+            return PagedArray(self.max_entities, shape, dtype, self.page_size)
+        return np.zeros((self.max_entities, *shape), dtype=dtype)
+
+    def _reserve_sparse(self, name: str, extra: int):
+        """
+        Ensure a sparse component has room for `extra` more packed rows,
+        doubling its capacity as needed.
+        """
+        values = self.components[name]
+        count = self.sparse_counts[name]
+        needed = count + extra
+        if needed <= len(values):
+            return
+
+        capacity = max(len(values), 1)
+        while capacity < needed:
+            capacity *= 2
+        capacity = min(capacity, self.max_entities)
+
+        grown = np.zeros((capacity, *values.shape[1:]), dtype=values.dtype)
+        grown[:count] = values[:count]
+        self.components[name] = grown
+
+        owners = np.empty(capacity, dtype=np.uint32)
+        owners[:count] = self.sparse_owners[name][:count]
+        self.sparse_owners[name] = owners
+
+    def _sparse_remove(self, entity_id: int, name: str) -> bool:
+        """
+        Swap-remove an entity's packed row from a sparse component.
+        Returns False if the entity did not own the component.
+        """
+        index = self.sparse_index[name]
+        row = index[entity_id]
+        if row < 0:
+            return False
+
+        values = self.components[name]
+        owners = self.sparse_owners[name]
+        last = self.sparse_counts[name] - 1
+        if row != last:
+            values[row] = values[last]
+            owners[row] = owners[last]
+            index[owners[row]] = row
+        values[last] = 0  # optional: clear memory
+
+        index[entity_id] = -1
+        self.sparse_counts[name] = last
+        self.entity_masks[name][entity_id] = False
+        if name in self.changed_ticks:
+            self.changed_ticks[name][entity_id] = 0
+        return True
+
+    def _sparse_remove_many(self, entity_ids: np.ndarray, name: str):
+        """
+        Remove several unique entities from a sparse component at once. Holes left in
+        the surviving prefix are filled from the surviving tail rows, so the cost
+        scales with the number of removed rows rather than the number of owners.
+        """
+        index = self.sparse_index[name]
+        rows = index[entity_ids]
+        owned = rows >= 0
+        if not owned.any():
+            return
+        removed = entity_ids[owned]
+        rows = rows[owned]
 
-        # For sparse components, we need to track which entities actually use it
-        if sparse:
-            self.entity_masks[name] = set()
+        values = self.components[name]
+        owners = self.sparse_owners[name]
+        count = self.sparse_counts[name]
+        new_count = count - rows.size
+
+        holes = rows[rows < new_count]
+        removed_tail = np.zeros(count - new_count, dtype=np.bool_)
+        removed_tail[rows[rows >= new_count] - new_count] = True
+        tail = new_count + np.flatnonzero(~removed_tail)
+
+        values[holes] = values[tail]
+        owners[holes] = owners[tail]
+        index[owners[holes]] = holes
+        values[new_count:count] = 0  # optional: clear memory
+
+        index[removed] = -1
+        self.sparse_counts[name] = new_count
+        self.entity_masks[name][removed] = False
+        if name in self.changed_ticks:
+            self.changed_ticks[name][removed] = 0
 
     def add_component(self, entity_id: int, name: str, value):
         """
@@ -54,10 +254,128 @@ class ComponentManager:
         if name not in self.components:
             raise KeyError(f"Component '{name}' is not registered.")
 
-        self.components[name][entity_id] = value
+        schema = self.schemas.get(name)
+        if schema is not None:
+            value = schema.records(value)
+            if schema.layout == "soa":
+                for field in schema.fields:
+                    self.add_component(entity_id, schema.column(name, field), value[field])
+                value = np.empty(0, dtype=np.bool_)
+
+        if name in self.changed_ticks:
+            self.changed_ticks[name][entity_id] = self.tick
+
+        if not self.meta[name]["sparse"]:
+            self.components[name][entity_id] = value
+            return
+
+        row = self.sparse_index[name][entity_id]
+        if row >= 0:
+            self.components[name][row] = value
+            return
+
+        self._reserve_sparse(name, 1)
+        row = self.sparse_counts[name]
+        self.components[name][row] = value
+        self.sparse_owners[name][row] = entity_id
+        self.sparse_index[name][entity_id] = row
+        self.sparse_counts[name] = row + 1
+        self.entity_masks[name][entity_id] = True
+
+        for view in self._views_by_component.get(name, ()):
+            view.on_component_added(entity_id)
+
+    def add_components(self, entity_ids, name: str, values):
+        """
+        Assign a component to many entities with one broadcasted write.
+        `values` may be a single value (shared by all) or one value per entity.
+        For sparse components, new owners are appended to the packed set in one block.
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+
+        entity_ids = np.asarray(entity_ids, dtype=np.intp).ravel()
+
+        schema = self.schemas.get(name)
+        if schema is not None:
+            values = schema.records(values, len(entity_ids))
+            if schema.layout == "soa":
+                for field in schema.fields:
+                    self.add_components(entity_ids, schema.column(name, field), values[field])
+                values = np.empty((len(entity_ids), 0), dtype=np.bool_)
+
+        if name in self.changed_ticks:
+            self.changed_ticks[name][entity_ids] = self.tick
+
+        if not self.meta[name]["sparse"]:
+            self.components[name][entity_ids] = values
+            return
+
+        index = self.sparse_index[name]
+        rows = index[entity_ids].astype(np.intp)
+        new = rows < 0
+        new_ids = entity_ids[new]
+
+        if new_ids.size:
+            if np.unique(new_ids).size != new_ids.size:
+                raise ValueError(f"Duplicate entity IDs passed to add_components('{name}')")
 
+            self._reserve_sparse(name, new_ids.size)
+            start = self.sparse_counts[name]
+            stop = start + new_ids.size
+            rows[new] = np.arange(start, stop)
+            self.sparse_owners[name][start:stop] = new_ids
+            index[new_ids] = rows[new]
+            self.sparse_counts[name] = stop
+            self.entity_masks[name][new_ids] = True
+
+        self.components[name][rows] = values
+
+        if new_ids.size:
+            for view in self._views_by_component.get(name, ()):
+                view.on_components_added(new_ids)
+
+    def advance_tick(self) -> int:
+        """
+        Start a new change-tracking tick (typically once per frame) and return it.
+        """
+        self.tick += 1
+        return self.tick
+
+    def mark_changed(self, entity_ids, name: str):
+        """
+        Stamp entities as changed at the current tick after editing their component
+        data in place (e.g. through get_component_data or iter_pages).
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+        if name not in self.changed_ticks:
+            raise ValueError(f"Component '{name}' was not registered with track_changes=True")
+        self.changed_ticks[name][entity_ids] = self.tick
+
+    def query_changed(self, name: str, since_tick: int, alive_mask=None) -> np.ndarray:
+        """
+        Return IDs of entities whose component was written after `since_tick`.
+
+        A consumer typically remembers `cm.tick` after processing and passes it back the
+        next frame, so it should run after the producers of that tick. Sparse components
+        only scan their packed owners; dense components scan one uint32 per entity slot.
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+        if name not in self.changed_ticks:
+            raise ValueError(f"Component '{name}' was not registered with track_changes=True")
+
+        ticks = self.changed_ticks[name]
         if self.meta[name]["sparse"]:
-            self.entity_masks[name].add(entity_id)
+            owners = self.get_component_owners(name).astype(np.intp)
+            ids = np.sort(owners[ticks[owners] > since_tick])
+        else:
+            ids = np.flatnonzero(ticks > since_tick)
+
+        if alive_mask is not None:
+            ids = ids[alive_mask[ids]]
+        return ids
 
     def has_component(self, entity_id: int, name: str) -> bool:
         """
@@ -67,7 +385,7 @@ class ComponentManager:
             return False
 
         if self.meta[name]["sparse"]:
-            return entity_id in self.entity_masks[name]
+            return bool(self.entity_masks[name][entity_id])
         else:
             return True  # dense components always exist
 
@@ -81,48 +399,288 @@ class ComponentManager:
         if not self.meta[name]["sparse"]:
             raise ValueError(f"Cannot remove dense component '{name}'")
 
-        self.entity_masks[name].discard(entity_id)
-        self.components[name][entity_id] = 0  # optional: reset value
+        for column in self._schema_columns(name):
+            self._sparse_remove(entity_id, column)
+
+        if not self._sparse_remove(entity_id, name):
+            return
+
+        for view in self._views_by_component.get(name, ()):
+            view.on_component_removed(entity_id)
+
+    def remove_components(self, entity_ids, name: str):
+        """
+        Remove a sparse component from many entities in one vectorized pass.
+        Entities that do not hold the component are ignored.
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+
+        if not self.meta[name]["sparse"]:
+            raise ValueError(f"Cannot remove dense component '{name}'")
+
+        entity_ids = np.unique(np.asarray(entity_ids, dtype=np.intp))
+        for column in self._schema_columns(name):
+            self._sparse_remove_many(entity_ids, column)
+        self._sparse_remove_many(entity_ids, name)
+
+        for view in self._views_by_component.get(name, ()):
+            view.on_components_removed(entity_ids)
+
+    def _schema_columns(self, name: str) -> list:
+        """Hidden field components of an SoA schema component (empty otherwise)."""
+        schema = self.schemas.get(name)
+        if schema is None or schema.layout != "soa":
+            return []
+        return [schema.column(name, field) for field in schema.fields]
+
+    def get_component(self, entity_id: int, name: str) -> np.ndarray:
+        """
+        Return a view of one entity's component value.
+        For SoA schema components this is a record assembled from the field columns (a copy).
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+
+        schema = self.schemas.get(name)
+        if schema is not None and schema.layout == "soa":
+            if not self.has_component(entity_id, name):
+                raise KeyError(f"Entity {entity_id} has no component '{name}'.")
+            record = np.zeros((), dtype=schema.dtype)
+            for field in schema.fields:
+                record[field] = self.get_component(entity_id, schema.column(name, field))
+            return record
+
+        if not self.meta[name]["sparse"]:
+            return self.components[name][entity_id]
+
+        row = self.sparse_index[name][entity_id]
+        if row < 0:
+            raise KeyError(f"Entity {entity_id} has no component '{name}'.")
+        return self.components[name][row]
 
     def get_component_data(self, name: str) -> np.ndarray:
         """
-        Access the full component array for direct manipulation or slicing.
+        Access the component array for direct manipulation or slicing.
+        Dense components return the full per-entity array; sparse components return
+        the packed live rows (see get_component_owners for the matching entity IDs).
         """
         if name not in self.components:
             raise KeyError(f"Component '{name}' is not registered.")
+
+        if self.meta[name]["sparse"]:
+            return self.components[name][:self.sparse_counts[name]]
         return self.components[name]
 
-    def query_entities_with(self, component_names: list[str]) -> set[int]:
+    def get_component_owners(self, name: str) -> np.ndarray:
         """
-        Return a set of entity IDs that have all of the specified components.
-        Used for system queries.
+        Return the entity ID of each packed row of a sparse component.
         """
-        if not component_names:
-            return set()
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+        if not self.meta[name]["sparse"]:
+            raise ValueError(f"Component '{name}' is dense and has no owner array")
+        return self.sparse_owners[name][:self.sparse_counts[name]]
 
-        # Start with all entity IDs if the first is dense
-        first = component_names[0]
-        if not self.meta[first]["sparse"]:
-            candidate_set = set(range(self.max_entities))
-        else:
-            candidate_set = set(self.entity_masks[first])
+    def component_rows(self, name: str, entity_ids) -> np.ndarray:
+        """
+        Translate entity IDs into row indices of get_component_data(name).
+        Dense rows are the IDs themselves; sparse rows come from the sparse index.
+        """
+        if name not in self.components:
+            raise KeyError(f"Component '{name}' is not registered.")
+        if self.meta[name]["sparse"]:
+            return self.sparse_index[name][entity_ids]
+        return np.asarray(entity_ids)
+
+    def iter_pages(self, name: str, page_size: int | None = None):
+        """
+        Yield (start, stop, view) blocks covering a component's storage.
+        Paged dense components yield their allocated pages; contiguous dense arrays and
+        packed sparse arrays are split into blocks of `page_size` rows (default: one block).
+        For dense components start/stop are entity IDs; for sparse ones they are packed rows.
+        """
+        data = self.get_component_data(name)
+        if isinstance(data, PagedArray):
+            yield from data.iter_pages()
+            return
+
+        step = page_size or max(len(data), 1)
+        for start in range(0, len(data), step):
+            stop = min(start + step, len(data))
+            yield start, stop, data[start:stop]
 
-        # Intersect with the other components
-        for name in component_names[1:]:
+    def query_mask(self, component_names: list[str], alive_mask=None) -> np.ndarray:
+        """
+        Return a boolean mask over all entity slots that hold every specified component.
+        If alive_mask (e.g. EntityManager.alive_mask) is given, it is ANDed in as well.
+        """
+        for name in component_names:
             if name not in self.components:
                 raise KeyError(f"Component '{name}' is not registered.")
+
+        if alive_mask is not None:
+            mask = np.array(alive_mask, dtype=np.bool_, copy=True)
+        else:
+            mask = np.ones(self.max_entities, dtype=np.bool_)
+
+        # Dense components are assumed to exist for all entities
+        for name in component_names:
             if self.meta[name]["sparse"]:
-                candidate_set &= self.entity_masks[name]
-            # Dense components are assumed to exist for all entities
+                np.logical_and(mask, self.entity_masks[name], out=mask)
 
-        return candidate_set
+        return mask
+
+    def query_entities_with(self, component_names: list[str], alive_mask=None) -> np.ndarray:
+        """
+        Return a contiguous array of entity IDs that have all of the specified components,
+        suitable for fancy-indexing component arrays directly. Used for system queries.
+        """
+        if not component_names:
+            return np.empty(0, dtype=np.intp)
+
+        return np.flatnonzero(self.query_mask(component_names, alive_mask))
 
     def cleanup_entity(self, entity_id: int):
         """
-        Remove all sparse components associated with a deleted or recycled entity.
-        This should be called whenever an entity is destroyed.
+        Remove all sparse components associated with a deleted or recycled entity and
+        clear its change ticks. This should be called whenever an entity is destroyed.
         """
         for name, meta in self.meta.items():
             if meta["sparse"]:
-                self.entity_masks[name].discard(entity_id)
-                self.components[name][entity_id] = 0  # optional: clear memory
+                self._sparse_remove(entity_id, name)
+        for ticks in self.changed_ticks.values():
+            ticks[entity_id] = 0
+
+        for view in self.queries.values():
+            if view.sparse_names:
+                view.on_component_removed(entity_id)
+
+    def cleanup_entities(self, entity_ids):
+        """
+        Bulk version of cleanup_entity: remove all sparse components of several
+        deleted entities with one vectorized pass per component.
+        Pair with EntityManager.destroy_entities.
+        """
+        entity_ids = np.unique(np.asarray(entity_ids, dtype=np.intp))
+        if not entity_ids.size:
+            return
+
+        for name, meta in self.meta.items():
+            if meta["sparse"]:
+                self._sparse_remove_many(entity_ids, name)
+        for ticks in self.changed_ticks.values():
+            ticks[entity_ids] = 0
+
+        for view in self.queries.values():
+            if view.sparse_names:
+                view.on_components_removed(entity_ids)
+
+    def compact(self, remap):
+        """
+        Apply an entity remap table (from EntityManager.compact) to all component storage.
+        Each dense array is rewritten with one permutation so live rows occupy
+        [:live_count]; sparse sets have their owners renumbered, rows of dead entities
+        dropped, and packed rows re-sorted by owner. Change ticks move with their
+        entities. Views not bound to an EntityManager
+        are remapped here (bound ones are remapped by the EntityManager).
+        """
+        remap = np.asarray(remap, dtype=np.intp)
+        old_ids = np.flatnonzero(remap >= 0)
+        live_count = old_ids.size
+        order = np.empty(live_count, dtype=np.intp)
+        order[remap[old_ids]] = old_ids
+
+        for name, meta in self.meta.items():
+            if meta["sparse"]:
+                continue
+            data = self.components[name]
+            data[:live_count] = data[order]
+            if isinstance(data, PagedArray):
+                data[np.arange(live_count, data.capacity)] = 0
+            else:
+                data[live_count:] = 0
+
+        for name, meta in self.meta.items():
+            if not meta["sparse"]:
+                continue
+            owners = self.get_component_owners(name)
+            self._sparse_remove_many(owners[remap[owners] < 0].astype(np.intp), name)
+
+            count = self.sparse_counts[name]
+            new_owners = remap[self.sparse_owners[name][:count]]
+            by_owner = np.argsort(new_owners, kind="stable")
+            values = self.components[name]
+            values[:count] = values[by_owner]
+            self.sparse_owners[name][:count] = new_owners[by_owner]
+
+            index = self.sparse_index[name]
+            index.fill(-1)
+            index[new_owners[by_owner]] = np.arange(count)
+            mask = self.entity_masks[name]
+            mask.fill(False)
+            mask[new_owners] = True
+
+        for ticks in self.changed_ticks.values():
+            ticks[:live_count] = ticks[order]
+            ticks[live_count:] = 0
+
+        for view in self.queries.values():
+            if view.em is None:
+                view.on_entities_remapped(remap)
+
+    def register_query(self, component_names: list[str], em=None) -> QueryView:
+        """
+        Register a persistent query and return its QueryView. The view's `ids` are kept
+        up to date by add_component, remove_component, cleanup_entity and, if an
+        EntityManager is given, by entity creation/destruction.
+        Registering the same query twice returns the existing view.
+        """
+        for name in component_names:
+            if name not in self.components:
+                raise KeyError(f"Component '{name}' is not registered.")
+
+        key = (tuple(component_names), em)
+        view = self.queries.get(key)
+        if view is not None:
+            return view
+
+        view = QueryView(self, component_names, em=em)
+        self.queries[key] = view
+        for name in view.sparse_names:
+            self._views_by_component.setdefault(name, []).append(view)
+        if em is not None:
+            em.add_observer(view)
+        return view
+
+    def unregister_query(self, view: QueryView):
+        """
+        Stop maintaining a view previously returned by register_query.
+        """
+        key = (view.component_names, view.em)
+        if self.queries.pop(key, None) is None:
+            return
+
+        for name in view.sparse_names:
+            self._views_by_component[name].remove(view)
+        if view.em is not None:
+            view.em.remove_observer(view)
+
+
+def create_component_manager(
+    max_entities: int, storage: str = "soa", page_size: int = DEFAULT_PAGE_SIZE
+):
+    """
+    Construct component storage for the requested mode.
+
+    'soa' returns the default ComponentManager (one array per component);
+    'paged' returns a ComponentManager whose dense components grow page by page;
+    'archetype' returns an ArchetypeComponentManager (one SoA table per signature).
+    """
+    if storage == "soa":
+        return ComponentManager(max_entities)
+    if storage == "paged":
+        return ComponentManager(max_entities, page_size=page_size)
+    if storage == "archetype":
+        return ArchetypeComponentManager(max_entities)
+    raise ValueError(f"Unknown storage mode '{storage}', expected one of {STORAGE_MODES}")
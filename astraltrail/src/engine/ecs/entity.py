@@ -7,11 +7,54 @@ using a fixed-capacity freelist allocator backed by NumPy.
 
 This module forms the foundation of a data-oriented ECS (Entity-Component-System),
 enabling scalable real-time entity management with predictable memory use.
+
+Entity references that outlive a frame should be stored as generational handles:
+a uint64 packing the slot index (low 32 bits) with the slot's generation (high
+32 bits). Destroying an entity bumps its slot generation, so handles to a
+recycled slot can be detected in bulk with EntityManager.validate().
 """
 
 import numpy as np
 from numpy.typing import NDArray
 
+HANDLE_INDEX_BITS = 32
+HANDLE_INDEX_MASK = np.uint64((1 << HANDLE_INDEX_BITS) - 1)
+
+# A handle that never validates; useful as a fill value for reference components
+NULL_HANDLE = np.uint64(0xFFFF_FFFF_FFFF_FFFF)
+
+
+def pack_handles(indices, generations) -> NDArray[np.uint64]:
+    """
+    Pack slot indices and generations into 64-bit entity handles.
+
+    Args:
+        indices (array-like): Entity slot indices.
+        generations (array-like): Generation of each slot.
+
+    Returns:
+        NDArray[np.uint64]: The packed handles.
+    """
+    indices = np.asarray(indices).astype(np.uint64)
+    generations = np.asarray(generations).astype(np.uint64)
+    return (generations << np.uint64(HANDLE_INDEX_BITS)) | indices
+
+
+def unpack_handles(handles) -> tuple[NDArray[np.uint32], NDArray[np.uint32]]:
+    """
+    Split 64-bit entity handles into slot indices and generations.
+
+    Args:
+        handles (array-like): Packed handles.
+
+    Returns:
+        tuple: (indices, generations) as uint32 arrays.
+    """
+    handles = np.asarray(handles, dtype=np.uint64)
+    indices = (handles & HANDLE_INDEX_MASK).astype(np.uint32)
+    generations = (handles >> np.uint64(HANDLE_INDEX_BITS)).astype(np.uint32)
+    return indices, generations
+
 
 class EntityManager:
     """
@@ -26,6 +69,8 @@ class EntityManager:
         free_ids (NDArray[np.uint32]): Stack of recycled entity IDs.
         free_count (int): Number of available IDs in the freelist.
         alive_mask (NDArray[np.bool_]): Boolean mask indicating alive entity status.
+        generations (NDArray[np.uint32]): Per-slot counter bumped whenever a slot is freed.
+        observers (list): Objects notified of entity lifecycle events (e.g. QueryView).
     """
 
     def __init__(self, max_entities: int = 1_000_000) -> None:
@@ -40,6 +85,31 @@ class EntityManager:
         self.free_ids: NDArray[np.uint32] = np.empty(max_entities, dtype=np.uint32)
         self.free_count: int = 0
         self.alive_mask: NDArray[np.bool_] = np.zeros(max_entities, dtype=np.bool_)
+        self.generations: NDArray[np.uint32] = np.zeros(max_entities, dtype=np.uint32)
+        self.observers: list = []
+
+    def add_observer(self, observer) -> None:
+        """
+        Subscribe an object to entity lifecycle events.
+
+        The observer must implement `on_entity_created(eid)`,
+        `on_entity_destroyed(eid)`, their bulk counterparts
+        `on_entities_created(ids)` / `on_entities_destroyed(ids)`,
+        `on_entities_remapped(remap)` and `on_reset()`.
+
+        Args:
+            observer: The object to notify.
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer) -> None:
+        """
+        Unsubscribe an observer previously passed to add_observer.
+
+        Args:
+            observer: The object to stop notifying.
+        """
+        self.observers.remove(observer)
 
     def create_entity(self) -> int:
         """
@@ -61,6 +131,8 @@ class EntityManager:
             raise RuntimeError("Entity limit reached")
 
         self.alive_mask[eid] = True
+        for observer in self.observers:
+            observer.on_entity_created(eid)
         return eid
 
     def destroy_entity(self, eid: int) -> None:
@@ -76,8 +148,77 @@ class EntityManager:
         if not self.is_alive(eid):
             raise ValueError(f"Entity {eid} is not alive")
         self.alive_mask[eid] = False
+        self.generations[eid] += 1
         self.free_ids[self.free_count] = eid
         self.free_count += 1
+        for observer in self.observers:
+            observer.on_entity_destroyed(eid)
+
+    def create_entities(self, n: int) -> NDArray[np.intp]:
+        """
+        Create `n` entities in one vectorized operation.
+
+        Recycled IDs are popped from the top of the freelist first (in the same
+        order repeated create_entity calls would return them), then fresh IDs
+        are taken from next_id.
+
+        Args:
+            n (int): Number of entities to create.
+
+        Returns:
+            NDArray[np.intp]: The entity IDs assigned.
+
+        Raises:
+            RuntimeError: If fewer than `n` IDs are available. No entities are
+                created in that case.
+        """
+        if n < 0:
+            raise ValueError("Cannot create a negative number of entities")
+        if n > self.free_count + (self.max_entities - self.next_id):
+            raise RuntimeError("Entity limit reached")
+
+        recycled = min(n, self.free_count)
+        fresh = n - recycled
+
+        ids = np.empty(n, dtype=np.intp)
+        ids[:recycled] = self.free_ids[self.free_count - recycled:self.free_count][::-1]
+        ids[recycled:] = np.arange(self.next_id, self.next_id + fresh)
+        self.free_count -= recycled
+        self.next_id += fresh
+
+        self.alive_mask[ids] = True
+        for observer in self.observers:
+            observer.on_entities_created(ids)
+        return ids
+
+    def destroy_entities(self, eids) -> None:
+        """
+        Destroy several entities at once and push their IDs onto the freelist.
+
+        Args:
+            eids (array-like): The IDs of the entities to destroy.
+
+        Raises:
+            ValueError: If any ID is invalid, not alive, or repeated. No entities
+                are destroyed in that case.
+        """
+        eids = np.asarray(eids, dtype=np.intp).ravel()
+        n = eids.size
+        if n == 0:
+            return
+        if eids.min() < 0 or eids.max() >= self.max_entities:
+            raise ValueError("Entity ID out of range")
+        if not self.alive_mask[eids].all():
+            raise ValueError("Cannot destroy entities that are not alive")
+        if np.unique(eids).size != n:
+            raise ValueError("Duplicate entity IDs passed to destroy_entities")
+
+        self.alive_mask[eids] = False
+        self.generations[eids] += 1
+        self.free_ids[self.free_count:self.free_count + n] = eids
+        self.free_count += n
+        for observer in self.observers:
+            observer.on_entities_destroyed(eids)
 
     def is_alive(self, eid: int) -> bool:
         """
@@ -91,13 +232,128 @@ class EntityManager:
         """
         return bool(self.alive_mask[eid])
 
+    def handle(self, eid: int) -> int:
+        """
+        Return the generational handle of a live entity.
+
+        Args:
+            eid (int): The entity ID.
+
+        Returns:
+            int: The packed 64-bit handle (generation << 32 | eid).
+        """
+        return (int(self.generations[eid]) << HANDLE_INDEX_BITS) | int(eid)
+
+    def handles(self, eids) -> NDArray[np.uint64]:
+        """
+        Return the generational handles of several entities.
+
+        Args:
+            eids (array-like): Entity IDs.
+
+        Returns:
+            NDArray[np.uint64]: One packed handle per ID.
+        """
+        eids = np.asarray(eids, dtype=np.intp)
+        return pack_handles(eids, self.generations[eids])
+
+    def validate(self, handles) -> NDArray[np.bool_]:
+        """
+        Check a whole array of handles for staleness in one vectorized pass.
+
+        A handle is valid if its index is in range, the slot is alive, and the
+        slot's generation still matches the one stored in the handle.
+
+        Args:
+            handles (array-like): Packed uint64 handles.
+
+        Returns:
+            NDArray[np.bool_]: True where the handle still refers to its entity.
+        """
+        indices, generations = unpack_handles(handles)
+        in_range = indices < self.max_entities
+        slots = np.where(in_range, indices, 0).astype(np.intp)
+        return in_range & self.alive_mask[slots] & (self.generations[slots] == generations)
+
+    def resolve(self, handles) -> NDArray[np.intp]:
+        """
+        Convert handles back into entity IDs, mapping stale handles to -1.
+
+        Args:
+            handles (array-like): Packed uint64 handles.
+
+        Returns:
+            NDArray[np.intp]: Entity IDs, or -1 where the handle is stale.
+        """
+        indices, _ = unpack_handles(handles)
+        return np.where(self.validate(handles), indices.astype(np.intp), -1)
+
+    def is_valid(self, handle: int) -> bool:
+        """
+        Check whether a single handle still refers to a live entity.
+
+        Args:
+            handle (int): A packed handle.
+
+        Returns:
+            bool: True if the handle is still valid.
+        """
+        return bool(self.validate(np.uint64(handle)))
+
+    @property
+    def live_count(self) -> int:
+        """Number of entities currently alive."""
+        return self.next_id - self.free_count
+
+    def compact(self) -> NDArray[np.intp]:
+        """
+        Move all live entities into the contiguous prefix [0, live_count).
+
+        Relative order of live entities is preserved. Afterwards next_id equals
+        live_count and the freelist is empty, so dense systems can slice
+        `[:live_count]` instead of masking. Generations of every slot whose
+        occupant changed are bumped, so handles taken before compaction become
+        stale; rebuild them with `handles(remap[old_ids])`.
+
+        Pass the returned table to ComponentManager.compact() to move component
+        data along with the IDs.
+
+        Returns:
+            NDArray[np.intp]: Remap table of length max_entities mapping each old
+            ID to its new ID, or -1 for slots that were not alive.
+        """
+        live = np.flatnonzero(self.alive_mask)
+        n = live.size
+
+        remap = np.full(self.max_entities, -1, dtype=np.intp)
+        remap[live] = np.arange(n)
+
+        moved = live != np.arange(n)
+        touched = np.zeros(self.max_entities, dtype=np.bool_)
+        touched[live[moved]] = True
+        touched[np.flatnonzero(moved)] = True
+        self.generations[touched] += 1
+
+        self.alive_mask.fill(False)
+        self.alive_mask[:n] = True
+        self.next_id = n
+        self.free_count = 0
+
+        for observer in self.observers:
+            observer.on_entities_remapped(remap)
+        return remap
+
     def reset(self) -> None:
         """
         Reset the EntityManager to its initial state.
 
         All entity IDs are invalidated, and all counters are cleared.
-        This is useful for restarting a simulation or scene.
+        Generations of previously used slots are bumped so outstanding
+        handles become stale. This is useful for restarting a simulation or scene.
         """
+        self.generations[:self.next_id] += 1
         self.next_id = 0
         self.free_count = 0
         self.alive_mask.fill(False)
+        for observer in self.observers:
+            observer.on_reset()
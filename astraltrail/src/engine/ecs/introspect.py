@@ -0,0 +1,174 @@
+"""
+introspect.py
+
+Memory accounting and live statistics for the ECS, as plain dicts that can be
+polled at runtime (e.g. by a debug HUD) or dumped as JSON.
+
+    report = memory_report(em, cm)
+    report["components"]["Position"]["occupancy"]
+    report["top_consumers"][:3]
+    dump_json(report, "ecs_memory.json")
+
+Component byte counts include bookkeeping: sparse components count their owner
+array, sparse index and entity mask, and change-tracked components their tick
+array. Dense components are counted by allocated storage (the full
+`max_entities` rows, or only the allocated pages with paged storage).
+
+SoA schema components are reported once under the schema name: the hidden
+"<name>.<field>" columns are rolled up into that entry (listed per column under
+"columns") and never appear as separate components or top consumers.
+"""
+
+import json
+
+import numpy as np
+
+from .archetype import ArchetypeComponentManager
+from .paged import PagedArray
+
+
+def _nbytes(array) -> int:
+    return 0 if array is None else int(array.nbytes)
+
+
+def _storage_stats(cm, em, name: str) -> dict:
+    """Statistics of one registered component's storage."""
+    meta = cm.meta[name]
+    data = cm.components[name]
+    overhead = _nbytes(cm.changed_ticks.get(name))
+
+    if meta["sparse"]:
+        storage = "sparse"
+        rows = len(data)
+        live = owners = int(cm.sparse_counts[name])
+        overhead += (
+            _nbytes(cm.sparse_owners[name])
+            + _nbytes(cm.sparse_index[name])
+            + _nbytes(cm.entity_masks[name])
+        )
+    else:
+        storage = "paged" if isinstance(data, PagedArray) else "dense"
+        rows = data.capacity if isinstance(data, PagedArray) else len(data)
+        live = min(em.live_count if em is not None else cm.max_entities, rows)
+        owners = None
+
+    data_nbytes = _nbytes(data)
+    return {
+        "storage": storage,
+        "shape": list(meta["shape"]),
+        "dtype": str(np.dtype(meta["dtype"])),
+        "nbytes": data_nbytes + overhead,
+        "data_nbytes": data_nbytes,
+        "overhead_nbytes": overhead,
+        "rows": int(rows),
+        "live_rows": int(live),
+        "live_rows_exact": owners is not None,
+        "occupancy": live / rows if rows else 0.0,
+        "owners": owners,
+    }
+
+
+def component_stats(cm, em=None) -> dict:
+    """
+    Return per-component statistics.
+
+    Args:
+        cm (ComponentManager): Manager to inspect.
+        em (EntityManager): Optional; used to estimate live rows of dense components
+            (without it, every slot counts as live).
+
+    Returns:
+        dict: {name: {"storage", "shape", "dtype", "nbytes", "data_nbytes",
+        "overhead_nbytes", "rows", "live_rows", "live_rows_exact", "occupancy",
+        "owners"}}. "owners" is None for dense components. Dense components do not
+        track ownership, so their "live_rows" is the number of live entities (an
+        upper bound) and "live_rows_exact" is False. SoA schema entries also carry
+        "columns": {column_name: stats} and include the columns' bytes.
+
+    Raises:
+        TypeError: For archetype storage, which has no per-component arrays.
+    """
+    if isinstance(cm, ArchetypeComponentManager):
+        raise TypeError("Memory introspection does not support archetype storage")
+    schemas = getattr(cm, "schemas", {})
+    hidden = {
+        name: [schema.column(name, field) for field in schema.fields]
+        for name, schema in schemas.items()
+        if schema.layout == "soa"
+    }
+    columns_of = {column: name for name, columns in hidden.items() for column in columns}
+
+    stats = {}
+    for name in cm.meta:
+        if name in columns_of:
+            continue
+        entry = _storage_stats(cm, em, name)
+        if name in hidden:
+            columns = {column: _storage_stats(cm, em, column) for column in hidden[name]}
+            for key in ("nbytes", "data_nbytes", "overhead_nbytes"):
+                entry[key] += sum(column[key] for column in columns.values())
+            entry["shape"] = []
+            entry["dtype"] = str(schemas[name].dtype)
+            entry["columns"] = columns
+        stats[name] = entry
+    return stats
+
+
+def entity_stats(em) -> dict:
+    """
+    Return EntityManager statistics.
+
+    "fragmentation" is the fraction of IDs below the high-water mark (`next_id`)
+    that are dead holes; 0.0 means live entities occupy a contiguous prefix.
+    """
+    holes = em.next_id - em.live_count
+    return {
+        "max_entities": em.max_entities,
+        "next_id": em.next_id,
+        "live": em.live_count,
+        "free_list_depth": em.free_count,
+        "fragmentation": holes / em.next_id if em.next_id else 0.0,
+        "nbytes": _nbytes(em.free_ids) + _nbytes(em.alive_mask) + _nbytes(em.generations),
+    }
+
+
+def memory_report(em, cm, top: int = 10) -> dict:
+    """
+    Return entity and component statistics with totals and the largest consumers.
+
+    Returns:
+        dict: {"entities", "components", "total_nbytes",
+        "top_consumers": [{"name", "nbytes", "share"}, ...]} with at most `top`
+        consumers, largest first. The EntityManager is listed as "<entities>".
+    """
+    components = component_stats(cm, em)
+    entities = entity_stats(em)
+
+    consumers = [("<entities>", entities["nbytes"])]
+    consumers += [(name, stats["nbytes"]) for name, stats in components.items()]
+    consumers.sort(key=lambda item: item[1], reverse=True)
+    total = sum(nbytes for _, nbytes in consumers)
+
+    return {
+        "entities": entities,
+        "components": components,
+        "total_nbytes": total,
+        "top_consumers": [
+            {"name": name, "nbytes": nbytes, "share": nbytes / total if total else 0.0}
+            for name, nbytes in consumers[:top]
+        ],
+    }
+
+
+def dump_json(report: dict, path=None, indent: int = 2) -> str:
+    """
+    Serialize a report to JSON, writing it to `path` if given.
+
+    Returns:
+        str: The JSON text.
+    """
+    text = json.dumps(report, indent=indent)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
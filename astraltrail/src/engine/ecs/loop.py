@@ -0,0 +1,140 @@
+"""
+loop.py
+
+Provides FixedStepLoop, an engine-level main loop around SystemManager that
+decouples simulation from render rate.
+
+Real frame time is added to an accumulator and consumed in fixed `step` slices,
+each running the simulation phases with `dt = step`, so results do not depend on
+the frame rate. Catch-up is capped at `max_steps` per frame; time beyond that is
+dropped (and counted) instead of making the next frame even slower. After
+simulating, the render phase runs once with the interpolation alpha
+(accumulator / step, in [0, 1)) passed as its `dt`, for blending between the
+previous and current simulation states.
+
+Usage with pyglet:
+    loop = FixedStepLoop(sm, cm, em, step=1 / 60)
+    pyglet.clock.schedule_interval(loop.advance, 1 / fps)
+
+Headless (tests, servers, replays):
+    loop.run_headless(600)  # 600 simulation steps, no render phase
+"""
+
+import time
+
+
+class FixedStepLoop:
+    """
+    Fixed-timestep driver for a SystemManager.
+
+    Attributes:
+        sm (SystemManager): Systems to run.
+        cm (ComponentManager): Component manager passed to systems.
+        em (EntityManager): Entity manager passed to systems.
+        step (float): Simulation timestep, in seconds.
+        max_steps (int): Maximum simulation steps per frame.
+        sim_phases (tuple[str]): Phases run, in order, on every simulation step.
+        render_phase (str | None): Phase run once per frame with the alpha as dt.
+        accumulator (float): Unsimulated time carried to the next frame.
+        alpha (float): Interpolation factor of the last frame.
+        sim_time (float): Total simulated time.
+        steps (int): Total simulation steps run.
+        frames (int): Total frames advanced.
+        dropped_time (float): Real time discarded by the catch-up cap.
+    """
+
+    def __init__(
+        self,
+        sm,
+        cm,
+        em,
+        step: float = 1 / 60,
+        max_steps: int = 5,
+        sim_phases=("pre", "update", "post"),
+        render_phase: str | None = "render",
+        clock=time.perf_counter,
+    ) -> None:
+        if step <= 0:
+            raise ValueError("step must be positive")
+        if max_steps < 1:
+            raise ValueError("max_steps must be at least 1")
+
+        self.sm = sm
+        self.cm = cm
+        self.em = em
+        self.step: float = step
+        self.max_steps: int = max_steps
+        self.sim_phases: tuple = tuple(sim_phases)
+        self.render_phase = render_phase
+        self.clock = clock
+
+        self.accumulator: float = 0.0
+        self.alpha: float = 0.0
+        self.sim_time: float = 0.0
+        self.steps: int = 0
+        self.frames: int = 0
+        self.dropped_time: float = 0.0
+        self._last_time = None
+
+    def simulate_step(self) -> None:
+        """
+        Run every simulation phase once with `dt = step`.
+        """
+        self.sm.begin_step()
+        for phase in self.sim_phases:
+            self.sm.update(self.cm, self.em, self.step, phase=phase)
+        self.sim_time += self.step
+        self.steps += 1
+
+    def advance(self, frame_time: float, render: bool = True) -> int:
+        """
+        Advance the loop by `frame_time` seconds of real time.
+
+        Args:
+            frame_time (float): Real time elapsed since the previous frame.
+            render (bool): Whether to run the render phase afterwards.
+
+        Returns:
+            int: Number of simulation steps run this frame.
+        """
+        self.sm.begin_frame()
+        self.accumulator += max(frame_time, 0.0)
+
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.simulate_step()
+            self.accumulator -= self.step
+            steps += 1
+
+        if self.accumulator >= self.step:
+            remainder = self.accumulator % self.step
+            self.dropped_time += self.accumulator - remainder
+            self.accumulator = remainder
+
+        self.alpha = self.accumulator / self.step
+        if render and self.render_phase is not None:
+            self.sm.update(self.cm, self.em, self.alpha, phase=self.render_phase)
+
+        self.sm.end_frame()
+        self.frames += 1
+        return steps
+
+    def tick(self, render: bool = True) -> int:
+        """
+        Advance by the real time measured on `clock` since the previous tick().
+        The first call only starts the clock.
+        """
+        now = self.clock()
+        frame_time = 0.0 if self._last_time is None else now - self._last_time
+        self._last_time = now
+        return self.advance(frame_time, render=render)
+
+    def run_headless(self, steps: int) -> None:
+        """
+        Run exactly `steps` simulation steps as fast as possible, without rendering.
+        """
+        for _ in range(steps):
+            self.sm.begin_frame()
+            self.simulate_step()
+            self.sm.end_frame()
+            self.frames += 1
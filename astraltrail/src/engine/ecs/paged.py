@@ -0,0 +1,232 @@
+"""
+paged.py
+
+Provides PagedArray, a row-addressable array stored as a list of fixed-size pages.
+Pages are allocated on demand the first time a row inside them is touched and are
+never moved or reallocated afterwards, so capacity can start at zero and grow
+without copy spikes, and views into a page stay valid for the array's lifetime.
+
+PagedArray supports the indexing patterns ECS code uses on component arrays
+(integer rows, slices, integer/boolean index arrays, and `arr[ids] += x`), so it can
+stand in for a dense component ndarray. Whole-array access is page by page through
+iter_pages().
+
+Reads never allocate. A row in an unallocated page reads from a shared read-only
+zero page, so writing through it raises; assign with `arr[i] = value` first.
+
+Unlike an ndarray, only single-row reads and slices that fall inside one allocated
+page return views. Slices that cross a page boundary, slices over unallocated
+pages and index-array reads return COPIES: writes through them are silently lost.
+Write with `arr[key] = value` or `arr[key] += x` (both go through __setitem__), or
+work on the page views from iter_pages().
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_PAGE_SIZE = 4096
+
+
+class PagedArray:
+    """
+    A logical array of `max_rows` rows backed by lazily allocated pages.
+
+    Attributes:
+        page_size (int): Rows per page.
+        max_rows (int): Logical length; rows beyond it cannot be addressed.
+        row_shape (tuple): Shape of a single row.
+        dtype (np.dtype): Element type.
+        pages (list[np.ndarray]): Allocated pages, in row order.
+    """
+
+    def __init__(
+        self,
+        max_rows: int,
+        row_shape: tuple = (),
+        dtype=np.float32,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        self.page_size: int = page_size
+        self.max_rows: int = max_rows
+        self.row_shape: tuple = tuple(row_shape)
+        self.dtype = np.dtype(dtype)
+        self.pages: list = []
+        self._zero_page = None
+
+    # --- array-like properties ---
+
+    @property
+    def shape(self) -> tuple:
+        return (self.max_rows, *self.row_shape)
+
+    @property
+    def ndim(self) -> int:
+        return 1 + len(self.row_shape)
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows currently backed by allocated pages."""
+        return min(len(self.pages) * self.page_size, self.max_rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by allocated pages."""
+        return sum(page.nbytes for page in self.pages)
+
+    def __len__(self) -> int:
+        return self.max_rows
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.to_array() if dtype is None else self.to_array().astype(dtype)
+
+    # --- page management ---
+
+    def grow_to(self, rows: int) -> None:
+        """
+        Allocate pages until at least `rows` rows are backed. Existing pages are untouched.
+        """
+        if rows > self.max_rows:
+            raise IndexError(f"Row {rows - 1} is out of range for {self.max_rows} rows")
+        while len(self.pages) * self.page_size < rows:
+            self.pages.append(np.zeros((self.page_size, *self.row_shape), dtype=self.dtype))
+
+    def iter_pages(self):
+        """
+        Yield (start, stop, page_view) for every allocated page, in row order.
+        `page_view` is a zero-copy view that stays valid as the array grows.
+        """
+        for number, page in enumerate(self.pages):
+            start = number * self.page_size
+            stop = min(start + self.page_size, self.max_rows)
+            yield start, stop, page[: stop - start]
+
+    def to_array(self) -> np.ndarray:
+        """Materialize the full logical array as one contiguous copy."""
+        out = np.zeros(self.shape, dtype=self.dtype)
+        for start, stop, page in self.iter_pages():
+            out[start:stop] = page
+        return out
+
+    def fill(self, value) -> None:
+        """Set every allocated row to `value`. Unallocated rows already read as zero."""
+        for page in self.pages:
+            page[...] = value
+
+    # --- indexing ---
+
+    def _locate(self, index: int, allocate: bool = True) -> tuple[np.ndarray, int]:
+        """
+        Return (page, offset) for a single row. Allocates the row's page if needed,
+        unless `allocate` is False, in which case the shared read-only zero page is
+        returned for unallocated rows.
+        """
+        index = int(index)
+        if index < 0:
+            index += self.max_rows
+        if not 0 <= index < self.max_rows:
+            raise IndexError(f"Row {index} is out of range for {self.max_rows} rows")
+        page, offset = divmod(index, self.page_size)
+        if page >= len(self.pages):
+            if not allocate:
+                return self._zeros(), offset
+            self.grow_to(index + 1)
+        return self.pages[page], offset
+
+    def _zeros(self) -> np.ndarray:
+        """The shared read-only zero page that unallocated rows read from."""
+        if self._zero_page is None:
+            self._zero_page = np.zeros((self.page_size, *self.row_shape), dtype=self.dtype)
+            self._zero_page.flags.writeable = False
+        return self._zero_page
+
+    def _rows(self, key) -> NDArray[np.intp]:
+        """Normalize a slice, index array or boolean mask into an array of row indices."""
+        if isinstance(key, slice):
+            return np.arange(*key.indices(self.max_rows))
+
+        key = np.asarray(key)
+        if key.dtype == np.bool_:
+            return np.flatnonzero(key)
+
+        rows = key.astype(np.intp).ravel()
+        rows = np.where(rows < 0, rows + self.max_rows, rows)
+        if rows.size and (rows.min() < 0 or rows.max() >= self.max_rows):
+            raise IndexError(f"Row index out of range for {self.max_rows} rows")
+        return rows
+
+    def _groups(self, rows: NDArray[np.intp]):
+        """Yield (page_number, selector) for each page touched by `rows`."""
+        page_numbers = rows // self.page_size
+        order = None
+        if page_numbers.size > 1 and np.any(page_numbers[1:] < page_numbers[:-1]):
+            order = np.argsort(page_numbers, kind="stable")
+            page_numbers = page_numbers[order]
+
+        bounds = np.flatnonzero(np.diff(page_numbers)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [page_numbers.size]))
+        for start, stop in zip(starts, stops):
+            selector = slice(start, stop) if order is None else order[start:stop]
+            yield int(page_numbers[start]), selector
+
+    def __getitem__(self, key):
+        """
+        Read rows without allocating. Returns a view for a single row or a slice within
+        one allocated page, and a copy otherwise (see the module docstring).
+        """
+        if isinstance(key, tuple):
+            first, rest = key[0], key[1:]
+            if isinstance(first, (int, np.integer)):
+                page, offset = self._locate(first, allocate=False)
+                return page[(offset, *rest)]
+            return self[first][(slice(None), *rest)]
+
+        if isinstance(key, (int, np.integer)):
+            page, offset = self._locate(key, allocate=False)
+            return page[offset]
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.max_rows)
+            page = start // self.page_size
+            if step == 1 and page < len(self.pages) and stop <= (page + 1) * self.page_size:
+                offset = page * self.page_size
+                return self.pages[page][start - offset : stop - offset]
+
+        rows = self._rows(key)
+        out = np.zeros((rows.size, *self.row_shape), dtype=self.dtype)
+        if not rows.size:
+            return out
+
+        for page, selector in self._groups(rows):
+            if page < len(self.pages):
+                out[selector] = self.pages[page][rows[selector] - page * self.page_size]
+        return out
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, tuple):
+            first, rest = key[0], key[1:]
+            if isinstance(first, (int, np.integer)):
+                page, offset = self._locate(first)
+                page[(offset, *rest)] = value
+                return
+            rows = self[first]
+            rows[(slice(None), *rest)] = value
+            self[first] = rows
+            return
+
+        if isinstance(key, (int, np.integer)):
+            page, offset = self._locate(key)
+            page[offset] = value
+            return
+
+        rows = self._rows(key)
+        if not rows.size:
+            return
+
+        self.grow_to(int(rows.max()) + 1)
+        values = np.broadcast_to(np.asarray(value, dtype=self.dtype), (rows.size, *self.row_shape))
+        for page, selector in self._groups(rows):
+            self.pages[page][rows[selector] - page * self.page_size] = values[selector]
@@ -0,0 +1,146 @@
+"""
+profiling.py
+
+Provides SystemProfiler, optional per-system instrumentation for SystemManager.
+
+When attached with `sm.enable_profiling()`, every system call records its wall
+time into per-system statistics (call count, total time, and a rolling window of
+samples for p50/p95/p99), every phase records its total time, and both are kept as
+events that export to the Chrome trace / Perfetto JSON format. When no profiler is
+attached, SystemManager skips all of this behind a single `is None` check.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+class SystemStats:
+    """
+    Running statistics for one system.
+
+    Attributes:
+        calls (int): Number of recorded calls.
+        total_time (float): Sum of call durations, in seconds.
+        samples (deque[float]): Most recent call durations, in seconds.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.calls: int = 0
+        self.total_time: float = 0.0
+        self.samples: deque = deque(maxlen=window)
+
+    def percentiles(self, qs=(50, 95, 99)) -> dict:
+        """Return {q: seconds} over the rolling window of samples."""
+        if not self.samples:
+            return {q: 0.0 for q in qs}
+        values = np.percentile(np.fromiter(self.samples, dtype=np.float64), qs)
+        return {q: float(value) for q, value in zip(qs, values)}
+
+
+class SystemProfiler:
+    """
+    Collects per-system and per-phase timings and exports them as a Chrome trace.
+
+    Attributes:
+        window (int): Number of recent samples kept per system for percentiles.
+        stats (dict[str, SystemStats]): Statistics per system name.
+        phase_totals (dict[str, float]): Accumulated seconds per phase.
+        phase_calls (dict[str, int]): Number of runs per phase.
+        events (deque[dict]): Most recent trace events, oldest dropped first.
+    """
+
+    def __init__(self, window: int = 240, max_events: int = 100_000) -> None:
+        self.window: int = window
+        self.stats: dict = {}
+        self.phase_totals: dict = {}
+        self.phase_calls: dict = {}
+        self.events: deque = deque(maxlen=max_events)
+        self._origin: float = time.perf_counter()
+        self._pid: int = os.getpid()
+
+    def reset(self) -> None:
+        """Discard all recorded statistics and events."""
+        self.stats.clear()
+        self.phase_totals.clear()
+        self.phase_calls.clear()
+        self.events.clear()
+        self._origin = time.perf_counter()
+
+    def _event(self, name: str, category: str, start: float, end: float) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def record(self, name: str, phase: str, start: float, end: float) -> None:
+        """
+        Record one system call.
+
+        Args:
+            name (str): System name.
+            phase (str): Phase the system ran in.
+            start (float): time.perf_counter() before the call.
+            end (float): time.perf_counter() after the call.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = SystemStats(self.window)
+        duration = end - start
+        stats.calls += 1
+        stats.total_time += duration
+        stats.samples.append(duration)
+        self._event(name, phase, start, end)
+
+    def record_phase(self, phase: str, start: float, end: float) -> None:
+        """
+        Record one full phase run (all its systems plus the command buffer flush).
+        """
+        self.phase_totals[phase] = self.phase_totals.get(phase, 0.0) + (end - start)
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        self._event(f"phase:{phase}", "phase", start, end)
+
+    def summary(self) -> dict:
+        """
+        Return per-system statistics in milliseconds, slowest total first.
+
+        Returns:
+            dict: {name: {"calls", "total_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms"}}
+        """
+        result = {}
+        ordered = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+        for name, stats in ordered:
+            p = stats.percentiles()
+            result[name] = {
+                "calls": stats.calls,
+                "total_ms": stats.total_time * 1e3,
+                "mean_ms": stats.total_time * 1e3 / stats.calls,
+                "p50_ms": p[50] * 1e3,
+                "p95_ms": p[95] * 1e3,
+                "p99_ms": p[99] * 1e3,
+            }
+        return result
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Return the recorded events in Chrome trace / Perfetto JSON object format.
+        """
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path) -> None:
+        """
+        Write the recorded events to `path`; open it in chrome://tracing or ui.perfetto.dev.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -0,0 +1,173 @@
+"""
+query.py
+
+Provides QueryView, a persistent, incrementally maintained result set for a
+component query. A view is registered once through
+`ComponentManager.register_query()` and is then patched in O(1) per structural
+change (component add/remove, entity cleanup, entity create/destroy), so reading
+its IDs on a hot path costs nothing beyond a slice.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class QueryView:
+    """
+    A live set of entity IDs holding all of a list of components.
+
+    Membership is stored as a packed sparse set: `ids` is a contiguous array with
+    no holes, and removal swaps the last ID into the freed slot. IDs are therefore
+    not sorted; use `np.sort(view.ids)` if order matters.
+
+    If an EntityManager was supplied, only live entities are members and the view
+    follows entity creation/destruction as well.
+
+    Attributes:
+        component_names (tuple[str, ...]): Components required for membership.
+        sparse_names (tuple[str, ...]): The subset of those that are sparse.
+        em (EntityManager | None): Entity manager the view follows, if any.
+        count (int): Number of matching entities.
+    """
+
+    def __init__(self, cm, component_names, em=None) -> None:
+        self.component_names: tuple = tuple(component_names)
+        self.count: int = 0
+
+        self._cm = cm
+        self.em = em
+        self.sparse_names: tuple = tuple(
+            name for name in self.component_names if cm.meta[name]["sparse"]
+        )
+        self._packed: NDArray[np.intp] = np.empty(cm.max_entities, dtype=np.intp)
+        self._slot: NDArray[np.int64] = np.full(cm.max_entities, -1, dtype=np.int64)
+
+        self.refresh()
+
+    @property
+    def ids(self) -> NDArray[np.intp]:
+        """Contiguous array of matching entity IDs (a view, valid until the next change)."""
+        return self._packed[: self.count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, entity_id: int) -> bool:
+        return self._slot[entity_id] >= 0
+
+    def refresh(self) -> None:
+        """
+        Rebuild the view from scratch. Only needed after bypassing the managers'
+        APIs (e.g. writing `entity_masks` directly).
+        """
+        alive_mask = self.em.alive_mask if self.em is not None else None
+        ids = self._cm.query_entities_with(list(self.component_names), alive_mask=alive_mask)
+
+        self._slot[self._packed[: self.count]] = -1
+        self.count = len(ids)
+        self._packed[: self.count] = ids
+        self._slot[ids] = np.arange(self.count)
+
+    def _matches(self, entity_id: int) -> bool:
+        if self.em is not None and not self.em.alive_mask[entity_id]:
+            return False
+        masks = self._cm.entity_masks
+        for name in self.sparse_names:
+            if not masks[name][entity_id]:
+                return False
+        return True
+
+    def _insert(self, entity_id: int) -> None:
+        if self._slot[entity_id] >= 0:
+            return
+        self._packed[self.count] = entity_id
+        self._slot[entity_id] = self.count
+        self.count += 1
+
+    def _remove(self, entity_id: int) -> None:
+        slot = self._slot[entity_id]
+        if slot < 0:
+            return
+        last = self.count - 1
+        moved = self._packed[last]
+        self._packed[slot] = moved
+        self._slot[moved] = slot
+        self._slot[entity_id] = -1
+        self.count = last
+
+    def _insert_many(self, entity_ids: NDArray) -> None:
+        entity_ids = entity_ids[self._slot[entity_ids] < 0]
+        n = len(entity_ids)
+        self._packed[self.count : self.count + n] = entity_ids
+        self._slot[entity_ids] = np.arange(self.count, self.count + n)
+        self.count += n
+
+    def _remove_many(self, entity_ids: NDArray) -> None:
+        slots = self._slot[entity_ids]
+        slots = np.unique(slots[slots >= 0])
+        if not slots.size:
+            return
+
+        # Fill holes in the surviving prefix with the surviving tail entries
+        new_count = self.count - slots.size
+        holes = slots[slots < new_count]
+        removed_tail = np.zeros(self.count - new_count, dtype=np.bool_)
+        removed_tail[slots[slots >= new_count] - new_count] = True
+        tail = new_count + np.flatnonzero(~removed_tail)
+
+        self._slot[self._packed[slots]] = -1
+        moved = self._packed[tail]
+        self._packed[holes] = moved
+        self._slot[moved] = holes
+        self.count = new_count
+
+    def _matches_many(self, entity_ids: NDArray) -> NDArray[np.bool_]:
+        if self.em is not None:
+            matches = self.em.alive_mask[entity_ids]
+        else:
+            matches = np.ones(len(entity_ids), dtype=np.bool_)
+        masks = self._cm.entity_masks
+        for name in self.sparse_names:
+            matches &= masks[name][entity_ids]
+        return matches
+
+    # --- ComponentManager notifications ---
+
+    def on_component_added(self, entity_id: int) -> None:
+        if self._matches(entity_id):
+            self._insert(entity_id)
+
+    def on_components_added(self, entity_ids: NDArray) -> None:
+        self._insert_many(entity_ids[self._matches_many(entity_ids)])
+
+    def on_component_removed(self, entity_id: int) -> None:
+        self._remove(entity_id)
+
+    def on_components_removed(self, entity_ids: NDArray) -> None:
+        self._remove_many(entity_ids)
+
+    # --- EntityManager notifications ---
+
+    def on_entity_created(self, entity_id: int) -> None:
+        if self._matches(entity_id):
+            self._insert(entity_id)
+
+    def on_entity_destroyed(self, entity_id: int) -> None:
+        self._remove(entity_id)
+
+    def on_entities_created(self, entity_ids: NDArray) -> None:
+        self._insert_many(entity_ids[self._matches_many(entity_ids)])
+
+    def on_entities_destroyed(self, entity_ids: NDArray) -> None:
+        self._remove_many(entity_ids)
+
+    def on_entities_remapped(self, remap: NDArray[np.intp]) -> None:
+        ids = remap[self._packed[: self.count]]
+        ids = ids[ids >= 0]
+        self._slot.fill(-1)
+        self.count = len(ids)
+        self._packed[: self.count] = ids
+        self._slot[ids] = np.arange(self.count)
+
+    def on_reset(self) -> None:
+        self.refresh()
@@ -0,0 +1,229 @@
+"""
+replay.py
+
+Deterministic input recording and headless replay.
+
+Systems read player input from an InputState instead of querying the windowing
+layer directly. In a live run the window code fills the state once per frame and an
+InputRecorder appends it to a compact binary log once per simulation step. A
+ReplayDriver later loads each logged frame back into the state and runs one fixed
+simulation step per frame through a FixedStepLoop, with no window, so a recorded
+session replays identically on headless machines (check with state_checksum()).
+
+    state = InputState(buttons=["W", "A", "S", "D"], axes=["mouse_dx", "mouse_dy"])
+
+    # live
+    recorder = InputRecorder("session.atin", state, step=loop.step)
+    sm.register(lambda cm, em, dt: recorder.record(), name="record_input", phase="pre")
+
+    # CI
+    ReplayDriver("session.atin", loop, state).run()
+    print(state_checksum(em, cm))
+
+Log layout: magic (8 bytes) | version (uint32) | header length (uint32) | JSON
+header (button and axis names, step), then fixed-size little-endian records of
+tick (uint64) | button bits (uint64) | axis values (float32 each).
+"""
+
+import hashlib
+import json
+import struct
+
+import numpy as np
+
+from .snapshot import capture_state
+
+INPUT_MAGIC = b"ATINPUT\x00"
+INPUT_VERSION = 1
+MAX_BUTTONS = 64
+
+_PREFIX = struct.Struct("<8sII")
+
+
+def _record_dtype(n_axes: int) -> np.dtype:
+    return np.dtype([("tick", "<u8"), ("buttons", "<u8"), ("axes", "<f4", (n_axes,))])
+
+
+class InputState:
+    """
+    The input seen by systems during one simulation step.
+
+    Attributes:
+        buttons (tuple[str]): Button names; each maps to one bit.
+        axes (tuple[str]): Analog axis names (mouse deltas, sticks, ...).
+        bits (int): Bitmask of buttons currently held.
+        values (NDArray[np.float32]): Current axis values, in `axes` order.
+    """
+
+    def __init__(self, buttons=(), axes=()) -> None:
+        if len(buttons) > MAX_BUTTONS:
+            raise ValueError(f"At most {MAX_BUTTONS} buttons are supported")
+        self.buttons: tuple = tuple(buttons)
+        self.axes: tuple = tuple(axes)
+        self.bits: int = 0
+        self.values = np.zeros(len(self.axes), dtype=np.float32)
+        self._button_bits = {name: 1 << i for i, name in enumerate(self.buttons)}
+        self._axis_index = {name: i for i, name in enumerate(self.axes)}
+
+    def down(self, name: str) -> bool:
+        """Return whether a button is held."""
+        return bool(self.bits & self._button_bits[name])
+
+    def axis(self, name: str) -> float:
+        """Return an axis value."""
+        return float(self.values[self._axis_index[name]])
+
+    def set_button(self, name: str, held: bool) -> None:
+        bit = self._button_bits[name]
+        self.bits = self.bits | bit if held else self.bits & ~bit
+
+    def set_axis(self, name: str, value: float) -> None:
+        self.values[self._axis_index[name]] = value
+
+    def clear(self) -> None:
+        """Release every button and zero every axis."""
+        self.bits = 0
+        self.values.fill(0.0)
+
+
+class InputRecorder:
+    """
+    Appends one InputState record per call to record().
+
+    Attributes:
+        path: Log file being written.
+        state (InputState): State sampled by record().
+        ticks (int): Records written so far (the next record's tick).
+    """
+
+    def __init__(self, path, state: InputState, step: float) -> None:
+        self.path = path
+        self.state = state
+        self.ticks: int = 0
+        self._record = np.zeros((), dtype=_record_dtype(len(state.axes)))
+
+        header = {"buttons": state.buttons, "axes": state.axes, "step": step}
+        header = json.dumps(header).encode("utf-8")
+        self._file = open(path, "wb")
+        self._file.write(_PREFIX.pack(INPUT_MAGIC, INPUT_VERSION, len(header)))
+        self._file.write(header)
+
+    def record(self) -> None:
+        """Append the current input state as the next tick."""
+        self._record["tick"] = self.ticks
+        self._record["buttons"] = self.state.bits
+        self._record["axes"] = self.state.values
+        self._file.write(self._record.tobytes())
+        self.ticks += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class InputLog:
+    """
+    A recorded input log, loaded as one structured array.
+
+    Attributes:
+        buttons (tuple[str]): Button names, in bit order.
+        axes (tuple[str]): Axis names.
+        step (float): Simulation timestep the log was recorded at.
+        frames (np.ndarray): Records with fields "tick", "buttons" and "axes".
+    """
+
+    def __init__(self, path) -> None:
+        with open(path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ValueError(f"{path} is not an input log")
+            magic, version, header_len = _PREFIX.unpack(prefix)
+            if magic != INPUT_MAGIC:
+                raise ValueError(f"{path} is not an input log")
+            if version > INPUT_VERSION:
+                raise ValueError(
+                    f"Input log version {version} is newer than supported ({INPUT_VERSION})"
+                )
+            header = json.loads(f.read(header_len))
+            self.buttons: tuple = tuple(header["buttons"])
+            self.axes: tuple = tuple(header["axes"])
+            self.step: float = header["step"]
+            # A trailing partial record (e.g. from a crash) is ignored
+            dtype = _record_dtype(len(self.axes))
+            data = f.read()
+            self.frames = np.frombuffer(
+                data[: len(data) // dtype.itemsize * dtype.itemsize], dtype=dtype
+            )
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def apply(self, index: int, state: InputState) -> None:
+        """Load frame `index` into `state`."""
+        frame = self.frames[index]
+        state.bits = int(frame["buttons"])
+        state.values[:] = frame["axes"]
+
+
+class ReplayDriver:
+    """
+    Replays an input log through a FixedStepLoop, one simulation step per frame.
+    Logs whose tick stamps are not 0, 1, 2, ... (dropped or reordered records) are
+    rejected up front rather than replayed out of sync.
+
+    Attributes:
+        log (InputLog): The recorded input.
+        loop (FixedStepLoop): Loop whose simulation phases are run.
+        state (InputState): State the systems read; overwritten every step.
+    """
+
+    def __init__(self, log, loop, state: InputState) -> None:
+        self.log = log if isinstance(log, InputLog) else InputLog(log)
+        self.loop = loop
+        self.state = state
+
+        if (self.log.buttons, self.log.axes) != (state.buttons, state.axes):
+            raise ValueError("Input log buttons/axes do not match the InputState")
+        if self.log.step != loop.step:
+            raise ValueError(
+                f"Input log was recorded at step {self.log.step}, loop uses {loop.step}"
+            )
+        ticks = self.log.frames["tick"]
+        gaps = np.flatnonzero(ticks != np.arange(len(ticks)))
+        if gaps.size:
+            index = int(gaps[0])
+            raise ValueError(
+                f"Input log frame {index} is stamped tick {int(ticks[index])}; "
+                "records are missing or out of order"
+            )
+
+    def run(self, limit: int | None = None) -> int:
+        """
+        Replay the log (or its first `limit` frames) without rendering.
+
+        Returns:
+            int: Number of simulation steps run.
+        """
+        count = len(self.log) if limit is None else min(limit, len(self.log))
+        for index in range(count):
+            self.log.apply(index, self.state)
+            self.loop.run_headless(1)
+        return count
+
+
+def state_checksum(em, cm) -> str:
+    """
+    Return a SHA-256 hex digest of the full ECS state, for comparing runs.
+    """
+    header, arrays = capture_state(em, cm)
+    digest = hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8"))
+    for name, array in arrays.items():
+        digest.update(name.encode("utf-8"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,222 @@
+"""
+rewind.py
+
+Provides RewindBuffer, a bounded in-memory history of ECS state for scrubbing
+backwards through a running simulation.
+
+The buffer keeps the last `capacity` recorded ticks in a ring of preallocated
+slabs, one per entity or component array, each holding `capacity` copies of that
+array's rows in use. A slab only grows (by doubling) when more rows come into use
+than ever before, so recording in steady state is a set of memcpys that allocate
+nothing (paged components are copied page by page, without materializing them).
+rewind(k) copies a recorded state back into the live managers in place and drops
+the newer history, so recording continues from the restored tick.
+
+    history = RewindBuffer(em, cm, capacity=600)   # 10 s at 60 Hz
+    while running:
+        sm.update(cm, em, dt)
+        history.record()
+        cm.advance_tick()
+    history.rewind(120)                            # back 2 s
+
+Dense components registered with `track_changes=True` are restored selectively:
+only rows whose change tick differs from the recorded one, or is 0 (cleared by
+cleanup), are copied back, so in-place edits to them must be stamped with
+mark_changed(), and record() must run after the tick's writes (before
+advance_tick()). Other arrays are copied over their rows in use.
+
+Register every component before creating the buffer. Query views registered on
+the component manager are refreshed after a rewind.
+"""
+
+import numpy as np
+
+from .paged import PagedArray
+
+
+def _copy_rows(out: np.ndarray, source, rows: int) -> None:
+    """Copy the first `rows` rows of `source` into `out` without a temporary."""
+    if not isinstance(source, PagedArray):
+        out[:rows] = source[:rows]
+        return
+    filled = 0
+    for start, stop, page in source.iter_pages():
+        if start >= rows:
+            break
+        stop = min(stop, rows)
+        out[start:stop] = page[: stop - start]
+        filled = stop
+    out[filled:rows] = 0  # unallocated pages read as zero
+
+
+class RewindBuffer:
+    """
+    Ring of preallocated state slabs for the last `capacity` recorded ticks.
+
+    Attributes:
+        em (EntityManager): Entity state to record and restore.
+        cm (ComponentManager): Component state to record and restore.
+        capacity (int): Number of recorded ticks kept.
+        count (int): Number of recorded ticks currently held.
+        nbytes (int): Bytes held by the slabs.
+    """
+
+    def __init__(self, em, cm, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if em.max_entities != cm.max_entities:
+            raise ValueError("EntityManager and ComponentManager capacities differ")
+
+        self.em = em
+        self.cm = cm
+        self.capacity: int = capacity
+        self.count: int = 0
+
+        self._head = 0
+        self._components = tuple(cm.components)
+        self._slabs: dict = {}
+        self._rows: dict = {}
+        self._ticks = np.zeros(capacity, dtype=np.int64)
+        self._next_ids = np.zeros(capacity, dtype=np.intp)
+        self._free_counts = np.zeros(capacity, dtype=np.intp)
+        self._high_water = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(slab.nbytes for slab in self._slabs.values())
+
+    @property
+    def ticks(self) -> list:
+        """Recorded ticks, oldest first."""
+        return [int(self._ticks[self._slot(k)]) for k in range(self.count - 1, -1, -1)]
+
+    def _slot(self, k: int) -> int:
+        """Ring slot of the state recorded `k` records before the latest."""
+        return (self._head - 1 - k) % self.capacity
+
+    def _sources(self) -> dict:
+        """{block: (live array, rows in use)} for every recorded array."""
+        em, cm = self.em, self.cm
+        n = em.next_id
+        self._high_water = max(self._high_water, n)
+
+        sources = {
+            "entity.alive": (em.alive_mask, n),
+            "entity.generations": (em.generations, self._high_water),
+            "entity.free_ids": (em.free_ids, em.free_count),
+        }
+        for name in self._components:
+            if cm.meta[name]["sparse"]:
+                count = cm.sparse_counts[name]
+                sources[f"{name}.data"] = (cm.components[name], count)
+                sources[f"{name}.owners"] = (cm.sparse_owners[name], count)
+            else:
+                sources[f"{name}.data"] = (cm.components[name], n)
+            if name in cm.changed_ticks:
+                sources[f"{name}.ticks"] = (cm.changed_ticks[name], n)
+        return sources
+
+    def _reserve(self, block: str, source, rows: int) -> np.ndarray:
+        """Return the slab for `block`, grown (by doubling) to hold `rows` rows."""
+        slab = self._slabs.get(block)
+        if slab is not None and slab.shape[1] >= rows:
+            return slab
+
+        held = 0 if slab is None else slab.shape[1]
+        size = max(held, 1)
+        while size < rows:
+            size *= 2
+        size = min(size, len(source))
+
+        grown = np.zeros((self.capacity, size, *source.shape[1:]), dtype=source.dtype)
+        if slab is not None:
+            grown[:, :held] = slab
+        else:
+            self._rows[block] = np.zeros(self.capacity, dtype=np.intp)
+        self._slabs[block] = grown
+        return grown
+
+    def record(self) -> None:
+        """
+        Copy the current state into the next slot, overwriting the oldest when full.
+        """
+        if tuple(self.cm.components) != self._components:
+            raise ValueError("Components were registered after the RewindBuffer was created")
+
+        slot = self._head
+        for block, (source, rows) in self._sources().items():
+            slab = self._reserve(block, source, rows)
+            _copy_rows(slab[slot], source, rows)
+            self._rows[block][slot] = rows
+
+        self._ticks[slot] = self.cm.tick
+        self._next_ids[slot] = self.em.next_id
+        self._free_counts[slot] = self.em.free_count
+        self._head = (slot + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def rewind(self, k: int) -> int:
+        """
+        Restore the state recorded `k` records before the latest (0 = latest) and
+        discard everything recorded after it.
+
+        Returns:
+            int: The restored tick.
+
+        Raises:
+            IndexError: If fewer than k + 1 states are recorded.
+        """
+        if not 0 <= k < self.count:
+            raise IndexError(f"Cannot rewind {k} ticks with {self.count} recorded")
+
+        em, cm = self.em, self.cm
+        slot = self._slot(k)
+        n = int(self._next_ids[slot])
+
+        # Forget sparse memberships of the present before restoring the past ones
+        for name in self._components:
+            if cm.meta[name]["sparse"]:
+                owners = cm.sparse_owners[name][: cm.sparse_counts[name]]
+                cm.sparse_index[name][owners] = -1
+                cm.entity_masks[name][owners] = False
+        em.alive_mask[: max(em.next_id, n)] = False
+
+        sources = self._sources()
+        for name in self._components:
+            if name in cm.changed_ticks and not cm.meta[name]["sparse"]:
+                # Rows written since the recording carry a different change tick;
+                # cleanup zeroes ticks, so a 0 tick may hide a write and is restored too
+                rows = int(self._rows[f"{name}.ticks"][slot])
+                ticks = cm.changed_ticks[name]
+                recorded = self._slabs[f"{name}.ticks"][slot, :rows]
+                live = ticks[:rows]
+                changed = np.flatnonzero((live != recorded) | (live == 0))
+                cm.components[name][changed] = self._slabs[f"{name}.data"][slot, changed]
+                ticks[changed] = recorded[changed]
+                del sources[f"{name}.data"], sources[f"{name}.ticks"]
+
+        for block, (target, _) in sources.items():
+            rows = int(self._rows[block][slot])
+            target[:rows] = self._slabs[block][slot, :rows]
+
+        # IDs past the restored high-water mark must not look changed in the "future"
+        for ticks in cm.changed_ticks.values():
+            ticks[n : self._high_water] = 0
+
+        em.next_id = n
+        em.free_count = int(self._free_counts[slot])
+        cm.tick = int(self._ticks[slot])
+        for name in self._components:
+            if cm.meta[name]["sparse"]:
+                count = int(self._rows[f"{name}.owners"][slot])
+                owners = cm.sparse_owners[name][:count]
+                cm.sparse_counts[name] = count
+                cm.sparse_index[name][owners] = np.arange(count)
+                cm.entity_masks[name][owners] = True
+
+        for view in cm.queries.values():
+            view.refresh()
+
+        self._head = (slot + 1) % self.capacity
+        self.count -= k
+        return cm.tick
@@ -0,0 +1,143 @@
+"""
+schema.py
+
+Declarative multi-field components.
+
+A ComponentSchema names the fields of a component and picks its memory layout:
+
+- "aos": one component whose rows are records of a NumPy structured dtype.
+  Fields of one entity sit next to each other in memory.
+- "soa": one column per field, stored as hidden components named
+  "<component>.<field>", so each field is contiguous across entities.
+
+Either way, ComponentManager.view(name) returns zero-copy field arrays by name:
+
+    cm.register_schema("RigidBody", ComponentSchema(
+        {"mass": np.float32, "inertia": (np.float32, (3, 3)), "flags": np.uint8},
+        layout="soa",
+    ))
+    cm.add_component(eid, "RigidBody", {"mass": 2.0, "flags": 1})
+    cm.view("RigidBody").mass *= 0.5
+
+Values may be given as dicts of field values (missing fields are zero) or as
+records/arrays of the schema's structured dtype. Switching the layout only changes
+the registration, which makes the two easy to benchmark against each other.
+
+With paged storage (dense SoA only), field views are PagedArrays. These support
+indexing and `view.mass[ids] *= 2`, but not whole-array arithmetic such as
+`view.mass *= 2`; walk the pages with `view.iter_pages("mass")` instead.
+"""
+
+import numpy as np
+
+SCHEMA_LAYOUTS = ("aos", "soa")
+
+
+class ComponentSchema:
+    """
+    Field names, types and layout of a multi-field component.
+
+    Attributes:
+        fields (dict[str, tuple[np.dtype, tuple]]): (dtype, shape) per field, in order.
+        layout (str): "aos" or "soa".
+        dtype (np.dtype): Structured dtype holding one record.
+    """
+
+    def __init__(self, fields: dict, layout: str = "aos") -> None:
+        if layout not in SCHEMA_LAYOUTS:
+            raise ValueError(f"Unknown schema layout '{layout}' (expected one of {SCHEMA_LAYOUTS})")
+        if not fields:
+            raise ValueError("A schema needs at least one field")
+
+        self.fields: dict = {}
+        for field, spec in fields.items():
+            if isinstance(spec, tuple):
+                dtype, shape = spec
+            else:
+                dtype, shape = spec, ()
+            self.fields[field] = (np.dtype(dtype), tuple(shape))
+
+        self.layout: str = layout
+        self.dtype = np.dtype(
+            [(field, dtype, shape) for field, (dtype, shape) in self.fields.items()]
+        )
+
+    def column(self, component: str, field: str) -> str:
+        """Name of the hidden component storing `field` in the SoA layout."""
+        return f"{component}.{field}"
+
+    def records(self, values, n: int | None = None) -> np.ndarray:
+        """
+        Convert `values` (a dict of field values, or structured data) into an array
+        of the schema's dtype; 0-d for a single value, length `n` for many.
+        """
+        shape = () if n is None else (n,)
+        if isinstance(values, dict):
+            unknown = set(values) - set(self.fields)
+            if unknown:
+                raise KeyError(f"Unknown schema fields: {sorted(unknown)}")
+            out = np.zeros(shape, dtype=self.dtype)
+            for field, value in values.items():
+                out[field] = value
+            return out
+        return np.broadcast_to(np.asarray(values, dtype=self.dtype), shape)
+
+
+class SchemaView:
+    """
+    Named field access to a schema component's storage.
+
+    Dense components expose one row per entity slot; sparse ones expose their
+    packed live rows, aligned with ComponentManager.get_component_owners(). Field
+    arrays are views into the storage, but sparse storage is reallocated when it
+    grows, so take a fresh view each frame rather than holding on to one.
+    """
+
+    def __init__(self, cm, name: str) -> None:
+        self._cm = cm
+        self._name = name
+        self._schema = cm.schemas[name]
+
+    @property
+    def fields(self) -> tuple:
+        """Field names, in schema order."""
+        return tuple(self._schema.fields)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        schema = self._schema
+        if field not in schema.fields:
+            raise KeyError(f"Component '{self._name}' has no field '{field}'")
+        if schema.layout == "aos":
+            return self._cm.get_component_data(self._name)[field]
+        return self._cm.get_component_data(schema.column(self._name, field))
+
+    def iter_pages(self, field: str):
+        """
+        Yield (start, stop, view) blocks of one field: the allocated pages with paged
+        storage, a single block otherwise. Views are writable and zero-copy.
+        """
+        schema = self._schema
+        if field not in schema.fields:
+            raise KeyError(f"Component '{self._name}' has no field '{field}'")
+        if schema.layout == "aos":
+            for start, stop, page in self._cm.iter_pages(self._name):
+                yield start, stop, page[field]
+        else:
+            yield from self._cm.iter_pages(schema.column(self._name, field))
+
+    def __getattr__(self, field: str) -> np.ndarray:
+        if field.startswith("_"):
+            raise AttributeError(field)
+        try:
+            return self[field]
+        except KeyError as exc:
+            raise AttributeError(str(exc)) from None
+
+    def __setattr__(self, field: str, value) -> None:
+        if field.startswith("_"):
+            object.__setattr__(self, field, value)
+            return
+        # Supports augmented assignment (view.mass *= 2), which rebinds the attribute
+        target = self[field]
+        if target is not value:
+            target[:] = value
@@ -0,0 +1,152 @@
+"""
+scratch.py
+
+Provides ScratchArena, a pool of reusable NumPy buffers for per-frame temporaries.
+
+Systems that compute `positions + velocities * dt`, masks or matrix products every
+frame allocate and free large arrays each time. Borrowing buffers from the arena
+and writing into them with `out=` keeps the hot loop allocation-free after the
+first frame:
+
+    def integrate(cm, em, dt):
+        pos = cm.get_component_data("Position")
+        vel = cm.get_component_data("Velocity")
+        step = sm.scratch.like(vel)
+        np.multiply(vel, dt, out=step)
+        pos += step
+
+Buffers are keyed by shape and dtype. Every get() within a phase returns a distinct
+buffer; SystemManager resets the arena at the end of each phase, after which the
+same buffers are handed out again. Buffers must not be kept across phases.
+
+With `debug=True` the arena also measures each system run (through SystemManager)
+with tracemalloc and counts the buffers it had to allocate, so systems that still
+allocate per frame show up in `allocations`. Measurement state is kept per thread,
+so this is safe with parallel workers. tracemalloc's counters are process-wide,
+though, so the byte figures are only exact when systems run serially
+(`workers=0`); with workers, a system's figures include whatever ran concurrently.
+tracemalloc slows down every allocation while it runs; close() (called by
+SystemManager.shutdown()) stops it if the arena started it.
+"""
+
+import threading
+import tracemalloc
+
+import numpy as np
+
+
+class ScratchArena:
+    """
+    Shape-and-dtype keyed pool of reusable buffers, reset at phase end.
+
+    Attributes:
+        debug (bool): Whether per-system allocation statistics are collected.
+        misses (int): Buffers allocated because no free one matched.
+        hits (int): Requests served from an existing buffer.
+        nbytes (int): Bytes held by all pooled buffers.
+        allocations (dict[str, dict]): Per system (debug mode): "calls",
+            "scratch_misses", "peak_bytes" (largest transient allocation in one
+            call) and "total_bytes" (sum of per-call transient peaks).
+    """
+
+    def __init__(self, debug: bool = False) -> None:
+        self.debug: bool = debug
+        self.misses: int = 0
+        self.hits: int = 0
+        self.nbytes: int = 0
+        self.allocations: dict = {}
+        self._pools: dict = {}
+        self._cursor: dict = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+
+    def get(self, shape, dtype=np.float32, zero: bool = False) -> np.ndarray:
+        """
+        Borrow a buffer until the end of the current phase. Contents are undefined
+        unless `zero` is set.
+        """
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        key = (shape, np.dtype(dtype))
+        with self._lock:
+            pool = self._pools.setdefault(key, [])
+            index = self._cursor.get(key, 0)
+            if index == len(pool):
+                pool.append(np.empty(shape, dtype=key[1]))
+                self.misses += 1
+                self.nbytes += pool[-1].nbytes
+                current = getattr(self._local, "current", None)
+                if current is not None:
+                    self.allocations[current]["scratch_misses"] += 1
+            else:
+                self.hits += 1
+            self._cursor[key] = index + 1
+            buffer = pool[index]
+        if zero:
+            buffer.fill(0)
+        return buffer
+
+    def zeros(self, shape, dtype=np.float32) -> np.ndarray:
+        """Borrow a zero-filled buffer."""
+        return self.get(shape, dtype, zero=True)
+
+    def like(self, array) -> np.ndarray:
+        """Borrow a buffer with the shape and dtype of `array`."""
+        return self.get(array.shape, array.dtype)
+
+    def reset(self) -> None:
+        """Return every borrowed buffer to the pool."""
+        self._cursor.clear()
+
+    def clear(self) -> None:
+        """Drop all pooled buffers (e.g. after entity counts change for good)."""
+        self._pools.clear()
+        self._cursor.clear()
+        self.nbytes = 0
+
+    # --- debug mode ---
+
+    def close(self) -> None:
+        """
+        Stop tracemalloc if this arena started it. Statistics are kept, and debug mode
+        starts tracing again on the next measured system run.
+        """
+        with self._lock:
+            if self._started_tracing and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._started_tracing = False
+
+    def begin_system(self, name: str) -> None:
+        """
+        Start measuring a system run on the calling thread. Called by SystemManager in
+        debug mode; every call must be paired with end_system() on the same thread.
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            if name not in self.allocations:
+                self.allocations[name] = {
+                    "calls": 0,
+                    "scratch_misses": 0,
+                    "peak_bytes": 0,
+                    "total_bytes": 0,
+                }
+        self._local.baseline = tracemalloc.get_traced_memory()[0]
+        self._local.current = name
+
+    def end_system(self) -> None:
+        """
+        Finish measuring the calling thread's current system run.
+        """
+        name = getattr(self._local, "current", None)
+        if name is None:
+            return
+        transient = max(tracemalloc.get_traced_memory()[1] - self._local.baseline, 0)
+        self._local.current = None
+        with self._lock:
+            stats = self.allocations[name]
+            stats["calls"] += 1
+            stats["total_bytes"] += transient
+            stats["peak_bytes"] = max(stats["peak_bytes"], transient)
@@ -0,0 +1,206 @@
+"""
+shared.py
+
+Process-pool execution for CPU-bound, pure-Python systems that threads cannot speed
+up because of the GIL.
+
+SharedComponentManager allocates dense component arrays inside
+`multiprocessing.shared_memory` blocks. ProcessPoolBackend splits a system's entity
+IDs into contiguous chunks and runs the system function in worker processes, each
+of which maps the same blocks as zero-copy NumPy views and writes results in place.
+
+Process systems have a different signature from regular systems, since workers do
+not hold the managers:
+
+    def integrate(arrays, ids, dt):
+        arrays["Position"][ids] += arrays["Velocity"][ids] * dt
+
+The function must be defined at module level so it can be pickled.
+
+Workers keep the blocks they attach to open between runs. When a run arrives for a
+different manager (e.g. `pool.cm` was replaced), blocks of the previous one are
+closed, and all blocks are closed when the worker exits.
+"""
+
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .component import ComponentManager
+
+# Blocks attached by this (worker) process: {shm_name: SharedMemory}
+_attached = {}
+
+
+def _open_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without registering it for cleanup by this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track` argument
+        return shared_memory.SharedMemory(name=name)
+
+
+def _detach(keep=()) -> None:
+    """Close every attached block whose name is not in `keep`."""
+    for shm_name in [shm_name for shm_name in _attached if shm_name not in keep]:
+        try:
+            _attached.pop(shm_name).close()
+        except BufferError:
+            pass  # a view is still alive; the mapping goes away with it
+
+
+def _init_worker() -> None:
+    """Worker initializer: close attached blocks when the worker process exits."""
+    multiprocessing.util.Finalize(None, _detach, exitpriority=10)
+
+
+def _attach(spec: tuple) -> np.ndarray:
+    shm_name, shape, dtype = spec
+    block = _attached.get(shm_name)
+    if block is None:
+        block = _attached[shm_name] = _open_block(shm_name)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _run_chunk(fn, specs: dict, ids: NDArray, dt: float, blocks: tuple = ()):
+    """
+    Worker entry point: map the shared arrays and run one chunk of a system.
+    `blocks` names every block of the submitting manager; others are closed first.
+    """
+    if any(shm_name not in blocks for shm_name in _attached):
+        _detach(keep=blocks)
+    arrays = {name: _attach(spec) for name, spec in specs.items()}
+    return fn(arrays, ids, dt)
+
+
+class SharedComponentManager(ComponentManager):
+    """
+    ComponentManager whose dense components live in shared memory.
+
+    Sparse components are stored as usual (their packed arrays grow and move, so
+    they cannot be shared) and are not available to process systems.
+    Call close() (or use the manager as a context manager) to release the blocks.
+
+    Attributes:
+        shared_blocks (dict[str, SharedMemory]): Backing block per dense component.
+    """
+
+    def __init__(self, max_entities: int):
+        super().__init__(max_entities)
+        self.shared_blocks = {}
+
+    def _allocate_dense(self, name: str, shape: tuple, dtype):
+        """
+        Allocate a dense component inside a new shared memory block.
+        """
+        dtype = np.dtype(dtype)
+        shape = (self.max_entities, *shape)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array[...] = 0
+
+        self.shared_blocks[name] = block
+        return array
+
+    def shared_spec(self, name: str) -> tuple:
+        """
+        Return (block_name, shape, dtype) describing how to map a dense component.
+        """
+        if name not in self.shared_blocks:
+            raise ValueError(f"Component '{name}' is not stored in shared memory")
+        array = self.components[name]
+        return self.shared_blocks[name].name, array.shape, array.dtype.str
+
+    def close(self):
+        """
+        Release and unlink all shared blocks. Component arrays become unusable.
+        """
+        for name, block in self.shared_blocks.items():
+            self.components[name] = None
+            try:
+                block.close()
+            except BufferError:
+                pass  # views are still held elsewhere; the mapping goes away with them
+            block.unlink()
+        self.shared_blocks.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ProcessPoolBackend:
+    """
+    Runs process systems over a SharedComponentManager's arrays in worker processes.
+
+    Usage:
+        with SharedComponentManager(n) as cm, ProcessPoolBackend(cm, workers=8) as pool:
+            ids = cm.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+            pool.run(integrate, ["Position", "Velocity"], ids, dt)
+
+    Attributes:
+        cm (SharedComponentManager): Storage shared with the workers; may be replaced
+            between runs.
+        workers (int): Number of worker processes.
+    """
+
+    def __init__(
+        self, cm: SharedComponentManager, workers: int | None = None, mp_context: str = "spawn"
+    ):
+        self.cm = cm
+        self.workers = workers or multiprocessing.cpu_count()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+        )
+
+    @staticmethod
+    def partition(ids: NDArray, parts: int) -> list:
+        """
+        Split an ID array into at most `parts` contiguous, non-empty chunks.
+        """
+        parts = max(1, min(parts, len(ids)))
+        return [chunk for chunk in np.array_split(ids, parts) if len(chunk)]
+
+    def run(
+        self, fn, component_names: list[str], ids, dt: float, chunks: int | None = None
+    ) -> list:
+        """
+        Run `fn(arrays, ids_chunk, dt)` across the worker processes and wait for completion.
+
+        Args:
+            fn (callable): Module-level process system function.
+            component_names (list[str]): Dense components the system accesses.
+            ids (array-like): Entity IDs to process (e.g. a query result).
+            dt (float): Delta time passed to the system.
+            chunks (int): Number of chunks to split `ids` into (default: one per worker).
+
+        Returns:
+            list: The return values of each chunk, in chunk order.
+        """
+        specs = {name: self.cm.shared_spec(name) for name in component_names}
+        blocks = tuple(block.name for block in self.cm.shared_blocks.values())
+        ids = np.asarray(ids, dtype=np.intp)
+        futures = [
+            self._executor.submit(_run_chunk, fn, specs, chunk, dt, blocks)
+            for chunk in self.partition(ids, chunks or self.workers)
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
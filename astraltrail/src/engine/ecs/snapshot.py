@@ -0,0 +1,322 @@
+"""
+snapshot.py
+
+Versioned binary snapshots of an EntityManager and ComponentManager.
+
+File layout:
+
+    magic (8 bytes) | version (uint32) | header length (uint32) | JSON header
+    padding to BLOCK_ALIGNMENT
+    raw array blocks, each starting on a BLOCK_ALIGNMENT boundary
+
+The header records the entity counters, every component's metadata (shape, dtype,
+sparse and change-tracking flags, schema) and the offset, dtype and shape of each
+block. Only rows in use are written: dense components up to the entity high-water
+mark (`next_id`; call compact() first to drop dead slots below it), sparse
+components as their packed live rows plus owners.
+
+Opening a Snapshot only reads the header; blocks are returned as read-only
+`np.memmap` views, so even very large states open immediately and pages are
+faulted in as they are touched. restore() copies the blocks into managers.
+
+    save_snapshot("world.ats", em, cm)
+    snap = Snapshot("world.ats")
+    positions = snap.component("Position")   # memory-mapped rows [0, next_id)
+    em, cm = snap.restore()
+"""
+
+import json
+import struct
+
+import numpy as np
+
+from .component import ComponentManager
+from .entity import EntityManager
+from .schema import ComponentSchema
+
+SNAPSHOT_MAGIC = b"ATSNAP\x00\x00"
+SNAPSHOT_VERSION = 1
+BLOCK_ALIGNMENT = 4096
+
+_PREFIX = struct.Struct("<8sII")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // BLOCK_ALIGNMENT) * BLOCK_ALIGNMENT
+
+
+def _descr(dtype) -> object:
+    return np.lib.format.dtype_to_descr(np.dtype(dtype))
+
+
+def _dtype(descr) -> np.dtype:
+    # JSON turns the tuples of structured descriptors into lists
+    if isinstance(descr, list):
+        descr = [
+            tuple(tuple(part) if isinstance(part, list) else part for part in field)
+            for field in descr
+        ]
+    return np.lib.format.descr_to_dtype(descr)
+
+
+def _schema_header(schema: ComponentSchema) -> dict:
+    return {
+        "layout": schema.layout,
+        "fields": {
+            field: [_descr(dtype), list(shape)] for field, (dtype, shape) in schema.fields.items()
+        },
+    }
+
+
+def capture_state(em: EntityManager, cm: ComponentManager) -> tuple:
+    """
+    Collect the rows in use of every entity and component array.
+
+    Returns:
+        tuple[dict, dict]: The state header (counters and component metadata, without
+        block locations) and {block_name: array}; arrays may be views into the managers.
+    """
+    if em.max_entities != cm.max_entities:
+        raise ValueError("EntityManager and ComponentManager capacities differ")
+
+    n = em.next_id
+    used_generations = np.flatnonzero(em.generations)
+    generation_rows = max(n, int(used_generations[-1]) + 1 if used_generations.size else 0)
+
+    arrays = {
+        "entity.alive": em.alive_mask[:n],
+        "entity.generations": em.generations[:generation_rows],
+        "entity.free_ids": em.free_ids[: em.free_count],
+    }
+
+    components = {}
+    for name, meta in cm.meta.items():
+        entry = {
+            "sparse": bool(meta["sparse"]),
+            "track_changes": bool(meta["track_changes"]),
+            "shape": list(meta["shape"]),
+            "dtype": _descr(meta["dtype"]),
+        }
+        if name in cm.schemas:
+            entry["schema"] = _schema_header(cm.schemas[name])
+        components[name] = entry
+
+        if meta["sparse"]:
+            arrays[f"component.{name}.data"] = cm.get_component_data(name)
+            arrays[f"component.{name}.owners"] = cm.get_component_owners(name)
+        else:
+            arrays[f"component.{name}.data"] = np.asarray(cm.components[name][:n])
+        if name in cm.changed_ticks:
+            arrays[f"component.{name}.ticks"] = cm.changed_ticks[name][:n]
+
+    header = {
+        "max_entities": em.max_entities,
+        "next_id": n,
+        "free_count": em.free_count,
+        "tick": cm.tick,
+        "components": components,
+    }
+    return header, arrays
+
+
+def save_snapshot(path, em: EntityManager, cm: ComponentManager) -> None:
+    """
+    Write the state of `em` and `cm` to `path`.
+
+    Args:
+        path: Destination file path.
+        em (EntityManager): Entity state to save.
+        cm (ComponentManager): Component state to save (SoA or paged storage).
+    """
+    state, arrays = capture_state(em, cm)
+
+    blocks = {}
+    offset = 0
+    for block, array in arrays.items():
+        blocks[block] = {"offset": offset, "dtype": _descr(array.dtype), "shape": list(array.shape)}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({**state, "blocks": blocks}).encode("utf-8")
+    data_start = _align(_PREFIX.size + len(header))
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        f.write(header)
+        for block, array in arrays.items():
+            f.seek(data_start + blocks[block]["offset"])
+            np.ascontiguousarray(array).tofile(f)
+        f.truncate(data_start + offset)
+
+
+class SnapshotState:
+    """
+    Saved ECS state: a header plus named blocks, restorable into managers.
+
+    Subclasses provide block(); the base class serves blocks from a dict.
+
+    Attributes:
+        header (dict): State header as produced by capture_state().
+    """
+
+    def __init__(self, header: dict, blocks: dict | None = None) -> None:
+        self.header: dict = header
+        self._blocks = blocks or {}
+
+    @property
+    def max_entities(self) -> int:
+        return self.header["max_entities"]
+
+    @property
+    def tick(self) -> int:
+        return self.header["tick"]
+
+    @property
+    def component_names(self) -> list:
+        return list(self.header["components"])
+
+    def block(self, name: str) -> np.ndarray:
+        """Return one raw block (e.g. "entity.alive")."""
+        return self._blocks[name]
+
+    def component(self, name: str) -> np.ndarray:
+        """
+        Return a component's stored rows: entity IDs [0, next_id) for dense
+        components, packed live rows (see owners()) for sparse ones.
+        """
+        if name not in self.header["components"]:
+            raise KeyError(f"Component '{name}' is not in the snapshot.")
+        return self.block(f"component.{name}.data")
+
+    def owners(self, name: str) -> np.ndarray:
+        """Return the entity ID of each stored row of a sparse component."""
+        if not self.header["components"][name]["sparse"]:
+            raise ValueError(f"Component '{name}' is dense and has no owner array")
+        return self.block(f"component.{name}.owners")
+
+    def _register(self, cm: ComponentManager) -> None:
+        components = self.header["components"]
+        columns = set()
+        for name, info in components.items():
+            if "schema" not in info:
+                continue
+            schema = ComponentSchema(
+                {
+                    field: (_dtype(descr), tuple(shape))
+                    for field, (descr, shape) in info["schema"]["fields"].items()
+                },
+                layout=info["schema"]["layout"],
+            )
+            cm.register_schema(
+                name, schema, sparse=info["sparse"], track_changes=info["track_changes"]
+            )
+            if schema.layout == "soa":
+                columns.update(schema.column(name, field) for field in schema.fields)
+
+        for name, info in components.items():
+            if "schema" in info or name in columns:
+                continue
+            cm.register_component(
+                name,
+                tuple(info["shape"]),
+                _dtype(info["dtype"]),
+                sparse=info["sparse"],
+                track_changes=info["track_changes"],
+            )
+
+    def restore(self, em: EntityManager | None = None, cm: ComponentManager | None = None) -> tuple:
+        """
+        Load the snapshot into managers, copying every block.
+
+        Args:
+            em (EntityManager): Fresh manager to fill (default: a new one).
+            cm (ComponentManager): Manager with no components registered, e.g. a paged
+                or shared-memory one (default: a new ComponentManager).
+
+        Returns:
+            tuple[EntityManager, ComponentManager]: The restored managers.
+        """
+        header = self.header
+        em = em or EntityManager(self.max_entities)
+        cm = cm or ComponentManager(self.max_entities)
+        if em.max_entities != self.max_entities or cm.max_entities != self.max_entities:
+            raise ValueError("Manager capacity does not match the snapshot")
+        if em.next_id or cm.components:
+            raise ValueError("Snapshots can only be restored into empty managers")
+
+        n = header["next_id"]
+        em.next_id = n
+        em.free_count = header["free_count"]
+        em.alive_mask[:n] = self.block("entity.alive")
+        generations = self.block("entity.generations")
+        em.generations[: len(generations)] = generations
+        em.free_ids[: em.free_count] = self.block("entity.free_ids")
+
+        self._register(cm)
+        cm.tick = header["tick"]
+        for name, info in header["components"].items():
+            data = self.block(f"component.{name}.data")
+            if info["sparse"]:
+                owners = self.block(f"component.{name}.owners")
+                count = len(owners)
+                cm._reserve_sparse(name, count)
+                cm.components[name][:count] = data
+                cm.sparse_owners[name][:count] = owners
+                cm.sparse_index[name][owners] = np.arange(count)
+                cm.sparse_counts[name] = count
+                cm.entity_masks[name][owners] = True
+            else:
+                cm.components[name][:n] = data
+            if info["track_changes"]:
+                cm.changed_ticks[name][:n] = self.block(f"component.{name}.ticks")
+
+        return em, cm
+
+
+class Snapshot(SnapshotState):
+    """
+    A snapshot file opened for lazy, memory-mapped access.
+
+    Attributes:
+        path: The snapshot file.
+        version (int): Format version the file was written with.
+        header (dict): Decoded JSON header.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ValueError(f"{path} is not an ECS snapshot")
+            magic, version, header_len = _PREFIX.unpack(prefix)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not an ECS snapshot")
+            if version > SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Snapshot version {version} is newer than supported ({SNAPSHOT_VERSION})"
+                )
+            self.version: int = version
+            super().__init__(json.loads(f.read(header_len)))
+        self._data_start = _align(_PREFIX.size + header_len)
+
+    def block(self, name: str) -> np.ndarray:
+        """
+        Return a read-only memory map of one raw block (e.g. "entity.alive").
+        """
+        info = self.header["blocks"][name]
+        dtype = _dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(
+            self.path, dtype=dtype, mode="r", offset=self._data_start + info["offset"], shape=shape
+        )
+
+
+def load_snapshot(
+    path, em: EntityManager | None = None, cm: ComponentManager | None = None
+) -> tuple:
+    """
+    Restore managers from a snapshot file. See Snapshot.restore().
+    """
+    return Snapshot(path).restore(em, cm)
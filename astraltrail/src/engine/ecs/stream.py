@@ -0,0 +1,319 @@
+"""
+stream.py
+
+Delta-compressed snapshot streams for replay and rewind.
+
+SnapshotStreamWriter records the ECS state (the same blocks as snapshot.py) into a
+directory of segment files. Each segment starts with a keyframe holding every
+block in full; later frames in the segment store each block XORed with its value
+in the previous frame, so unchanged bytes become zeros, and every frame is
+compressed with zlib or lzma. When a block changes size (e.g. new entities or
+sparse owners), the bytes it shares with the previous frame are XORed and the rest
+are stored as they are. A new segment, and keyframe, starts once
+`keyframe_interval` ticks have passed, and with `max_segments` the oldest segment
+files are deleted, bounding disk use to a fixed window of history. A directory
+holds a single recording: the writer refuses a directory that already contains
+segments unless `overwrite=True`, which deletes them first. The writer keeps
+only the previous frame in memory.
+
+SnapshotStreamReader indexes the records without decompressing them and seeks to
+any tick by decoding the nearest keyframe at or before it and applying the deltas
+that follow:
+
+    with SnapshotStreamWriter("replay/", keyframe_interval=60, max_segments=60) as stream:
+        for _ in range(frames):
+            sm.update(cm, em, dt)
+            stream.write(em, cm)
+            cm.advance_tick()
+
+    em, cm = SnapshotStreamReader("replay/").restore(tick=1234)
+
+Segment file layout: magic (8 bytes) | version (uint32) | codec (uint32), then
+records of tick (uint64) | kind (uint8) | payload length (uint32) | payload. The
+decompressed payload is a uint32 JSON length, a JSON description of the frame and
+the concatenated block bytes.
+"""
+
+import json
+import lzma
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from .snapshot import SnapshotState, _descr, _dtype, capture_state
+
+STREAM_MAGIC = b"ATSTRM\x00\x00"
+STREAM_VERSION = 1
+SEGMENT_SUFFIX = ".atss"
+
+KEYFRAME = 0
+DELTA = 1
+
+CODECS = {
+    "zlib": (
+        0,
+        lambda data, level: zlib.compress(data, 6 if level is None else level),
+        zlib.decompress,
+    ),
+    "lzma": (1, lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+_CODEC_IDS = {codec_id: name for name, (codec_id, _, _) in CODECS.items()}
+
+_SEGMENT = struct.Struct("<8sII")
+_RECORD = struct.Struct("<QBI")
+_JSON_LEN = struct.Struct("<I")
+
+
+def _as_bytes(array: np.ndarray) -> np.ndarray:
+    """Flat uint8 view (or contiguous copy) of an array's bytes."""
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+
+
+class SnapshotStreamWriter:
+    """
+    Appends keyframes and XOR deltas of the ECS state to a directory of segments.
+
+    Attributes:
+        directory (str): Directory holding the segment files.
+        keyframe_interval (int): Ticks between keyframes (one keyframe per segment).
+        codec (str): "zlib" or "lzma".
+        level (int | None): Compression level / preset (None = codec default).
+        max_segments (int | None): Segment files to keep; older ones are deleted.
+        overwrite (bool): Delete segments of an earlier recording found in `directory`
+            instead of refusing to write there.
+        frames (int): Frames written.
+        bytes_written (int): Compressed bytes written, including record headers.
+    """
+
+    def __init__(
+        self,
+        directory,
+        keyframe_interval: int = 60,
+        codec: str = "zlib",
+        level: int | None = None,
+        max_segments: int | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}' (expected one of {tuple(CODECS)})")
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("max_segments must be at least 1")
+
+        self.directory = os.fspath(directory)
+        self.keyframe_interval: int = keyframe_interval
+        self.codec: str = codec
+        self.level = level
+        self.max_segments = max_segments
+        self.frames: int = 0
+        self.bytes_written: int = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        stale = [name for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX)]
+        if stale and not overwrite:
+            raise FileExistsError(
+                f"{self.directory} already holds a snapshot stream (pass overwrite=True)"
+            )
+        for name in stale:
+            os.remove(os.path.join(self.directory, name))
+
+        self._file = None
+        self._segment_tick = None
+        self._last_tick = None
+        self._previous: dict = {}
+
+    def _start_segment(self, tick: int) -> None:
+        self.close()
+        path = os.path.join(self.directory, f"{tick:020d}{SEGMENT_SUFFIX}")
+        self._file = open(path, "wb")
+        self._file.write(_SEGMENT.pack(STREAM_MAGIC, STREAM_VERSION, CODECS[self.codec][0]))
+        self._segment_tick = tick
+        self._previous = {}
+
+        if self.max_segments is not None:
+            segments = sorted(
+                name for name in os.listdir(self.directory) if name.endswith(SEGMENT_SUFFIX)
+            )
+            for name in segments[: -self.max_segments]:
+                os.remove(os.path.join(self.directory, name))
+
+    def write(self, em, cm, tick: int | None = None) -> bool:
+        """
+        Record the current state.
+
+        Args:
+            em (EntityManager): Entity state to record.
+            cm (ComponentManager): Component state to record.
+            tick (int): Tick to file the frame under (default: cm.tick). Must increase.
+
+        Returns:
+            bool: True if the frame was written as a keyframe.
+        """
+        tick = cm.tick if tick is None else int(tick)
+        if self._last_tick is not None and tick <= self._last_tick:
+            raise ValueError(f"Tick {tick} is not after the last recorded tick {self._last_tick}")
+
+        keyframe = self._file is None or tick - self._segment_tick >= self.keyframe_interval
+        if keyframe:
+            self._start_segment(tick)
+
+        state, arrays = capture_state(em, cm)
+        blocks = {}
+        chunks = []
+        offset = 0
+        for name, array in arrays.items():
+            current = _as_bytes(array)
+            previous = self._previous.get(name)
+            if previous is not None:
+                data = current.copy()
+                common = min(previous.size, data.size)
+                np.bitwise_xor(data[:common], previous[:common], out=data[:common])
+                mode = "xor"
+            else:
+                data = current
+                mode = "raw"
+            blocks[name] = {
+                "dtype": _descr(array.dtype),
+                "shape": list(array.shape),
+                "mode": mode,
+                "offset": offset,
+                "nbytes": int(data.size),
+            }
+            chunks.append(data.tobytes())
+            offset += data.size
+            self._previous[name] = current.copy()
+
+        meta = json.dumps({"state": state, "blocks": blocks}).encode("utf-8")
+        payload = CODECS[self.codec][1](
+            _JSON_LEN.pack(len(meta)) + meta + b"".join(chunks), self.level
+        )
+
+        self._file.write(_RECORD.pack(tick, KEYFRAME if keyframe else DELTA, len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+
+        self._last_tick = tick
+        self.frames += 1
+        self.bytes_written += _RECORD.size + len(payload)
+        return keyframe
+
+    def close(self) -> None:
+        """Close the current segment file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SnapshotStreamReader:
+    """
+    Random access to the frames of a snapshot stream directory.
+
+    Attributes:
+        directory (str): Directory holding the segment files.
+        index (list[tuple[int, int, str, int]]): (tick, kind, path, offset) per
+            record, in tick order.
+    """
+
+    def __init__(self, directory) -> None:
+        self.directory = os.fspath(directory)
+        self.index: list = []
+        self._codecs: dict = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-scan the segment files, e.g. to follow a stream that is still being written.
+        Truncated trailing records are ignored.
+        """
+        self.index = []
+        self._codecs = {}
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            with open(path, "rb") as f:
+                magic, version, codec_id = _SEGMENT.unpack(f.read(_SEGMENT.size))
+                if magic != STREAM_MAGIC:
+                    raise ValueError(f"{path} is not a snapshot stream segment")
+                if version > STREAM_VERSION:
+                    raise ValueError(
+                        f"Stream version {version} is newer than supported ({STREAM_VERSION})"
+                    )
+                self._codecs[path] = CODECS[_CODEC_IDS[codec_id]][2]
+
+                size = os.fstat(f.fileno()).st_size
+                offset = _SEGMENT.size
+                while offset + _RECORD.size <= size:
+                    f.seek(offset)
+                    tick, kind, length = _RECORD.unpack(f.read(_RECORD.size))
+                    if offset + _RECORD.size + length > size:
+                        break
+                    self.index.append((tick, kind, path, offset))
+                    offset += _RECORD.size + length
+
+    @property
+    def ticks(self) -> list:
+        """Recorded ticks, in order."""
+        return [tick for tick, _, _, _ in self.index]
+
+    def _decode(self, path: str, offset: int) -> tuple:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            _, _, length = _RECORD.unpack(f.read(_RECORD.size))
+            payload = self._codecs[path](f.read(length))
+        meta_len = _JSON_LEN.unpack_from(payload)[0]
+        meta = json.loads(payload[_JSON_LEN.size : _JSON_LEN.size + meta_len])
+        data = np.frombuffer(payload, dtype=np.uint8, offset=_JSON_LEN.size + meta_len)
+        return meta, data
+
+    def state(self, tick: int) -> SnapshotState:
+        """
+        Reconstruct the state recorded at the latest tick at or before `tick`.
+
+        Raises:
+            KeyError: If `tick` precedes the oldest retained frame.
+        """
+        ticks = self.ticks
+        position = int(np.searchsorted(ticks, tick, side="right")) - 1
+        if position < 0:
+            raise KeyError(f"Tick {tick} is before the oldest recorded frame")
+
+        start = position
+        while self.index[start][1] != KEYFRAME:
+            start -= 1
+            if start < 0:
+                raise KeyError(f"No keyframe precedes tick {tick}")
+
+        current = {}
+        for _, _, path, offset in self.index[start : position + 1]:
+            meta, data = self._decode(path, offset)
+            frame = {}
+            for name, info in meta["blocks"].items():
+                raw = data[info["offset"] : info["offset"] + info["nbytes"]]
+                block = frame[name] = raw.copy()
+                if info["mode"] == "xor":
+                    previous = current[name]
+                    common = min(previous.size, block.size)
+                    np.bitwise_xor(block[:common], previous[:common], out=block[:common])
+            current = frame
+
+        blocks = {
+            name: current[name].view(_dtype(info["dtype"])).reshape(info["shape"])
+            for name, info in meta["blocks"].items()
+        }
+        return SnapshotState(meta["state"], blocks)
+
+    def restore(self, tick: int, em=None, cm=None) -> tuple:
+        """
+        Restore managers to the state at `tick`. See SnapshotState.restore().
+        """
+        return self.state(tick).restore(em, cm)
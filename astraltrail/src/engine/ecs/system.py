@@ -1,20 +1,135 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .chunk import iter_chunks
+from .command_buffer import CommandBuffer
+from .profiling import SystemProfiler
+from .scratch import ScratchArena
+
+
 class System:
     """
     Represents a single ECS system with optional metadata.
-    
+
     Attributes:
-        fn (callable): The system function to execute (takes cm, em, dt).
+        fn (callable): The callable the scheduler runs (takes cm, em, dt).
+        kernel (callable): The registered function; differs from `fn` for chunked
+            systems, whose kernel takes (cm, em, dt, chunk) and runs once per chunk.
         name (str): Unique name for identification and debugging.
         enabled (bool): Whether the system is currently active.
         tags (set): Optional labels for filtering execution (e.g. 'physics', 'render').
         phase (str): Which update phase the system belongs to ('pre', 'update', 'post').
+        reads (set | None): Components the system reads (None = undeclared).
+        writes (set | None): Components the system writes (None = undeclared).
+        interval (int): Run once every `interval` frames (see SystemManager.begin_frame).
+        offset (int): Which of those updates it runs on, used to stagger low-rate systems.
+        deferrable (bool): Whether the frame budget may postpone the system.
+        elapsed (float): Time accumulated since the system last ran; passed as its dt.
+        deferrals (int): Consecutive frames the system has been postponed by the budget.
+        chunk_size (int | None): Entity IDs per chunk for chunked systems.
     """
-    def __init__(self, fn, name=None, enabled=True, tags=None, phase="update"):
-        self.fn = fn
+    def __init__(
+        self,
+        fn,
+        name=None,
+        enabled=True,
+        tags=None,
+        phase="update",
+        reads=None,
+        writes=None,
+        interval=1,
+        offset=0,
+        deferrable=False,
+        chunk_size=None,
+    ):
+        self.kernel = fn
+        self.chunk_size = chunk_size
+        self.fn = fn if chunk_size is None else self._run_chunks
         self.name = name or fn.__name__
         self.enabled = enabled
         self.tags = set(tags or [])
         self.phase = phase
+        self.reads = None if reads is None and writes is None else set(reads or [])
+        self.writes = None if reads is None and writes is None else set(writes or [])
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.interval = interval
+        self.offset = offset % interval
+        self.deferrable = deferrable
+        self.elapsed = 0.0
+        self.deferrals = 0
+        self._ticks = 0
+        self._frame = None
+        self._slot_due = False
+
+    def _run_chunks(self, cm, em, dt):
+        for chunk in iter_chunks(cm, em, self.chunk_size):
+            self.kernel(cm, em, dt, chunk)
+
+    def tick(self, dt, frame=None) -> bool:
+        """
+        Accumulate `dt` for one update of the system's phase and return whether the
+        system is due: on its interval slot, or postponed by the budget last frame.
+
+        The interval slot advances once per `frame`; further updates within the same
+        frame reuse it. With `frame=None` every update counts as a new frame.
+        """
+        self.elapsed += dt
+        if frame is None or frame != self._frame:
+            self._frame = frame
+            self._slot_due = (self._ticks + self.offset) % self.interval == 0
+            self._ticks += 1
+        return self.deferrals > 0 or self._slot_due
+
+    def consume(self) -> float:
+        """
+        Return the accumulated dt for a run and reset it.
+        """
+        elapsed = self.elapsed
+        self.elapsed = 0.0
+        self.deferrals = 0
+        return elapsed
+
+    def conflicts_with(self, other) -> bool:
+        """
+        Return True if the two systems may not run concurrently: either one has not
+        declared its component access, or one writes a component the other touches.
+        """
+        if self.writes is None or other.writes is None:
+            return True
+        return bool(
+            self.writes & (other.reads | other.writes)
+            or other.writes & (self.reads | self.writes)
+        )
+
+class ScheduleTrace:
+    """
+    Record of one parallel phase execution.
+
+    Attributes:
+        phase (str): The phase that was executed.
+        waves (list[list[str]]): System names per wave; systems in a wave ran concurrently.
+        timings (dict[System, tuple[float, float]]): (start, end) perf_counter times per
+            system (keyed by System, since names need not be unique).
+        wall_time (float): Seconds from the first system start to the last system end.
+    """
+    def __init__(self, phase):
+        self.phase = phase
+        self.waves = []
+        self.timings = {}
+        self.wall_time = 0.0
+
+    @property
+    def busy_time(self) -> float:
+        """Sum of all system run times, in seconds."""
+        return sum(end - start for start, end in self.timings.values())
+
+    @property
+    def parallelism(self) -> float:
+        """Achieved parallelism: busy time divided by wall time (1.0 = sequential)."""
+        return self.busy_time / self.wall_time if self.wall_time > 0 else 1.0
 
 class SystemManager:
     """
@@ -25,11 +140,60 @@ class SystemManager:
         sm = SystemManager()
         sm.register(my_physics_system, tags=["physics"], phase="update")
         sm.update(cm, em, dt)  # runs all 'update'-phase systems
+
+    Structural changes (spawn/destroy/add/remove) made while iterating should be
+    recorded into `sm.commands`; the buffer is flushed in batched form at the end
+    of every update() call, i.e. at each phase boundary.
+
+    With `workers > 0`, systems that declare `reads`/`writes` at registration are
+    grouped into waves of non-conflicting systems that run concurrently on a thread
+    pool (NumPy releases the GIL in most array kernels). Registration order is kept
+    between conflicting systems. Each run's schedule is stored in `last_trace`, and
+    the schedules of the current frame (every phase and step since begin_frame()) in
+    `frame_traces`; `frame_parallelism` summarizes them.
+
+    The systems selected for each (phase, tag filter) pair, and their waves, are
+    resolved once and cached until register() or set_enabled() changes them. Toggle
+    systems through set_enabled() rather than assigning `System.enabled` directly.
+
+    Systems registered with `interval > 1` run every N-th frame and receive the time
+    accumulated since their last run as dt; unless an offset is given, systems sharing
+    an interval are staggered across frames. A frame spans begin_frame() to
+    end_frame(); update() calls outside such a span each count as a frame of their
+    own. With a `frame_budget` (seconds, measured from the frame start), systems registered as
+    `deferrable` are postponed to the next frame once the budget is spent, at most
+    `max_deferrals` frames in a row. Postponed systems are listed in `deferred` for the
+    current frame and counted in `deferred_counts`.
+
+    `sm.scratch` is a ScratchArena of reusable temporaries that is reset at the end
+    of every phase; in its debug mode each system run is measured for allocations.
+    Per-system byte figures are only exact with `workers=0`, since tracemalloc's
+    counters are process-wide.
+
+    Timing instrumentation is off by default; enable_profiling() attaches a
+    SystemProfiler that records every system call and phase.
     """
-    def __init__(self):
+    def __init__(self, workers: int = 0, frame_budget: float | None = None, max_deferrals: int = 4,
+                 debug_allocations: bool = False):
         self.systems = []
+        self.commands = CommandBuffer()
+        self.scratch = ScratchArena(debug=debug_allocations)
+        self.workers = workers
+        self.last_trace = None
+        self.frame_traces = []
+        self.profiler = None
+        self.frame_budget = frame_budget
+        self.max_deferrals = max_deferrals
+        self.deferred = []
+        self.deferred_counts = {}
+        self._frame_start = None
+        self._frame_id = 0
+        self._executor = None
+        self._by_name = {}
+        self._dispatch = {}
 
-    def register(self, fn, name=None, tags=None, phase="update"):
+    def register(self, fn, name=None, tags=None, phase="update", reads=None, writes=None,
+                 interval=1, offset=None, deferrable=False, chunk_size=None):
         """
         Register a system function.
 
@@ -38,9 +202,35 @@ class SystemManager:
             name (str): Optional name override (default is function name).
             tags (list[str]): Optional list of tags (e.g. ['physics', 'network']).
             phase (str): Execution phase ('pre', 'update', or 'post').
+            reads (list[str]): Components the system only reads.
+            writes (list[str]): Components the system writes. Systems declaring
+                neither are treated as touching everything and run alone.
+            interval (int): Run once every `interval` frames.
+            offset (int): Update slot within the interval (default: staggered
+                after earlier systems of the same phase and interval).
+            deferrable (bool): Allow the frame budget to postpone this system.
+            chunk_size (int): If set, call `fn(cm, em, dt, chunk)` once per contiguous
+                range of this many entity IDs (see chunk.py).
         """
-        system = System(fn, name=name, tags=tags, phase=phase)
+        if offset is None:
+            offset = sum(
+                1 for sys in self.systems if sys.phase == phase and sys.interval == interval
+            )
+        system = System(
+            fn,
+            name=name,
+            tags=tags,
+            phase=phase,
+            reads=reads,
+            writes=writes,
+            interval=interval,
+            offset=offset,
+            deferrable=deferrable,
+            chunk_size=chunk_size,
+        )
         self.systems.append(system)
+        self._by_name.setdefault(system.name, []).append(system)
+        self._dispatch.clear()
 
     def set_enabled(self, name: str, enabled: bool):
         """
@@ -50,9 +240,219 @@ class SystemManager:
             name (str): The name of the system to toggle.
             enabled (bool): True to enable, False to disable.
         """
-        for sys in self.systems:
-            if sys.name == name:
+        for sys in self._by_name.get(name, ()):
+            if sys.enabled != enabled:
                 sys.enabled = enabled
+                self._dispatch.clear()
+
+    def dispatch_list(self, phase="update", include_tags=None):
+        """
+        Return the cached, ordered systems that update() runs for a phase and tag filter.
+
+        Args:
+            phase (str): Phase to resolve.
+            include_tags (list[str]): Optional tag filter, as passed to update().
+
+        Returns:
+            list[System]: Enabled matching systems, in registration order.
+        """
+        return self._resolve(phase, include_tags)[0]
+
+    def begin_frame(self):
+        """
+        Mark the start of a frame: restart the frame budget clock, advance interval
+        slots for the frame and clear `deferred` and `frame_traces`. Pair with end_frame().
+        """
+        self._frame_start = time.perf_counter()
+        self._frame_id += 1
+        self.deferred = []
+        self.frame_traces = []
+
+    def begin_step(self):
+        """
+        Advance interval slots without restarting the frame budget clock. FixedStepLoop
+        calls this before each simulation step, so interval systems count simulation
+        steps rather than rendered frames when several steps run in one frame.
+        """
+        self._frame_id += 1
+
+    @property
+    def frame_parallelism(self) -> float:
+        """
+        Achieved parallelism over `frame_traces`: busy time divided by wall time, with
+        phases counted back to back (1.0 = sequential or nothing traced).
+        """
+        wall = sum(trace.wall_time for trace in self.frame_traces)
+        busy = sum(trace.busy_time for trace in self.frame_traces)
+        return busy / wall if wall > 0 else 1.0
+
+    def end_frame(self):
+        """
+        Mark the end of the frame opened by begin_frame(). Until the next begin_frame(),
+        each update() measures the budget from its own start and counts as one frame.
+        """
+        self._frame_start = None
+
+    def _resolve(self, phase, include_tags):
+        key = (phase, frozenset(include_tags) if include_tags else None)
+        entry = self._dispatch.get(key)
+        if entry is None:
+            tags = key[1]
+            selected = [
+                sys for sys in self.systems
+                if sys.enabled and sys.phase == phase and (tags is None or sys.tags & tags)
+            ]
+            throttled = any(sys.interval > 1 or sys.deferrable for sys in selected)
+            entry = self._dispatch[key] = (selected, self.build_waves(selected), throttled)
+        return entry
+
+    def enable_profiling(self, profiler=None):
+        """
+        Start recording per-system timings.
+
+        Args:
+            profiler (SystemProfiler): Optional profiler to record into (default: a new one).
+
+        Returns:
+            SystemProfiler: The attached profiler.
+        """
+        self.profiler = profiler or SystemProfiler()
+        return self.profiler
+
+    def disable_profiling(self):
+        """
+        Stop recording timings. The detached profiler keeps what it recorded.
+        """
+        self.profiler = None
+
+    @staticmethod
+    def build_waves(systems):
+        """
+        Group systems into ordered waves. A system is placed one wave after the latest
+        earlier system it conflicts with, so conflicting systems keep registration order
+        and systems within a wave touch disjoint data.
+
+        Args:
+            systems (list[System]): Systems in registration order.
+
+        Returns:
+            list[list[System]]: The waves, in execution order.
+        """
+        waves = []
+        levels = []
+        for i, sys in enumerate(systems):
+            level = 0
+            for j in range(i):
+                if levels[j] >= level and sys.conflicts_with(systems[j]):
+                    level = levels[j] + 1
+            levels.append(level)
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(sys)
+        return waves
+
+    def _admit(self, sys, frame_start) -> bool:
+        """
+        Return False (and record the deferral) if a deferrable system must wait
+        because the frame budget is spent.
+        """
+        if (
+            sys.deferrable
+            and self.frame_budget is not None
+            and sys.deferrals < self.max_deferrals
+            and time.perf_counter() - frame_start > self.frame_budget
+        ):
+            sys.deferrals += 1
+            self.deferred.append(sys.name)
+            self.deferred_counts[sys.name] = self.deferred_counts.get(sys.name, 0) + 1
+            return False
+        return True
+
+    def _call(self, sys, cm, em, dt, phase):
+        """
+        Run one system with profiling and allocation tracking applied.
+
+        Returns:
+            tuple[float, float]: The (start, end) perf_counter times of the call.
+        """
+        scratch = self.scratch
+        if scratch.debug:
+            scratch.begin_system(sys.name)
+        try:
+            start = time.perf_counter()
+            sys.fn(cm, em, dt)
+            end = time.perf_counter()
+        finally:
+            if scratch.debug:
+                scratch.end_system()
+        if self.profiler is not None:
+            self.profiler.record(sys.name, phase, start, end)
+        return start, end
+
+    def _run_parallel(self, waves, cm, em, dt, phase, admit=None):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="ecs-system"
+            )
+
+        trace = ScheduleTrace(phase)
+
+        def run(sys):
+            trace.timings[sys] = self._call(
+                sys, cm, em, dt if admit is None else sys.consume(), phase
+            )
+
+        for wave in waves:
+            if admit is not None:
+                wave = [sys for sys in wave if admit(sys)]
+                if not wave:
+                    continue
+            trace.waves.append([sys.name for sys in wave])
+            if len(wave) == 1:
+                run(wave[0])
+                continue
+            futures = [self._executor.submit(run, sys) for sys in wave]
+            for future in futures:
+                future.result()
+        if trace.timings:
+            starts, ends = zip(*trace.timings.values())
+            trace.wall_time = max(ends) - min(starts)
+
+        self.last_trace = trace
+        if self._frame_start is None:
+            self.frame_traces = []  # outside begin_frame()/end_frame(), one update is a frame
+        self.frame_traces.append(trace)
+
+    def _run_throttled(self, selected, waves, cm, em, dt, phase):
+        """
+        Run only the systems that are due this update, applying the frame budget.
+        """
+        if self._frame_start is None:
+            frame_start, frame = time.perf_counter(), None
+        else:
+            frame_start, frame = self._frame_start, self._frame_id
+        due = {sys for sys in selected if sys.tick(dt, frame)}
+
+        def admit(sys):
+            return sys in due and self._admit(sys, frame_start)
+
+        if self.workers > 0:
+            self._run_parallel(waves, cm, em, dt, phase, admit)
+            return
+
+        for sys in selected:
+            if admit(sys):
+                self._call(sys, cm, em, sys.consume(), phase)
+
+    def shutdown(self):
+        """
+        Stop the worker thread pool, if one was started, and the scratch arena's
+        allocation tracing.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.scratch.close()
 
     def update(self, cm, em, dt, phase="update", include_tags=None):
         """
@@ -65,12 +465,26 @@ class SystemManager:
             phase (str): Phase to execute ('pre', 'update', or 'post').
             include_tags (list[str]): If set, only systems with these tags will run.
         """
-        include_tags = set(include_tags or [])
-        for sys in self.systems:
-            if not sys.enabled:
-                continue
-            if sys.phase != phase:
-                continue
-            if include_tags and not (sys.tags & include_tags):
-                continue
-            sys.fn(cm, em, dt)
+        selected, waves, throttled = self._resolve(phase, include_tags)
+
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = time.perf_counter()
+
+        if throttled:
+            self._run_throttled(selected, waves, cm, em, dt, phase)
+        elif self.workers > 0:
+            self._run_parallel(waves, cm, em, dt, phase)
+        elif profiler is None and not self.scratch.debug:
+            for sys in selected:
+                sys.fn(cm, em, dt)
+        else:
+            for sys in selected:
+                self._call(sys, cm, em, dt, phase)
+
+        if self.commands:
+            self.commands.flush(em, cm)
+        self.scratch.reset()
+
+        if profiler is not None:
+            profiler.record_phase(phase, phase_start, time.perf_counter())
@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.archetype import ArchetypeComponentManager
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.introspect import memory_report
+from astraltrail.src.engine.ecs.system import SystemManager
+
+MAX_ENTITIES = 1000
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture to initialize an ECS using archetype storage.
+    Registers 'Position' and 'Velocity' components.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="archetype")
+
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+
+    return em, cm
+
+
+def test_storage_mode_switch():
+    """
+    The factory should return the storage backend matching the requested mode.
+    """
+    assert isinstance(create_component_manager(10), ComponentManager)
+    assert isinstance(create_component_manager(10, storage="archetype"), ArchetypeComponentManager)
+
+    with pytest.raises(ValueError):
+        create_component_manager(10, storage="columnar")
+
+
+def test_entities_grouped_by_signature(setup_ecs):
+    """
+    Entities with the same component set should share one table.
+    """
+    em, cm = setup_ecs
+    a, b, c = (em.create_entity() for _ in range(3))
+
+    cm.add_component(a, "Position", [1, 1])
+    cm.add_component(b, "Position", [2, 2])
+    cm.add_component(b, "Velocity", [0.5, 0.5])
+    cm.add_component(c, "Position", [3, 3])
+    cm.add_component(c, "Velocity", [1.5, 1.5])
+
+    tables = cm.query_tables(["Position", "Velocity"])
+    assert len(tables) == 1
+    assert sorted(tables[0].ids.tolist()) == [b, c]
+    assert tables[0].column("Position").shape == (2, 2)
+
+
+def test_row_moves_preserve_values(setup_ecs):
+    """
+    Adding and removing components moves rows between tables without losing data.
+    """
+    em, cm = setup_ecs
+    ids = [em.create_entity() for _ in range(4)]
+    for eid in ids:
+        cm.add_component(eid, "Position", [eid, -eid])
+
+    cm.add_component(ids[1], "Velocity", [9, 9])
+    assert np.allclose(cm.get_component(ids[1], "Position"), [1, -1])
+
+    # Remaining rows in the Position-only table must still be correct after the swap-remove
+    for eid in (ids[0], ids[2], ids[3]):
+        assert np.allclose(cm.get_component(eid, "Position"), [eid, -eid])
+
+    cm.remove_component(ids[1], "Velocity")
+    assert not cm.has_component(ids[1], "Velocity")
+    assert np.allclose(cm.get_component(ids[1], "Position"), [1, -1])
+
+
+def test_query_entities_matches_component_manager(setup_ecs):
+    """
+    Query results should match those of the default ComponentManager.
+    """
+    em, cm = setup_ecs
+    reference = ComponentManager(MAX_ENTITIES)
+    reference.register_component("Position", shape=(2,), dtype=np.float32)
+    reference.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+
+    ids = [em.create_entity() for _ in range(10)]
+    for eid in ids:
+        cm.add_component(eid, "Position", [eid, eid])
+        reference.add_component(eid, "Position", [eid, eid])
+    for eid in ids[3:8]:
+        cm.add_component(eid, "Velocity", [0.0, 0.0])
+        reference.add_component(eid, "Velocity", [0.0, 0.0])
+
+    em.destroy_entity(ids[4])
+
+    expected = reference.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+    result = cm.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+    assert np.array_equal(result, expected)
+
+
+def test_table_iteration_updates_in_place(setup_ecs):
+    """
+    Systems can update whole table columns in place without gathers.
+    """
+    em, cm = setup_ecs
+    ids = np.array([em.create_entity() for _ in range(100)])
+    cm.add_entities(ids, {"Position": 0.0, "Velocity": np.ones((100, 2), dtype=np.float32)})
+
+    for table in cm.query_tables(["Position", "Velocity"]):
+        table.column("Position")[:] += table.column("Velocity") * 0.5
+
+    assert np.allclose(cm.get_component(ids[42], "Position"), [0.5, 0.5])
+
+
+def test_add_entities_rejects_existing(setup_ecs):
+    """
+    Bulk insertion is only valid for entities that hold no components yet.
+    """
+    em, cm = setup_ecs
+    eid = em.create_entity()
+    cm.add_component(eid, "Position", [0, 0])
+
+    with pytest.raises(ValueError):
+        cm.add_entities([eid], {"Position": 0.0})
+
+
+def test_add_entities_rejects_duplicates_and_empty_values(setup_ecs):
+    """
+    A batch may not repeat an entity or insert it with no components.
+    """
+    em, cm = setup_ecs
+    eid, other = em.create_entity(), em.create_entity()
+
+    with pytest.raises(ValueError):
+        cm.add_entities([eid, eid], {"Position": 0.0})
+    with pytest.raises(ValueError):
+        cm.add_entities([eid], {})
+    assert not cm.has_component(eid, "Position")
+
+    cm.add_entities([eid, other], {"Position": 0.0})
+    assert cm.query_entities_with(["Position"]).tolist() == [eid, other]
+
+
+def test_remove_missing_component_raises(setup_ecs):
+    """
+    Removing a component the entity does not hold raises KeyError.
+    """
+    em, cm = setup_ecs
+    eid = em.create_entity()
+    cm.add_component(eid, "Position", [0, 0])
+
+    with pytest.raises(KeyError):
+        cm.remove_component(eid, "Velocity")
+    assert cm.has_component(eid, "Position")
+
+
+def test_cleanup_entity_removes_row(setup_ecs):
+    """
+    Cleaning up an entity removes it from archetype storage entirely.
+    """
+    em, cm = setup_ecs
+    eid = em.create_entity()
+    cm.add_component(eid, "Position", [5, 5])
+    cm.add_component(eid, "Velocity", [1, -1])
+
+    cm.cleanup_entity(eid)
+
+    assert not cm.has_component(eid, "Position")
+    assert not cm.has_component(eid, "Velocity")
+    assert cm.query_entities_with(["Position"]).size == 0
+
+
+def test_bulk_calls_drive_command_buffer(setup_ecs):
+    """
+    Commands recorded by systems flush through the bulk add/remove/cleanup calls.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(4)
+    cm.add_components(ids, "Position", [[0, 0], [1, 1], [2, 2], [3, 3]])
+    cm.add_components(ids[:2], "Velocity", [1, 0])
+    assert np.allclose(cm.get_component(int(ids[3]), "Position"), [3, 3])
+
+    sm = SystemManager()
+
+    def churn(cm, em, dt):
+        sm.commands.destroy(ids[0])
+        sm.commands.remove(ids, "Velocity")
+        sm.commands.add(ids[2], "Velocity", [0, 1])
+
+    sm.register(churn)
+    sm.update(cm, em, 0.016)
+
+    assert not em.is_alive(int(ids[0]))
+    assert cm.query_entities_with(["Position"], alive_mask=em.alive_mask).tolist() == [1, 2, 3]
+    assert cm.query_entities_with(["Velocity"]).tolist() == [2]
+
+
+def test_introspection_rejects_archetype_storage(setup_ecs):
+    """
+    Memory reports need per-component arrays and fail clearly without them.
+    """
+    em, cm = setup_ecs
+    with pytest.raises(TypeError):
+        memory_report(em, cm)
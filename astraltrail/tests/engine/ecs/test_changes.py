@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.entity import EntityManager
+
+MAX_ENTITIES = 100
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with change-tracked dense 'Transform' and sparse 'Mesh' components,
+    plus an untracked 'Position'.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = ComponentManager(max_entities=MAX_ENTITIES)
+
+    cm.register_component("Transform", shape=(3,), dtype=np.float32, track_changes=True)
+    cm.register_component("Mesh", shape=(1,), dtype=np.int32, sparse=True, track_changes=True)
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+
+    return em, cm
+
+
+def test_writes_are_stamped(setup_ecs):
+    """
+    add_component and add_components should mark entities as changed.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(10)
+    since = cm.tick
+    cm.advance_tick()
+
+    cm.add_component(int(ids[3]), "Transform", [1, 2, 3])
+    cm.add_components(ids[6:8], "Transform", 0.0)
+
+    assert cm.query_changed("Transform", since).tolist() == [3, 6, 7]
+
+
+def test_only_new_changes_reported(setup_ecs):
+    """
+    Changes older than `since_tick` should not be reported again.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(5)
+    cm.add_components(ids, "Transform", 1.0)
+    seen = cm.tick
+
+    cm.advance_tick()
+    assert cm.query_changed("Transform", seen).size == 0
+
+    cm.add_component(int(ids[2]), "Transform", [0, 0, 0])
+    assert cm.query_changed("Transform", seen).tolist() == [2]
+
+
+def test_mark_changed_for_in_place_edits(setup_ecs):
+    """
+    In-place edits are invisible to the manager until marked explicitly.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(8)
+    seen = cm.tick
+    cm.advance_tick()
+
+    cm.get_component_data("Transform")[ids[::4]] += 1.0
+    assert cm.query_changed("Transform", seen).size == 0
+
+    cm.mark_changed(ids[::4], "Transform")
+    assert cm.query_changed("Transform", seen).tolist() == [0, 4]
+
+
+def test_sparse_changes_and_removal(setup_ecs):
+    """
+    Sparse components report changed owners; removed owners drop out.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(6)
+    seen = cm.tick
+    cm.advance_tick()
+
+    cm.add_components(ids[[5, 1, 3]], "Mesh", 7)
+    assert cm.query_changed("Mesh", seen).tolist() == [1, 3, 5]
+
+    cm.remove_component(int(ids[3]), "Mesh")
+    assert cm.query_changed("Mesh", seen).tolist() == [1, 5]
+
+    em.destroy_entity(int(ids[5]))
+    assert cm.query_changed("Mesh", seen, alive_mask=em.alive_mask).tolist() == [1]
+
+
+def test_cleanup_clears_dense_change_ticks(setup_ecs):
+    """
+    Destroyed entities should no longer be reported as changed, even without an alive mask.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(6)
+    since = cm.tick
+    cm.advance_tick()
+    cm.add_components(ids, "Transform", 1.0)
+
+    em.destroy_entity(int(ids[1]))
+    cm.cleanup_entity(int(ids[1]))
+    em.destroy_entities(ids[4:])
+    cm.cleanup_entities(ids[4:])
+
+    assert cm.query_changed("Transform", since).tolist() == [0, 2, 3]
+
+
+def test_untracked_component_rejects_change_queries(setup_ecs):
+    """
+    Change queries require opting in at registration time.
+    """
+    _, cm = setup_ecs
+    with pytest.raises(ValueError):
+        cm.query_changed("Position", 0)
+    with pytest.raises(ValueError):
+        cm.mark_changed([0], "Position")
+
+
+def test_compaction_moves_change_ticks(setup_ecs):
+    """
+    Change stamps should follow their entities through compaction.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(6)
+    seen = cm.tick
+    cm.advance_tick()
+    cm.add_components(ids[[4, 5]], "Transform", 1.0)
+    cm.add_component(int(ids[5]), "Mesh", [1])
+
+    em.destroy_entities(ids[:3])
+    remap = em.compact()
+    cm.compact(remap)
+
+    assert cm.query_changed("Transform", seen).tolist() == remap[[4, 5]].tolist()
+    assert cm.query_changed("Mesh", seen).tolist() == [remap[5]]
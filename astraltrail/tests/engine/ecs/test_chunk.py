@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.chunk import Chunk, iter_chunks, split_range
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.system import SystemManager
+
+MAX_ENTITIES = 100
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Create managers with 10 entities carrying Position and Velocity.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (2,), np.float32)
+    cm.register_component("Velocity", (2,), np.float32)
+    ids = em.create_entities(10)
+    cm.add_components(ids, "Position", np.zeros((10, 2)))
+    cm.add_components(ids, "Velocity", np.ones((10, 2)))
+    return em, cm, ids
+
+
+def test_split_range():
+    """
+    Verify ranges are contiguous and the last one is truncated.
+    """
+    assert split_range(0, 10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert split_range(0, 0, 4) == []
+    with pytest.raises(ValueError):
+        split_range(0, 10, 0)
+
+
+def test_chunked_system_writes_through_views(setup_ecs):
+    """
+    Ensure a chunked system sees every in-use ID once and its writes reach storage.
+    """
+    em, cm, ids = setup_ecs
+    em.destroy_entity(int(ids[3]))
+    ranges = []
+
+    def integrate(cm, em, dt, chunk):
+        ranges.append((chunk.start, chunk.stop))
+        pos, vel = chunk.views(["Position", "Velocity"])
+        pos[chunk.alive] += vel[chunk.alive] * dt
+
+    sm = SystemManager()
+    sm.register(integrate, chunk_size=4)
+    sm.update(cm, em, 0.5)
+
+    assert ranges == [(0, 4), (4, 8), (8, 10)]
+    positions = cm.get_component_data("Position")
+    assert np.allclose(positions[ids[ids != 3]], 0.5)
+    assert np.allclose(positions[3], 0.0)
+
+
+def test_chunk_rejects_sparse_components(setup_ecs):
+    """
+    Check that sparse components cannot be read by entity range.
+    """
+    em, cm, _ = setup_ecs
+    cm.register_component("Tag", (), np.int8, sparse=True)
+
+    def read_tag(cm, em, dt, chunk):
+        chunk["Tag"]
+
+    sm = SystemManager()
+    sm.register(read_tag, chunk_size=8)
+    with pytest.raises(ValueError):
+        sm.update(cm, em, 0.1)
+
+
+def test_paged_chunks_aligned_to_pages_are_views():
+    """
+    Verify page-aligned chunks over paged storage write in place.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=8)
+    cm.register_component("Heat", (), np.float32)
+    ids = em.create_entities(20)
+    cm.add_components(ids, "Heat", np.zeros(20))
+
+    def warm(cm, em, dt, chunk):
+        chunk["Heat"][:] += 1.0
+
+    sm = SystemManager()
+    sm.register(warm, chunk_size=8)
+    sm.update(cm, em, 0.1)
+    assert np.allclose(cm.get_component_data("Heat")[ids], 1.0)
+
+
+def test_paged_chunks_split_at_page_boundaries():
+    """
+    Ensure chunks never straddle pages, so writes through them are not lost.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=8)
+    cm.register_component("Heat", (), np.float32)
+    ids = em.create_entities(20)
+
+    ranges = [(chunk.start, chunk.stop) for chunk in iter_chunks(cm, em, 6)]
+    assert ranges == [(0, 6), (6, 8), (8, 14), (14, 16), (16, 20)]
+
+    def warm(cm, em, dt, chunk):
+        chunk["Heat"][:] += 1.0
+
+    sm = SystemManager()
+    sm.register(warm, chunk_size=6)
+    sm.update(cm, em, 0.1)
+    assert np.allclose(cm.get_component_data("Heat")[ids], 1.0)
+
+    with pytest.raises(ValueError):
+        Chunk(cm, 4, 12)["Heat"]
+    with pytest.raises(KeyError):
+        Chunk(cm, 0, 8)["Missing"]
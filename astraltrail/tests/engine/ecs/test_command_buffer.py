@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.command_buffer import CommandBuffer
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.system import SystemManager
+
+MAX_ENTITIES = 100
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with a dense 'Position' and sparse 'Velocity' component.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = ComponentManager(max_entities=MAX_ENTITIES)
+
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+
+    return em, cm
+
+
+def test_commands_are_deferred_until_flush(setup_ecs):
+    """
+    Recording commands must not touch the managers.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(3)
+    buffer = CommandBuffer()
+
+    buffer.add(ids, "Velocity", [1.0, 0.0])
+    buffer.destroy(ids[0])
+    pending = buffer.spawn({"Position": [5.0, 5.0]}, n=2)
+
+    assert len(buffer) == 3
+    assert cm.sparse_counts["Velocity"] == 0
+    assert em.is_alive(int(ids[0]))
+    assert pending.ids is None
+
+    buffer.flush(em, cm)
+
+    assert not buffer
+    assert em.live_count == 4
+    assert sorted(cm.get_component_owners("Velocity").tolist()) == ids[1:].tolist()
+    # Spawns run after destroys, so the freed ID is recycled
+    assert pending.ids.tolist() == [0, 3]
+    assert np.allclose(cm.get_component_data("Position")[pending.ids], [5.0, 5.0])
+
+
+def test_adds_are_batched_and_last_write_wins(setup_ecs):
+    """
+    Multiple adds to one component are merged into a single sorted write.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(5)
+    buffer = CommandBuffer()
+
+    for eid in ids[::-1]:
+        buffer.add(eid, "Velocity", [eid, 0.0])
+    buffer.add(ids[2], "Velocity", [99.0, 0.0])
+
+    buffer.flush(em, cm)
+
+    assert cm.get_component_owners("Velocity").tolist() == ids.tolist()
+    assert cm.get_component_data("Velocity")[:, 0].tolist() == [0, 1, 99, 3, 4]
+
+
+def test_changes_to_destroyed_entities_are_dropped(setup_ecs):
+    """
+    Adds and removes aimed at entities destroyed in the same flush are ignored.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(4)
+    cm.add_components(ids, "Velocity", 1.0)
+    buffer = CommandBuffer()
+
+    buffer.destroy(ids[1])
+    buffer.destroy(ids[1])
+    buffer.add(ids[1], "Velocity", [7.0, 7.0])
+    buffer.remove(ids[[1, 2]], "Velocity")
+
+    buffer.flush(em, cm)
+
+    assert em.live_count == 3
+    assert sorted(cm.get_component_owners("Velocity").tolist()) == [0, 3]
+
+
+def test_system_manager_flushes_at_phase_end(setup_ecs):
+    """
+    Systems record into sm.commands; the buffer is applied after the phase runs,
+    so later systems in the same phase still see the old state.
+    """
+    em, cm = setup_ecs
+    sm = SystemManager()
+    seen = []
+
+    def spawner(cm, em, dt):
+        sm.commands.spawn({"Velocity": [1.0, 1.0]}, n=10)
+
+    def observer(cm, em, dt):
+        seen.append(em.live_count)
+
+    sm.register(spawner)
+    sm.register(observer)
+
+    sm.update(cm, em, 0.016)
+    assert seen == [0]
+    assert em.live_count == 10
+    assert cm.sparse_counts["Velocity"] == 10
+
+    sm.update(cm, em, 0.016)
+    assert seen == [0, 10]
+
+
+def test_destroying_dead_entities_is_dropped(setup_ecs):
+    """
+    Destroys recorded for an entity that is already dead must not fail the flush.
+    """
+    em, cm = setup_ecs
+    em.create_entities(3)
+    sm = SystemManager()
+    sm.register(lambda cm, em, dt: sm.commands.destroy([1]), name="destroyer")
+
+    sm.update(cm, em, 0.016)
+    sm.update(cm, em, 0.016)
+    assert not em.is_alive(1)
+    assert em.live_count == 2
+    assert len(sm.commands) == 0
+
+
+def test_failed_flush_empties_the_buffer(setup_ecs):
+    """
+    A command that raises is discarded instead of being replayed by every later flush.
+    """
+    em, cm = setup_ecs
+    buffer = CommandBuffer()
+    buffer.destroy([MAX_ENTITIES + 5])
+    with pytest.raises(ValueError):
+        buffer.flush(em, cm)
+    assert len(buffer) == 0
+    buffer.flush(em, cm)
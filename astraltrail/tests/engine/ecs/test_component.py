@@ -44,8 +44,7 @@ def test_add_sparse_component(setup_ecs):
     cm.add_component(eid, "Velocity", [0.1, -0.2])
     assert cm.has_component(eid, "Velocity")
 
-    data = cm.get_component_data("Velocity")
-    assert np.allclose(data[eid], [0.1, -0.2])
+    assert np.allclose(cm.get_component(eid, "Velocity"), [0.1, -0.2])
     
     # Confirm no leakage to other entities
     other_eid = em.create_entity()
@@ -59,7 +58,45 @@ def test_dynamic_component_registration(setup_ecs):
     cm.register_component("Energy", shape=(1,), dtype=np.float32, sparse=True)
 
     assert "Energy" in cm.components
-    assert cm.components["Energy"].shape == (MAX_ENTITIES, 1)
+    assert cm.get_component_data("Energy").shape == (0, 1)
+
+def test_sparse_storage_scales_with_owners(setup_ecs):
+    """
+    Sparse components should only allocate packed rows for their owners,
+    growing on demand instead of reserving max_entities rows up front.
+    """
+    em, cm = setup_ecs
+    assert len(cm.components["Velocity"]) < MAX_ENTITIES
+
+    ids = [em.create_entity() for _ in range(200)]
+    for eid in ids:
+        cm.add_component(eid, "Velocity", [eid, 0.0])
+
+    assert 200 <= len(cm.components["Velocity"]) < MAX_ENTITIES
+    assert cm.get_component_data("Velocity").shape == (200, 2)
+    assert np.array_equal(cm.get_component_owners("Velocity"), ids)
+
+def test_sparse_swap_remove_keeps_packing(setup_ecs):
+    """
+    Removing a sparse component should swap the last row into the hole so the
+    packed array has no gaps and every owner still maps to its value.
+    """
+    em, cm = setup_ecs
+    ids = [em.create_entity() for _ in range(5)]
+    for eid in ids:
+        cm.add_component(eid, "Velocity", [eid, eid])
+
+    cm.remove_component(ids[1], "Velocity")
+
+    data = cm.get_component_data("Velocity")
+    owners = cm.get_component_owners("Velocity")
+    assert len(data) == 4
+    assert sorted(owners.tolist()) == [0, 2, 3, 4]
+    assert np.allclose(data[:, 0], owners)
+    assert np.array_equal(cm.component_rows("Velocity", owners), np.arange(4))
+
+    with pytest.raises(KeyError):
+        cm.get_component(ids[1], "Velocity")
 
 def test_dense_sparse_behavior(setup_ecs):
     """
@@ -91,7 +128,30 @@ def test_query_entities_with_components(setup_ecs):
     
     # Expect entities 3 and 4 to have both Position and Velocity
     result = cm.query_entities_with(["Position", "Velocity"])
-    assert result == set(ids[3:8])
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, ids[3:8])
+
+def test_query_respects_alive_mask(setup_ecs):
+    """
+    Query results should be ANDed with the EntityManager's alive mask so that
+    only live entities are returned, and be usable for fancy-indexing.
+    """
+    em, cm = setup_ecs
+    ids = [em.create_entity() for _ in range(6)]
+    for eid in ids:
+        cm.add_component(eid, "Velocity", [eid, 0.0])
+
+    em.destroy_entity(ids[2])
+
+    result = cm.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+    assert np.array_equal(result, [0, 1, 3, 4, 5])
+
+    velocities = cm.get_component_data("Velocity")[cm.component_rows("Velocity", result)]
+    assert np.allclose(velocities[:, 0], [0, 1, 3, 4, 5])
+
+    # Dense-only queries cover every live entity
+    dense = cm.query_entities_with(["Position"], alive_mask=em.alive_mask)
+    assert np.array_equal(dense, [0, 1, 3, 4, 5])
 
 def test_overwrite_component_data(setup_ecs):
     """
@@ -126,7 +186,9 @@ def test_mass_component_addition(setup_ecs):
         cm.add_component(eid, "Velocity", [float(i), float(-i)])
     
     velocity_data = cm.get_component_data("Velocity")
-    assert np.allclose(velocity_data[:MAX_ENTITIES, 0], np.arange(MAX_ENTITIES))
+    owners = cm.get_component_owners("Velocity")
+    assert len(velocity_data) == MAX_ENTITIES
+    assert np.allclose(velocity_data[:, 0], owners)
 
 def test_memory_layout_is_soa(setup_ecs):
     """
@@ -170,3 +232,83 @@ def test_can_remove_entity_and_cleanup(setup_ecs):
 
     # Dense component still exists
     assert cm.has_component(eid, "Position")
+
+def test_bulk_cleanup_entities(setup_ecs):
+    """
+    cleanup_entities should remove sparse components for many entities at once
+    and leave the packed storage consistent for the survivors.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(20)
+    for eid in ids:
+        cm.add_component(int(eid), "Velocity", [eid, -eid])
+
+    doomed = ids[[0, 3, 4, 17, 19]]
+    em.destroy_entities(doomed)
+    cm.cleanup_entities(doomed)
+
+    owners = cm.get_component_owners("Velocity")
+    survivors = np.setdiff1d(ids, doomed)
+    assert np.array_equal(np.sort(owners), survivors)
+    assert np.allclose(cm.get_component_data("Velocity")[:, 0], owners)
+    assert np.array_equal(cm.component_rows("Velocity", owners), np.arange(len(owners)))
+    for eid in doomed:
+        assert not cm.has_component(int(eid), "Velocity")
+
+def test_bulk_add_components(setup_ecs):
+    """
+    add_components should write dense and sparse components for many entities at once,
+    broadcasting a single value or taking one value per entity.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(10)
+
+    cm.add_components(ids, "Position", [3.0, 4.0])
+    assert np.allclose(cm.get_component_data("Position")[ids], [3.0, 4.0])
+
+    cm.add_component(int(ids[2]), "Velocity", [9.0, 9.0])
+    per_entity = np.stack([ids, -ids], axis=1).astype(np.float32)
+    cm.add_components(ids[::2], "Velocity", per_entity[::2])
+
+    assert cm.sparse_counts["Velocity"] == 5
+    for eid in ids[::2]:
+        assert np.allclose(cm.get_component(int(eid), "Velocity"), [eid, -eid])
+    assert not cm.has_component(int(ids[1]), "Velocity")
+
+def test_bulk_add_rejects_duplicate_new_owners(setup_ecs):
+    """
+    Passing the same new owner twice would corrupt the packed set and should raise.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(3)
+
+    with pytest.raises(ValueError):
+        cm.add_components([ids[0], ids[0]], "Velocity", [1.0, 1.0])
+
+def test_compact_permutes_component_data(setup_ecs):
+    """
+    Compaction should move dense and sparse data along with their entities,
+    drop data of dead entities and renumber sparse owners.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(10)
+    cm.add_components(ids, "Position", np.stack([ids, ids], axis=1))
+    cm.add_components(ids[::2], "Velocity", np.stack([ids[::2], -ids[::2]], axis=1))
+    view = cm.register_query(["Position", "Velocity"], em=em)
+
+    doomed = [1, 2, 5, 8]
+    em.destroy_entities(doomed)
+    remap = em.compact()
+    cm.compact(remap)
+
+    survivors = np.setdiff1d(ids, doomed)
+    live = em.live_count
+    assert np.allclose(cm.get_component_data("Position")[:live, 0], survivors)
+    assert np.allclose(cm.get_component_data("Position")[live:], 0.0)
+
+    owners = cm.get_component_owners("Velocity")
+    assert owners.tolist() == remap[[0, 4, 6]].tolist()
+    assert np.allclose(cm.get_component_data("Velocity")[:, 0], [0, 4, 6])
+    assert not cm.has_component(int(remap[3]), "Velocity")
+
+    assert sorted(view.ids.tolist()) == owners.tolist()
@@ -1,6 +1,11 @@
 import pytest
 import numpy as np
-from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.entity import (
+    NULL_HANDLE,
+    EntityManager,
+    pack_handles,
+    unpack_handles,
+)
 
 
 def test_entity_creation_and_alive_status():
@@ -83,3 +88,171 @@ def test_recycling_multiple_ids_in_lifo_order():
 
     assert reused1 == eid3
     assert reused2 == eid2
+
+
+def test_observers_receive_lifecycle_events():
+    """Observers should be notified on creation, destruction and reset."""
+    events = []
+
+    class Recorder:
+        def on_entity_created(self, eid): events.append(("created", eid))
+        def on_entity_destroyed(self, eid): events.append(("destroyed", eid))
+        def on_reset(self): events.append(("reset", None))
+
+    em = EntityManager(max_entities=5)
+    recorder = Recorder()
+    em.add_observer(recorder)
+
+    eid = em.create_entity()
+    em.destroy_entity(eid)
+    em.reset()
+    em.remove_observer(recorder)
+    em.create_entity()
+
+    assert events == [("created", eid), ("destroyed", eid), ("reset", None)]
+
+
+def test_bulk_create_matches_single_creation_order():
+    """create_entities should pop recycled IDs LIFO, then take fresh IDs."""
+    em = EntityManager(max_entities=10)
+    first = em.create_entities(4)
+    assert isinstance(first, np.ndarray)
+    assert first.tolist() == [0, 1, 2, 3]
+    assert em.alive_mask[:4].all()
+
+    em.destroy_entity(1)
+    em.destroy_entity(3)
+
+    ids = em.create_entities(3)
+    assert ids.tolist() == [3, 1, 4]
+    assert em.free_count == 0
+    assert em.next_id == 5
+
+
+def test_bulk_create_over_capacity_is_atomic():
+    """Asking for more IDs than available should raise without allocating any."""
+    em = EntityManager(max_entities=5)
+    em.create_entities(3)
+
+    with pytest.raises(RuntimeError):
+        em.create_entities(3)
+
+    assert em.next_id == 3
+    assert em.create_entities(2).tolist() == [3, 4]
+
+
+def test_bulk_destroy_recycles_ids():
+    """destroy_entities should clear alive flags and push all IDs onto the freelist."""
+    em = EntityManager(max_entities=10)
+    ids = em.create_entities(6)
+
+    em.destroy_entities(ids[::2])
+
+    assert not em.alive_mask[ids[::2]].any()
+    assert em.alive_mask[ids[1::2]].all()
+    assert em.free_count == 3
+
+    # Most recently pushed ID comes back first
+    assert em.create_entity() == ids[4]
+
+
+def test_bulk_destroy_rejects_invalid_ids():
+    """Dead, duplicate or out-of-range IDs should raise before anything is destroyed."""
+    em = EntityManager(max_entities=5)
+    ids = em.create_entities(3)
+    em.destroy_entity(int(ids[0]))
+
+    with pytest.raises(ValueError):
+        em.destroy_entities(ids)
+    with pytest.raises(ValueError):
+        em.destroy_entities([1, 1])
+    with pytest.raises(ValueError):
+        em.destroy_entities([7])
+
+    assert em.alive_mask[ids[1:]].all()
+
+
+def test_handles_pack_index_and_generation():
+    """Handles should round-trip through pack/unpack."""
+    handles = pack_handles([3, 7], [1, 2**32 - 1])
+    assert handles.dtype == np.uint64
+
+    indices, generations = unpack_handles(handles)
+    assert indices.tolist() == [3, 7]
+    assert generations.tolist() == [1, 2**32 - 1]
+
+
+def test_recycled_slot_invalidates_old_handle():
+    """A handle to a destroyed entity must not validate after its slot is reused."""
+    em = EntityManager(max_entities=5)
+    eid = em.create_entity()
+    old = em.handle(eid)
+    assert em.is_valid(old)
+
+    em.destroy_entity(eid)
+    reused = em.create_entity()
+    assert reused == eid
+
+    assert not em.is_valid(old)
+    assert em.is_valid(em.handle(reused))
+
+
+def test_validate_whole_array_of_handles():
+    """validate() and resolve() should check a batch of handles in one call."""
+    em = EntityManager(max_entities=10)
+    ids = em.create_entities(6)
+    handles = em.handles(ids)
+
+    em.destroy_entities(ids[[1, 4]])
+    em.create_entities(2)  # recycle both slots
+
+    stored = np.append(handles, NULL_HANDLE)
+    valid = em.validate(stored)
+    assert valid.tolist() == [True, False, True, True, False, True, False]
+    assert em.resolve(stored).tolist() == [0, -1, 2, 3, -1, 5, -1]
+
+
+def test_reset_invalidates_handles():
+    """Resetting the manager should make every outstanding handle stale."""
+    em = EntityManager(max_entities=5)
+    handles = em.handles(em.create_entities(3))
+
+    em.reset()
+    em.create_entities(3)
+
+    assert not em.validate(handles).any()
+
+
+def test_compact_moves_live_entities_to_prefix():
+    """compact() should pack live IDs into [0, live_count) and return a remap table."""
+    em = EntityManager(max_entities=10)
+    ids = em.create_entities(8)
+    em.destroy_entities([0, 2, 3, 6])
+
+    remap = em.compact()
+
+    assert em.live_count == 4
+    assert em.next_id == 4
+    assert em.free_count == 0
+    assert em.alive_mask[:4].all() and not em.alive_mask[4:].any()
+    assert remap[ids].tolist() == [-1, 0, -1, -1, 1, 2, -1, 3]
+
+    # New entities continue after the compacted prefix
+    assert em.create_entity() == 4
+
+
+def test_compact_invalidates_moved_handles():
+    """Handles to moved entities go stale; rebuilt handles through the remap validate."""
+    em = EntityManager(max_entities=10)
+    ids = em.create_entities(4)
+    handles = em.handles(ids)
+    em.destroy_entity(1)
+
+    remap = em.compact()
+
+    assert em.validate(handles).tolist() == [True, False, False, False]
+    assert em.validate(em.handles(remap[ids[[0, 2, 3]]])).all()
+
+    # The vacated tail slot must not revive its old handle when reused
+    em.create_entity()
+    assert not em.is_valid(int(handles[3]))
@@ -0,0 +1,125 @@
+import json
+
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.schema import ComponentSchema
+from astraltrail.src.engine.ecs.introspect import (
+    component_stats,
+    dump_json,
+    entity_stats,
+    memory_report,
+)
+
+MAX_ENTITIES = 100
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Create a world with a dense and a sparse component and some destroyed entities.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (3,), np.float32, track_changes=True)
+    cm.register_component("Tag", (), np.int8, sparse=True)
+    ids = em.create_entities(20)
+    cm.add_components(ids[:5], "Tag", 1)
+    for eid in ids[10:15]:
+        em.destroy_entity(int(eid))
+    return em, cm
+
+
+def test_component_stats(setup_ecs):
+    """
+    Verify byte counts, live rows, occupancy and owner counts per component.
+    """
+    em, cm = setup_ecs
+    stats = component_stats(cm, em)
+
+    position = stats["Position"]
+    assert position["storage"] == "dense"
+    assert position["data_nbytes"] == MAX_ENTITIES * 3 * 4
+    assert position["overhead_nbytes"] == MAX_ENTITIES * 4
+    assert position["live_rows"] == 15
+    assert position["occupancy"] == pytest.approx(0.15)
+    assert position["owners"] is None
+    assert position["live_rows_exact"] is False
+
+    tag = stats["Tag"]
+    assert tag["storage"] == "sparse"
+    assert tag["owners"] == tag["live_rows"] == 5
+    assert tag["live_rows_exact"] is True
+    assert tag["occupancy"] == pytest.approx(5 / tag["rows"])
+    assert tag["nbytes"] == tag["data_nbytes"] + tag["overhead_nbytes"]
+
+
+def test_entity_stats(setup_ecs):
+    """
+    Ensure free-list depth and fragmentation reflect the destroyed entities.
+    """
+    em, _ = setup_ecs
+    stats = entity_stats(em)
+    assert stats["live"] == 15
+    assert stats["free_list_depth"] == 5
+    assert stats["fragmentation"] == pytest.approx(5 / 20)
+
+    em.compact()
+    assert entity_stats(em)["fragmentation"] == 0.0
+
+
+def test_paged_components_count_allocated_pages():
+    """
+    Check paged storage reports only its allocated pages.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=16)
+    cm.register_component("Heat", (), np.float64)
+    cm.add_components(em.create_entities(20), "Heat", 1.0)
+
+    heat = component_stats(cm, em)["Heat"]
+    assert heat["storage"] == "paged"
+    assert heat["rows"] == 32
+    assert heat["data_nbytes"] == 32 * 8
+
+
+def test_memory_report_and_json(setup_ecs, tmp_path):
+    """
+    Verify totals, top consumer ordering and JSON output.
+    """
+    em, cm = setup_ecs
+    report = memory_report(em, cm, top=2)
+
+    assert len(report["top_consumers"]) == 2
+    sizes = [entry["nbytes"] for entry in report["top_consumers"]]
+    assert sizes == sorted(sizes, reverse=True)
+    assert report["top_consumers"][0]["name"] == "Position"
+    assert report["total_nbytes"] == report["entities"]["nbytes"] + sum(
+        stats["nbytes"] for stats in report["components"].values()
+    )
+
+    path = tmp_path / "memory.json"
+    text = dump_json(report, path)
+    assert json.loads(path.read_text()) == json.loads(text) == report
+
+
+def test_soa_columns_roll_up_under_schema(setup_ecs):
+    """
+    Ensure SoA field columns are reported inside their schema entry, not as consumers.
+    """
+    em, cm = setup_ecs
+    schema = ComponentSchema({"mass": np.float64, "flags": np.uint8}, layout="soa")
+    cm.register_schema("Body", schema)
+    report = memory_report(em, cm, top=10)
+
+    body = report["components"]["Body"]
+    assert set(body["columns"]) == {"Body.mass", "Body.flags"}
+    assert body["data_nbytes"] >= MAX_ENTITIES * (8 + 1)
+    assert body["nbytes"] == body["data_nbytes"] + body["overhead_nbytes"]
+    assert not any("." in name for name in report["components"])
+    assert not any("." in entry["name"] for entry in report["top_consumers"])
+    assert report["total_nbytes"] == report["entities"]["nbytes"] + sum(
+        stats["nbytes"] for stats in report["components"].values()
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from astraltrail.src.engine.ecs.loop import FixedStepLoop
+from astraltrail.src.engine.ecs.system import SystemManager
+
+STEP = 0.25
+
+
+@pytest.fixture
+def setup_loop():
+    """
+    Create a loop whose systems log (phase, dt) for every call.
+    """
+    calls = []
+    sm = SystemManager()
+    for phase in ("pre", "update", "render"):
+        sm.register(
+            lambda cm, em, dt, phase=phase: calls.append((phase, dt)), name=phase, phase=phase
+        )
+    loop = FixedStepLoop(sm, None, None, step=STEP, max_steps=3, sim_phases=("pre", "update"))
+    return loop, calls
+
+
+def test_fixed_steps_and_alpha(setup_loop):
+    """
+    Verify frame time is consumed in fixed steps and the remainder becomes the render alpha.
+    """
+    loop, calls = setup_loop
+
+    assert loop.advance(0.6) == 2
+    assert calls == [
+        ("pre", STEP),
+        ("update", STEP),
+        ("pre", STEP),
+        ("update", STEP),
+        ("render", pytest.approx(0.4)),
+    ]
+    assert loop.alpha == pytest.approx(0.4)
+
+    calls.clear()
+    assert loop.advance(0.2) == 1
+    assert calls[-1] == ("render", pytest.approx(0.2))
+    assert loop.sim_time == pytest.approx(0.75)
+
+
+def test_catch_up_is_capped(setup_loop):
+    """
+    Ensure a long frame runs at most max_steps steps and drops the backlog.
+    """
+    loop, _ = setup_loop
+
+    assert loop.advance(2.1) == 3
+    assert loop.dropped_time == pytest.approx(1.25)
+    assert loop.accumulator == pytest.approx(0.1)
+    assert loop.advance(0.0) == 0
+
+
+def test_run_headless_skips_render(setup_loop):
+    """
+    Check that headless runs simulate exact step counts without the render phase.
+    """
+    loop, calls = setup_loop
+    loop.run_headless(4)
+
+    assert loop.steps == 4
+    assert all(phase != "render" for phase, _ in calls)
+    assert len(calls) == 8
+
+
+def test_tick_uses_clock(setup_loop):
+    """
+    Verify tick() measures frame time with the injected clock.
+    """
+    loop, _ = setup_loop
+    now = [10.0]
+    loop.clock = lambda: now[0]
+
+    assert loop.tick() == 0
+    now[0] += 0.5
+    assert loop.tick() == 2
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.component import create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.paged import PagedArray
+from astraltrail.src.engine.ecs.prefab import Prefab
+
+MAX_ENTITIES = 1000
+PAGE_SIZE = 64
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with paged dense storage for 'Position' and a sparse 'Velocity'.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=PAGE_SIZE)
+
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+
+    return em, cm
+
+
+def test_pages_allocated_on_demand():
+    """
+    A paged array starts empty and only allocates the pages that are touched.
+    """
+    arr = PagedArray(1000, (3,), np.float32, page_size=100)
+    assert arr.capacity == 0
+    assert arr.nbytes == 0
+
+    arr[250] = [1, 2, 3]
+    assert arr.capacity == 300
+    assert np.allclose(arr[250], [1, 2, 3])
+
+    with pytest.raises(IndexError):
+        arr[1000] = 0
+
+
+def test_existing_pages_never_move():
+    """
+    Growing the array must not reallocate pages, so held views stay valid.
+    """
+    arr = PagedArray(1000, (), np.int32, page_size=10)
+    arr[0] = 1
+    first_page = next(arr.iter_pages())[2]
+
+    arr[999] = 2
+    first_page[5] = 7
+
+    assert arr[5] == 7
+    assert len(arr.pages) == 100
+
+
+def test_reads_do_not_allocate():
+    """
+    Reading untouched rows returns zeros without committing pages.
+    """
+    arr = PagedArray(1000, (3,), np.float32, page_size=100)
+
+    assert np.allclose(arr[450], 0)
+    assert np.allclose(arr[100:150], 0)
+    assert np.allclose(arr[[5, 950]], 0)
+    assert arr.nbytes == 0
+
+    with pytest.raises(ValueError):
+        arr[450][0] = 1.0
+    arr[450] = [1, 2, 3]
+    assert arr.capacity == 500
+
+
+def test_cross_page_slices_are_copies():
+    """
+    Slices within one allocated page are views; slices across pages are copies,
+    and slice assignment writes through either way.
+    """
+    arr = PagedArray(100, (), np.float32, page_size=10)
+    arr.grow_to(100)
+
+    arr[2:10][:] = 1.0
+    assert arr[5] == 1.0
+
+    arr[8:12][:] = 2.0
+    assert arr[9] == 1.0 and arr[10] == 0.0
+
+    arr[8:12] += 2.0
+    assert np.allclose(arr[8:12], [3.0, 3.0, 2.0, 2.0])
+
+
+def test_gather_scatter_across_pages():
+    """
+    Fancy indexing, masks and in-place updates should span page boundaries.
+    """
+    arr = PagedArray(50, (2,), np.float32, page_size=8)
+    ids = np.array([45, 3, 17, 8, 7])
+
+    arr[ids] = np.stack([ids, ids], axis=1)
+    arr[ids] += 1.0
+    assert np.allclose(arr[ids][:, 0], ids + 1)
+
+    mask = np.zeros(50, dtype=bool)
+    mask[[7, 8]] = True
+    assert np.allclose(arr[mask][:, 1], [8, 9])
+
+    arr[ids, 1] = 0.0
+    assert np.allclose(arr[ids][:, 1], 0.0)
+    assert np.allclose(np.asarray(arr)[17], [18, 0])
+
+
+def test_paged_component_manager_roundtrip(setup_ecs):
+    """
+    The paged mode supports the same component API as contiguous storage.
+    """
+    em, cm = setup_ecs
+    ids = Prefab("Mover", {"Position": [1.0, 2.0], "Velocity": [0.5, 0.5]}).spawn(em, cm, 200)
+
+    positions = cm.get_component_data("Position")
+    assert isinstance(positions, PagedArray)
+    assert positions.capacity == 256
+
+    result = cm.query_entities_with(["Position", "Velocity"], alive_mask=em.alive_mask)
+    positions[result] += cm.get_component_data("Velocity")[cm.component_rows("Velocity", result)]
+
+    assert np.allclose(cm.get_component(int(ids[150]), "Position"), [1.5, 2.5])
+
+
+def test_iterate_component_page_by_page(setup_ecs):
+    """
+    iter_pages should cover all allocated rows with zero-copy page views.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(130)
+    cm.add_components(ids, "Position", [1.0, 1.0])
+
+    blocks = list(cm.iter_pages("Position"))
+    assert [(start, stop) for start, stop, _ in blocks] == [(0, 64), (64, 128), (128, 192)]
+
+    for start, stop, page in blocks:
+        page += 1.0
+    assert np.allclose(cm.get_component(129, "Position"), [2.0, 2.0])
+
+
+def test_iterate_contiguous_components_in_blocks():
+    """
+    Contiguous and sparse components can be walked in fixed-size blocks too.
+    """
+    cm = create_component_manager(100)
+    cm.register_component("Mass", shape=(), dtype=np.float32)
+
+    blocks = [(start, stop) for start, stop, _ in cm.iter_pages("Mass", page_size=40)]
+    assert blocks == [(0, 40), (40, 80), (80, 100)]
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.prefab import Prefab
+
+MAX_ENTITIES = 1000
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with a dense 'Position' and sparse 'Velocity' and 'Health' components.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = ComponentManager(max_entities=MAX_ENTITIES)
+
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+    cm.register_component("Health", shape=(1,), dtype=np.float32, sparse=True)
+
+    return em, cm
+
+
+def test_spawn_instances(setup_ecs):
+    """
+    Spawning should create fresh entities carrying every prefab component.
+    """
+    em, cm = setup_ecs
+    bullet = Prefab("Bullet", {"Velocity": [0.0, 10.0]})
+
+    ids = bullet.spawn(em, cm, 250)
+
+    assert len(ids) == 250
+    assert em.alive_mask[ids].all()
+    assert np.array_equal(np.sort(cm.get_component_owners("Velocity")), ids)
+    assert np.allclose(cm.get_component_data("Velocity"), [0.0, 10.0])
+
+
+def test_spawn_with_per_instance_overrides(setup_ecs):
+    """
+    Overrides supply per-instance values on top of the prefab defaults.
+    """
+    em, cm = setup_ecs
+    grunt = Prefab("Grunt", {"Health": [100.0], "Position": [0.0, 0.0]})
+
+    points = np.arange(20, dtype=np.float32).reshape(10, 2)
+    ids = grunt.spawn(em, cm, 10, overrides={"Position": points})
+
+    assert np.allclose(cm.get_component_data("Position")[ids], points)
+    assert np.allclose(cm.get_component_data("Health"), 100.0)
+
+
+def test_variant_inherits_values(setup_ecs):
+    """
+    Variants copy the parent's values and may replace or extend them.
+    """
+    em, cm = setup_ecs
+    grunt = Prefab("Grunt", {"Health": [100.0]})
+    brute = grunt.variant("Brute", {"Health": [400.0], "Velocity": [1.0, 0.0]})
+
+    ids = brute.spawn(em, cm, 3)
+
+    assert set(grunt.values) == {"Health"}
+    assert np.allclose(cm.get_component(int(ids[0]), "Health"), 400.0)
+    assert cm.has_component(int(ids[0]), "Velocity")
+
+
+def test_failed_spawn_leaves_no_entities(setup_ecs):
+    """
+    A spawn whose component values cannot be written destroys the entities it created.
+    """
+    em, cm = setup_ecs
+    prefab = Prefab("Broken", {"Velocity": [1.0, 0.0], "Health": [5.0]})
+
+    with pytest.raises(KeyError):
+        prefab.spawn(em, cm, 4, overrides={"Missing": 1.0})
+    with pytest.raises(ValueError):
+        prefab.spawn(em, cm, 4, overrides={"Health": np.ones((3, 1))})
+
+    assert em.live_count == 0
+    assert cm.get_component_owners("Velocity").size == 0
+    assert cm.get_component_owners("Health").size == 0
+
+
+def test_spawn_into_archetype_storage():
+    """
+    Prefabs spawn directly into their archetype table in archetype storage mode.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="archetype")
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32)
+
+    ids = Prefab("Mover", {"Position": [1.0, 1.0], "Velocity": [0.5, 0.0]}).spawn(em, cm, 50)
+
+    tables = cm.query_tables(["Position", "Velocity"])
+    assert len(tables) == 1
+    assert tables[0].count == 50
+    assert np.allclose(cm.get_component(int(ids[7]), "Velocity"), [0.5, 0.0])
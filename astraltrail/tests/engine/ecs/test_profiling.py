@@ -0,0 +1,91 @@
+import json
+import time
+
+from astraltrail.src.engine.ecs.profiling import SystemProfiler
+from astraltrail.src.engine.ecs.system import SystemManager
+
+
+def sleepy(cm, em, dt):
+    time.sleep(0.002)
+
+
+def quick(cm, em, dt):
+    pass
+
+
+def test_profiling_disabled_by_default():
+    """
+    Ensure no profiler is attached until profiling is enabled.
+    """
+    sm = SystemManager()
+    sm.register(quick)
+    sm.update(None, None, 0.1)
+    assert sm.profiler is None
+
+
+def test_profiler_records_calls_and_percentiles():
+    """
+    Verify call counts, totals and percentiles are recorded per system.
+    """
+    sm = SystemManager()
+    sm.register(sleepy)
+    sm.register(quick)
+    profiler = sm.enable_profiling()
+
+    for _ in range(5):
+        sm.update(None, None, 0.1)
+
+    summary = profiler.summary()
+    assert list(summary) == ["sleepy", "quick"]
+    assert summary["sleepy"]["calls"] == 5
+    assert summary["sleepy"]["p50_ms"] >= 2.0
+    assert summary["sleepy"]["p50_ms"] <= summary["sleepy"]["p99_ms"]
+    assert profiler.phase_calls == {"update": 5}
+    assert profiler.phase_totals["update"] >= summary["sleepy"]["total_ms"] / 1e3
+
+
+def test_disable_profiling_stops_recording():
+    """
+    Ensure disabling detaches the profiler and keeps its data.
+    """
+    sm = SystemManager()
+    sm.register(quick)
+    profiler = sm.enable_profiling()
+    sm.update(None, None, 0.1)
+    sm.disable_profiling()
+    sm.update(None, None, 0.1)
+    assert profiler.stats["quick"].calls == 1
+
+
+def test_parallel_systems_are_profiled():
+    """
+    Verify systems run on the thread pool are also recorded.
+    """
+    sm = SystemManager(workers=2)
+    sm.register(sleepy, reads=["A"])
+    sm.register(quick, reads=["A"])
+    profiler = sm.enable_profiling()
+    sm.update(None, None, 0.1)
+    sm.shutdown()
+    assert profiler.stats["sleepy"].calls == 1
+    assert profiler.stats["quick"].calls == 1
+
+
+def test_chrome_trace_export(tmp_path):
+    """
+    Check the exported trace is valid Chrome trace JSON with system and phase events.
+    """
+    sm = SystemManager()
+    sm.register(quick, phase="pre")
+    profiler = sm.enable_profiling(SystemProfiler(window=8))
+    sm.update(None, None, 0.1, phase="pre")
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(path)
+    data = json.loads(path.read_text())
+
+    names = {event["name"] for event in data["traceEvents"]}
+    assert names == {"quick", "phase:pre"}
+    for event in data["traceEvents"]:
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
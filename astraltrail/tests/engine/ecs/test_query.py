@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.entity import EntityManager
+
+MAX_ENTITIES = 100
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with a dense 'Position' and sparse 'Velocity' and 'Target' components.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = ComponentManager(max_entities=MAX_ENTITIES)
+
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32, sparse=True)
+    cm.register_component("Target", shape=(1,), dtype=np.int32, sparse=True)
+
+    return em, cm
+
+
+def assert_matches_query(view, cm, em):
+    """The cached view must always agree with a from-scratch query."""
+    expected = cm.query_entities_with(list(view.component_names), alive_mask=em.alive_mask)
+    assert np.array_equal(np.sort(view.ids), expected)
+
+
+def test_view_reflects_existing_state(setup_ecs):
+    """
+    A freshly registered view should contain entities that already match.
+    """
+    em, cm = setup_ecs
+    ids = [em.create_entity() for _ in range(5)]
+    cm.add_component(ids[1], "Velocity", [1, 1])
+    cm.add_component(ids[3], "Velocity", [1, 1])
+
+    view = cm.register_query(["Position", "Velocity"], em=em)
+
+    assert sorted(view.ids.tolist()) == [ids[1], ids[3]]
+    assert len(view) == 2
+
+
+def test_register_query_returns_same_view(setup_ecs):
+    """
+    Registering an identical query twice should reuse the view.
+    """
+    em, cm = setup_ecs
+    assert cm.register_query(["Velocity"], em=em) is cm.register_query(["Velocity"], em=em)
+
+
+def test_view_patched_by_component_changes(setup_ecs):
+    """
+    add_component / remove_component / cleanup_entity should patch the view incrementally.
+    """
+    em, cm = setup_ecs
+    view = cm.register_query(["Velocity", "Target"], em=em)
+    ids = [em.create_entity() for _ in range(6)]
+
+    for eid in ids:
+        cm.add_component(eid, "Velocity", [0, 0])
+    assert len(view) == 0
+
+    for eid in ids[::2]:
+        cm.add_component(eid, "Target", [eid])
+    assert_matches_query(view, cm, em)
+
+    cm.remove_component(ids[2], "Velocity")
+    assert ids[2] not in view
+    assert_matches_query(view, cm, em)
+
+    cm.cleanup_entity(ids[4])
+    assert ids[4] not in view
+    assert_matches_query(view, cm, em)
+
+
+def test_view_follows_entity_lifecycle(setup_ecs):
+    """
+    Views registered with an EntityManager track creation and destruction.
+    """
+    em, cm = setup_ecs
+    dense_view = cm.register_query(["Position"], em=em)
+    sparse_view = cm.register_query(["Position", "Velocity"], em=em)
+
+    ids = [em.create_entity() for _ in range(4)]
+    for eid in ids:
+        cm.add_component(eid, "Velocity", [1, 0])
+    assert sorted(dense_view.ids.tolist()) == ids
+
+    em.destroy_entity(ids[1])
+    assert ids[1] not in dense_view
+    assert ids[1] not in sparse_view
+    assert_matches_query(dense_view, cm, em)
+    assert_matches_query(sparse_view, cm, em)
+
+    em.reset()
+    assert len(dense_view) == 0
+    assert len(sparse_view) == 0
+
+
+def test_view_ids_are_fancy_indexable(setup_ecs):
+    """
+    View IDs are a contiguous array that can index component arrays via their rows.
+    """
+    em, cm = setup_ecs
+    view = cm.register_query(["Velocity"], em=em)
+    for i in range(10):
+        eid = em.create_entity()
+        cm.add_component(eid, "Velocity", [i, 0])
+
+    velocities = cm.get_component_data("Velocity")[cm.component_rows("Velocity", view.ids)]
+    assert velocities.shape == (10, 2)
+    assert sorted(velocities[:, 0].tolist()) == list(range(10))
+
+
+def test_unregister_query_stops_updates(setup_ecs):
+    """
+    Unregistered views are no longer patched.
+    """
+    em, cm = setup_ecs
+    view = cm.register_query(["Velocity"], em=em)
+    cm.unregister_query(view)
+
+    eid = em.create_entity()
+    cm.add_component(eid, "Velocity", [1, 1])
+
+    assert len(view) == 0
+    assert view not in em.observers
+
+
+def test_view_follows_bulk_operations(setup_ecs):
+    """
+    Bulk entity creation/destruction and cleanup should patch views in one pass.
+    """
+    em, cm = setup_ecs
+    dense_view = cm.register_query(["Position"], em=em)
+    sparse_view = cm.register_query(["Velocity"], em=em)
+
+    ids = em.create_entities(30)
+    for eid in ids[::3]:
+        cm.add_component(int(eid), "Velocity", [1, 1])
+    assert len(dense_view) == 30
+    assert len(sparse_view) == 10
+
+    doomed = ids[5:20]
+    em.destroy_entities(doomed)
+    cm.cleanup_entities(doomed)
+
+    assert_matches_query(dense_view, cm, em)
+    assert_matches_query(sparse_view, cm, em)
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.loop import FixedStepLoop
+from astraltrail.src.engine.ecs.replay import (
+    InputLog,
+    InputRecorder,
+    InputState,
+    ReplayDriver,
+    state_checksum,
+)
+from astraltrail.src.engine.ecs.system import SystemManager
+
+MAX_ENTITIES = 16
+STEP = 1 / 60
+
+
+def make_world(state):
+    """
+    Build a world whose single system moves a camera entity from the input state.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (3,), np.float32)
+    camera = em.create_entity()
+
+    def move_camera(cm, em, dt):
+        step = np.array(
+            [
+                state.down("D") - state.down("A"),
+                state.axis("mouse_dy"),
+                state.down("W") - state.down("S"),
+            ],
+            dtype=np.float32,
+        )
+        cm.get_component_data("Position")[camera] += step * dt
+
+    sm = SystemManager()
+    sm.register(move_camera)
+    return em, cm, sm
+
+
+def new_state():
+    return InputState(buttons=["W", "A", "S", "D"], axes=["mouse_dx", "mouse_dy"])
+
+
+def test_recorded_session_replays_identically(tmp_path):
+    """
+    Verify replaying a recorded log headlessly reproduces the exact final state.
+    """
+    path = tmp_path / "session.atin"
+    live_state = new_state()
+    em, cm, sm = make_world(live_state)
+    recorder = InputRecorder(path, live_state, step=STEP)
+    sm.register(lambda cm, em, dt: recorder.record(), name="record_input", phase="pre")
+    loop = FixedStepLoop(sm, cm, em, step=STEP)
+
+    rng = np.random.default_rng(1)
+    for frame in range(30):
+        live_state.set_button("W", frame % 3 != 0)
+        live_state.set_button("A", frame % 5 == 0)
+        live_state.set_axis("mouse_dy", float(rng.normal()))
+        loop.advance(float(rng.uniform(0.0, 0.05)))
+    recorder.close()
+    live = state_checksum(em, cm)
+
+    replay_state = new_state()
+    em2, cm2, sm2 = make_world(replay_state)
+    driver = ReplayDriver(path, FixedStepLoop(sm2, cm2, em2, step=STEP), replay_state)
+    assert driver.run() == recorder.ticks == loop.steps
+    assert state_checksum(em2, cm2) == live
+
+
+def test_log_is_compact_and_tolerates_truncation(tmp_path):
+    """
+    Ensure records are fixed-size and a partial trailing record is ignored.
+    """
+    path = tmp_path / "session.atin"
+    state = new_state()
+    with InputRecorder(path, state, step=STEP) as recorder:
+        for i in range(4):
+            state.set_button("S", i % 2 == 1)
+            recorder.record()
+
+    data = path.read_bytes()
+    path.write_bytes(data + b"\x01\x02\x03")
+    log = InputLog(path)
+    assert len(log) == 4
+    assert log.frames.dtype.itemsize == 8 + 8 + 2 * 4
+    assert list(log.frames["tick"]) == [0, 1, 2, 3]
+
+    log.apply(1, state)
+    assert state.down("S") and not state.down("W")
+
+
+def test_mismatched_replay_is_rejected(tmp_path):
+    """
+    Check the driver refuses logs recorded with other inputs or timesteps.
+    """
+    path = tmp_path / "session.atin"
+    InputRecorder(path, new_state(), step=STEP).close()
+
+    state = new_state()
+    em, cm, sm = make_world(state)
+    with pytest.raises(ValueError):
+        ReplayDriver(path, FixedStepLoop(sm, cm, em, step=1 / 30), state)
+    with pytest.raises(ValueError):
+        ReplayDriver(path, FixedStepLoop(sm, cm, em, step=STEP), InputState(buttons=["W"]))
+
+
+def test_log_with_dropped_records_is_rejected(tmp_path):
+    """
+    Verify a log missing a record fails before replay instead of silently desyncing.
+    """
+    path = tmp_path / "session.atin"
+    state = new_state()
+    with InputRecorder(path, state, step=STEP) as recorder:
+        for _ in range(5):
+            recorder.record()
+
+    log = InputLog(path)
+    log.frames = np.delete(log.frames, 2)
+    em, cm, sm = make_world(state)
+    with pytest.raises(ValueError, match="frame 2"):
+        ReplayDriver(log, FixedStepLoop(sm, cm, em, step=STEP), state)
@@ -0,0 +1,203 @@
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.rewind import RewindBuffer
+
+MAX_ENTITIES = 128
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Create a world with a tracked dense Position, a sparse Tag and a query view.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (2,), np.float32, track_changes=True)
+    cm.register_component("Tag", (), np.int32, sparse=True)
+    view = cm.register_query(["Position", "Tag"], em=em)
+    ids = em.create_entities(8)
+    cm.add_components(ids, "Position", 0.0)
+    return em, cm, view
+
+
+def step(em, cm):
+    """Advance the world: move everything, churn entities and tags."""
+    cm.get_component_data("Position")[: em.next_id] += 1.0
+    cm.mark_changed(np.arange(em.next_id), "Position")
+    eid = em.create_entity()
+    cm.add_component(eid, "Tag", cm.tick)
+    if cm.tick % 3 == 0:
+        victim = int(np.flatnonzero(em.alive_mask)[0])
+        em.destroy_entity(victim)
+        cm.cleanup_entity(victim)
+    cm.advance_tick()
+
+
+def capture(em, cm, view):
+    """Return a comparable summary of the world state."""
+    return (
+        cm.tick,
+        em.next_id,
+        em.alive_mask.copy(),
+        em.generations.copy(),
+        cm.get_component_data("Position")[: em.next_id].copy(),
+        dict(zip(cm.get_component_owners("Tag").tolist(), cm.get_component_data("Tag").tolist())),
+        sorted(view.ids.tolist()),
+    )
+
+
+def assert_same(a, b):
+    """Compare two captured states."""
+    assert a[0] == b[0] and a[1] == b[1]
+    assert np.array_equal(a[2], b[2]) and np.array_equal(a[3], b[3])
+    assert np.array_equal(a[4], b[4])
+    assert a[5] == b[5] and a[6] == b[6]
+
+
+def test_rewind_restores_recorded_states(setup_ecs):
+    """
+    Verify rewinding k ticks restores exactly the state recorded k ticks before the latest.
+    """
+    em, cm, view = setup_ecs
+    history = RewindBuffer(em, cm, capacity=16)
+    states = []
+    for _ in range(10):
+        history.record()
+        states.append(capture(em, cm, view))
+        step(em, cm)
+
+    assert history.rewind(4) == states[5][0]
+    assert_same(capture(em, cm, view), states[5])
+    assert history.count == 6
+
+    assert history.rewind(5) == states[0][0]
+    assert_same(capture(em, cm, view), states[0])
+
+
+def test_recording_continues_after_rewind_and_ring_wraps(setup_ecs):
+    """
+    Ensure history is bounded by capacity and rewritten after a rewind.
+    """
+    em, cm, view = setup_ecs
+    history = RewindBuffer(em, cm, capacity=4)
+    for _ in range(6):
+        history.record()
+        step(em, cm)
+    assert history.count == 4
+    assert history.ticks == [3, 4, 5, 6]
+    with pytest.raises(IndexError):
+        history.rewind(4)
+
+    history.rewind(2)
+    step(em, cm)
+    history.record()
+    assert history.ticks == [3, 4, 5]
+
+
+def test_steady_state_recording_does_not_grow_slabs(setup_ecs):
+    """
+    Check slabs stop reallocating once the rows in use stop growing.
+    """
+    em, cm, _ = setup_ecs
+    history = RewindBuffer(em, cm, capacity=8)
+    history.record()
+    slabs = dict(history._slabs)
+    for _ in range(20):
+        cm.get_component_data("Position")[: em.next_id] += 1.0
+        history.record()
+    assert all(history._slabs[name] is slab for name, slab in slabs.items())
+
+
+def test_new_components_are_rejected(setup_ecs):
+    """
+    Verify registering a component after creating the buffer raises on record.
+    """
+    em, cm, _ = setup_ecs
+    history = RewindBuffer(em, cm, capacity=2)
+    cm.register_component("Late", (), np.float32)
+    with pytest.raises(ValueError):
+        history.record()
+
+
+def test_rewind_clears_change_ticks_of_future_ids(setup_ecs):
+    """
+    Ensure IDs created after the restored state are not reported as changed once reused.
+    """
+    em, cm, _ = setup_ecs
+    history = RewindBuffer(em, cm, capacity=8)
+    history.record()
+    since = cm.tick
+    cm.advance_tick()
+
+    for _ in range(3):
+        eid = em.create_entity()
+        cm.add_component(eid, "Position", [5.0, 5.0])
+        cm.advance_tick()
+    history.record()
+    history.rewind(1)
+
+    assert cm.query_changed("Position", since).size == 0
+    assert np.all(cm.changed_ticks["Position"][em.next_id :] == 0)
+
+
+def test_tracked_rows_restored_by_change_tick(setup_ecs):
+    """
+    Check tracked dense rows are restored when stamped, and only then.
+    """
+    em, cm, _ = setup_ecs
+    history = RewindBuffer(em, cm, capacity=4)
+    history.record()
+    cm.advance_tick()
+
+    positions = cm.get_component_data("Position")
+    positions[:4] = 9.0
+    cm.mark_changed([0, 1], "Position")
+    history.rewind(0)
+
+    assert np.allclose(positions[:2], 0.0)
+    assert np.allclose(positions[2:4], 9.0)
+
+
+def test_cleaned_up_rows_are_restored():
+    """
+    Ensure a tracked row written and cleaned up after recording is restored, even
+    though cleanup resets its change tick to the recorded 0.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("P", (), np.float32, track_changes=True)
+    eid = em.create_entity()
+    history = RewindBuffer(em, cm, capacity=4)
+    history.record()
+
+    cm.add_component(eid, "P", 5.0)
+    em.destroy_entity(eid)
+    cm.cleanup_entity(eid)
+    history.record()
+    history.rewind(1)
+
+    assert em.alive_mask[eid]
+    assert cm.get_component_data("P")[eid] == 0.0
+
+
+def test_paged_components_are_recorded_per_page():
+    """
+    Check paged components round-trip, including rows past the allocated pages.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=8)
+    cm.register_component("Heat", (), np.float64)
+    ids = em.create_entities(20)
+    cm.add_components(ids[:12], "Heat", 1.0)
+    history = RewindBuffer(em, cm, capacity=4)
+    history.record()
+
+    cm.add_components(ids, "Heat", 7.0)
+    history.record()
+    history.rewind(1)
+
+    heat = cm.get_component_data("Heat")
+    assert np.all(heat[:12] == 1.0) and np.all(heat[12:20] == 0.0)
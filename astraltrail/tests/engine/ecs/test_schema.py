@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.command_buffer import CommandBuffer
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.schema import ComponentSchema
+
+MAX_ENTITIES = 50
+
+FIELDS = {"mass": np.float32, "inertia": (np.float32, (3,)), "flags": np.uint8}
+
+
+@pytest.fixture(params=["aos", "soa"])
+def setup_ecs(request):
+    """
+    Create managers with a dense 'RigidBody' schema in each layout.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_schema("RigidBody", ComponentSchema(FIELDS, layout=request.param))
+    return em, cm
+
+
+def test_field_views_are_zero_copy(setup_ecs):
+    """
+    Verify named field views read and write component storage in place.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(3)
+    cm.add_components(ids, "RigidBody", {"mass": [1.0, 2.0, 3.0], "flags": 1})
+
+    body = cm.view("RigidBody")
+    assert body.fields == ("mass", "inertia", "flags")
+    assert np.allclose(body.mass[ids], [1.0, 2.0, 3.0])
+
+    body.mass *= 2.0
+    body.inertia[ids[0]] = [1.0, 1.0, 1.0]
+    assert np.allclose(cm.view("RigidBody").mass[ids], [2.0, 4.0, 6.0])
+
+    record = cm.get_component(int(ids[0]), "RigidBody")
+    assert record["mass"] == 2.0
+    assert np.allclose(record["inertia"], 1.0)
+    assert record["flags"] == 1
+
+
+def test_single_add_accepts_dict_and_record(setup_ecs):
+    """
+    Ensure single-entity adds accept dicts and structured records.
+    """
+    em, cm = setup_ecs
+    a, b = em.create_entity(), em.create_entity()
+    schema = cm.schemas["RigidBody"]
+
+    cm.add_component(a, "RigidBody", {"mass": 5.0})
+    record = np.zeros((), dtype=schema.dtype)
+    record["flags"] = 7
+    cm.add_component(b, "RigidBody", record)
+
+    body = cm.view("RigidBody")
+    assert body.mass[a] == 5.0
+    assert body.flags[b] == 7
+
+    with pytest.raises(KeyError):
+        cm.add_component(a, "RigidBody", {"charge": 1.0})
+    with pytest.raises(AttributeError):
+        body.charge
+
+
+def test_command_buffer_adds_schema_values(setup_ecs):
+    """
+    Check deferred adds keep every field of a schema component.
+    """
+    em, cm = setup_ecs
+    buffer = CommandBuffer()
+    pending = buffer.spawn({"RigidBody": {"mass": 4.0, "flags": 2}}, n=2)
+    buffer.flush(em, cm)
+
+    body = cm.view("RigidBody")
+    assert np.allclose(body.mass[pending.ids], 4.0)
+    assert np.all(body.flags[pending.ids] == 2)
+
+
+def test_sparse_soa_schema_keeps_columns_aligned():
+    """
+    Verify sparse SoA columns stay aligned with the owners through removals.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_schema("Body", ComponentSchema(FIELDS, layout="soa"), sparse=True)
+    ids = em.create_entities(4)
+    cm.add_components(ids, "Body", {"mass": [0.0, 1.0, 2.0, 3.0]})
+
+    cm.remove_component(int(ids[1]), "Body")
+    cm.remove_components([ids[0]], "Body")
+
+    owners = cm.get_component_owners("Body")
+    assert np.allclose(cm.view("Body").mass, owners)
+    assert set(cm.query_entities_with(["Body"])) == {2, 3}
+    with pytest.raises(KeyError):
+        cm.get_component(int(ids[1]), "Body")
+
+
+def test_invalid_schemas_are_rejected():
+    """
+    Ensure bad layouts, name clashes and paged AoS schemas raise.
+    """
+    with pytest.raises(ValueError):
+        ComponentSchema(FIELDS, layout="columnar")
+
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Body.mass", (), np.float32)
+    with pytest.raises(ValueError):
+        cm.register_schema("Body", ComponentSchema(FIELDS, layout="soa"))
+    assert "Body" not in cm.components
+    with pytest.raises(KeyError):
+        cm.view("Body.mass")
+
+    paged = create_component_manager(MAX_ENTITIES, storage="paged", page_size=16)
+    with pytest.raises(ValueError):
+        paged.register_schema("Body", ComponentSchema(FIELDS, layout="aos"))
+    paged.register_schema("Body", ComponentSchema(FIELDS, layout="soa"))
+
+
+def test_soa_meta_describes_membership_storage():
+    """
+    Verify SoA meta matches the zero-width membership array; the record dtype is on the schema.
+    """
+    cm = ComponentManager(MAX_ENTITIES)
+    schema = ComponentSchema(FIELDS, layout="soa")
+    cm.register_schema("RigidBody", schema)
+
+    assert tuple(cm.meta["RigidBody"]["shape"]) == cm.components["RigidBody"].shape[1:] == (0,)
+    assert np.dtype(cm.meta["RigidBody"]["dtype"]) == cm.components["RigidBody"].dtype
+    assert cm.schemas["RigidBody"].dtype == schema.dtype
+
+
+def test_paged_soa_fields_iterate_by_page():
+    """
+    Check paged field views support indexed updates and page-wise whole-field updates.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = create_component_manager(MAX_ENTITIES, storage="paged", page_size=16)
+    cm.register_schema("RigidBody", ComponentSchema(FIELDS, layout="soa"))
+    ids = em.create_entities(20)
+    cm.add_components(ids, "RigidBody", {"mass": 1.0})
+
+    body = cm.view("RigidBody")
+    body.mass[ids[:5]] *= 3.0
+    for _, _, mass in body.iter_pages("mass"):
+        mass *= 2.0
+    body.flags = 7
+
+    assert np.allclose(body.mass[ids], [6.0] * 5 + [2.0] * 15)
+    assert np.all(body.flags[ids] == 7)
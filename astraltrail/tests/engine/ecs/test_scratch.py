@@ -0,0 +1,145 @@
+import threading
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.scratch import ScratchArena
+from astraltrail.src.engine.ecs.system import SystemManager
+
+
+def test_buffers_are_distinct_within_a_phase_and_reused_after_reset():
+    """
+    Verify each get() in a phase gets its own buffer and reset() recycles them.
+    """
+    arena = ScratchArena()
+    a = arena.get((4, 3))
+    b = arena.get((4, 3))
+    assert a is not b
+    assert arena.misses == 2
+
+    arena.reset()
+    assert arena.get((4, 3)) is a
+    assert arena.get((4, 3)) is b
+    assert arena.hits == 2
+    assert arena.nbytes == 2 * 4 * 3 * 4
+
+
+def test_buffers_are_keyed_by_dtype_and_zeroed_on_request():
+    """
+    Ensure dtype is part of the key and zeros() clears reused buffers.
+    """
+    arena = ScratchArena()
+    f = arena.zeros(8)
+    f[:] = 5.0
+    assert arena.get(8, np.int32).dtype == np.int32
+
+    arena.reset()
+    assert arena.zeros(8) is f
+    assert not f.any()
+    assert arena.like(f) is not f
+
+
+def test_system_manager_resets_arena_each_phase():
+    """
+    Check the SystemManager hands out the same buffer on every update.
+    """
+    seen = []
+    sm = SystemManager()
+    sm.register(lambda cm, em, dt: seen.append(sm.scratch.get(16)), name="temp")
+
+    for _ in range(3):
+        sm.update(None, None, 0.1)
+
+    assert seen[0] is seen[1] is seen[2]
+    assert sm.scratch.misses == 1
+
+
+def test_debug_mode_counts_allocations_per_system():
+    """
+    Verify debug mode attributes transient allocations and scratch misses to systems.
+    """
+
+    def leaky(cm, em, dt):
+        np.ones(100_000)
+
+    def clean(cm, em, dt):
+        sm.scratch.get(100_000).fill(1.0)
+
+    sm = SystemManager(debug_allocations=True)
+    sm.register(leaky)
+    sm.register(clean)
+    for _ in range(2):
+        sm.update(None, None, 0.1)
+    sm.shutdown()
+
+    stats = sm.scratch.allocations
+    assert stats["leaky"]["calls"] == 2
+    assert stats["leaky"]["peak_bytes"] >= 800_000
+    assert stats["clean"]["scratch_misses"] == 1
+    assert stats["clean"]["total_bytes"] < 800_000 * 2
+
+
+def test_debug_mode_with_parallel_workers():
+    """
+    Concurrent systems in one wave are measured separately without racing.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+    sm = SystemManager(workers=2, debug_allocations=True)
+
+    def make(name):
+        def system(cm, em, dt):
+            barrier.wait()
+            sm.scratch.get(8 if name == "a" else 16)
+
+        return system
+
+    sm.register(make("a"), name="a", writes=["A"])
+    sm.register(make("b"), name="b", writes=["B"])
+    for _ in range(3):
+        sm.update(None, None, 0.1)
+    sm.shutdown()
+
+    stats = sm.scratch.allocations
+    assert stats["a"]["calls"] == stats["b"]["calls"] == 3
+    assert stats["a"]["scratch_misses"] == stats["b"]["scratch_misses"] == 1
+
+
+def test_debug_mode_survives_failing_system():
+    """
+    A system that raises still ends its measurement.
+    """
+    sm = SystemManager(debug_allocations=True)
+
+    def broken(cm, em, dt):
+        raise RuntimeError("boom")
+
+    sm.register(broken)
+    with pytest.raises(RuntimeError):
+        sm.update(None, None, 0.1)
+
+    assert sm.scratch.allocations["broken"]["calls"] == 1
+    sm.scratch.get(4)
+    assert sm.scratch.allocations["broken"]["scratch_misses"] == 0
+    sm.shutdown()
+
+
+def test_shutdown_stops_tracing_started_by_the_arena():
+    """
+    tracemalloc is stopped again, unless it was already running before debug mode.
+    """
+    sm = SystemManager(debug_allocations=True)
+    sm.register(lambda cm, em, dt: None, name="noop")
+    sm.update(None, None, 0.1)
+    assert tracemalloc.is_tracing()
+    sm.shutdown()
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        sm.update(None, None, 0.1)
+        sm.shutdown()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert sm.scratch.allocations["noop"]["calls"] == 2
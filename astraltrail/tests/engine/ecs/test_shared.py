@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.shared import ProcessPoolBackend, SharedComponentManager
+
+MAX_ENTITIES = 1000
+
+
+def integrate(arrays, ids, dt):
+    """Process system: advance positions in place and report the worker's PID."""
+    arrays["Position"][ids] += arrays["Velocity"][ids] * dt
+    return os.getpid(), len(ids)
+
+
+def attached_blocks(arrays, ids, dt):
+    """Process system: report the shared blocks the worker holds open."""
+    from astraltrail.src.engine.ecs import shared
+
+    return sorted(shared._attached)
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Pytest fixture with shared-memory 'Position' and 'Velocity' components.
+    """
+    em = EntityManager(max_entities=MAX_ENTITIES)
+    cm = SharedComponentManager(max_entities=MAX_ENTITIES)
+    cm.register_component("Position", shape=(2,), dtype=np.float32)
+    cm.register_component("Velocity", shape=(2,), dtype=np.float32)
+    cm.register_component("Tag", shape=(1,), dtype=np.int32, sparse=True)
+
+    yield em, cm
+    cm.close()
+
+
+def test_dense_components_live_in_shared_memory(setup_ecs):
+    """
+    Dense components are backed by shared blocks; sparse ones are not shareable.
+    """
+    _, cm = setup_ecs
+    name, shape, dtype = cm.shared_spec("Position")
+    assert shape == (MAX_ENTITIES, 2)
+    assert np.dtype(dtype) == np.float32
+    assert cm.get_component_data("Position").flags["C_CONTIGUOUS"]
+
+    with pytest.raises(ValueError):
+        cm.shared_spec("Tag")
+
+
+def test_partition_into_contiguous_chunks():
+    """
+    IDs are split into at most `parts` contiguous non-empty chunks.
+    """
+    chunks = ProcessPoolBackend.partition(np.arange(10), 3)
+    assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert len(ProcessPoolBackend.partition(np.arange(2), 8)) == 2
+
+
+def test_workers_write_through_shared_views(setup_ecs):
+    """
+    Worker processes update the parent's arrays in place through zero-copy views.
+    """
+    em, cm = setup_ecs
+    ids = em.create_entities(600)
+    cm.add_components(ids, "Velocity", [1.0, 2.0])
+
+    with ProcessPoolBackend(cm, workers=2) as pool:
+        results = pool.run(integrate, ["Position", "Velocity"], ids[::2], 0.5, chunks=4)
+
+    assert sum(count for _, count in results) == 300
+    assert all(pid != os.getpid() for pid, _ in results)
+
+    positions = cm.get_component_data("Position")
+    assert np.allclose(positions[ids[::2]], [0.5, 1.0])
+    assert np.allclose(positions[ids[1::2]], 0.0)
+
+
+def test_workers_close_blocks_of_previous_manager(setup_ecs):
+    """
+    Switching the pool to another manager closes the worker's handles to the old blocks.
+    """
+    _, cm = setup_ecs
+    ids = np.arange(10)
+
+    with SharedComponentManager(max_entities=MAX_ENTITIES) as other, ProcessPoolBackend(
+        cm, workers=1
+    ) as pool:
+        other.register_component("Position", shape=(2,), dtype=np.float32)
+        first = pool.run(attached_blocks, ["Position", "Velocity"], ids, 0.0)[0]
+        pool.cm = other
+        second = pool.run(attached_blocks, ["Position"], ids, 0.0)[0]
+        assert second == [other.shared_blocks["Position"].name]
+
+    assert first == sorted(block.name for block in cm.shared_blocks.values())
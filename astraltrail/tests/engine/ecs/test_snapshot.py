@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.component import ComponentManager, create_component_manager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.schema import ComponentSchema
+from astraltrail.src.engine.ecs.snapshot import (
+    BLOCK_ALIGNMENT,
+    Snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+
+MAX_ENTITIES = 64
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Create a world with dense, sparse, tracked and schema components and a freed ID.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (3,), np.float32, track_changes=True)
+    cm.register_component("Tag", (), np.int16, sparse=True)
+    cm.register_schema(
+        "Body", ComponentSchema({"mass": np.float64, "flags": np.uint8}, layout="soa")
+    )
+    cm.register_schema(
+        "Stats", ComponentSchema({"hp": np.int32, "armor": (np.float32, (2,))}), sparse=True
+    )
+
+    ids = em.create_entities(10)
+    cm.add_components(ids, "Position", np.arange(30, dtype=np.float32).reshape(10, 3))
+    cm.add_components(ids[::3], "Tag", [1, 2, 3, 4])
+    cm.add_components(ids, "Body", {"mass": np.arange(10) * 0.5})
+    cm.add_component(int(ids[4]), "Stats", {"hp": 9, "armor": [1.0, 2.0]})
+    cm.advance_tick()
+    em.destroy_entity(int(ids[6]))
+    cm.cleanup_entity(int(ids[6]))
+    return em, cm
+
+
+def test_round_trip(setup_ecs, tmp_path):
+    """
+    Verify a saved world restores with identical entity and component state.
+    """
+    em, cm = setup_ecs
+    path = tmp_path / "world.ats"
+    save_snapshot(path, em, cm)
+    em2, cm2 = load_snapshot(path)
+
+    assert em2.next_id == em.next_id
+    assert np.array_equal(em2.alive_mask, em.alive_mask)
+    assert np.array_equal(em2.generations, em.generations)
+    assert em2.create_entity() == 6
+
+    assert np.array_equal(cm2.get_component_data("Position"), cm.get_component_data("Position"))
+    assert np.array_equal(cm2.changed_ticks["Position"], cm.changed_ticks["Position"])
+    assert cm2.tick == cm.tick
+    assert set(cm2.query_entities_with(["Tag"])) == set(cm.query_entities_with(["Tag"]))
+    assert cm2.get_component(3, "Tag") == 2
+    assert np.allclose(cm2.view("Body").mass[:10], np.arange(10) * 0.5)
+    assert cm2.view("Stats").hp[0] == 9
+    assert np.allclose(cm2.get_component(4, "Stats")["armor"], [1.0, 2.0])
+
+
+def test_blocks_are_page_aligned_memmaps(setup_ecs, tmp_path):
+    """
+    Ensure blocks are aligned, memory-mapped and limited to the rows in use.
+    """
+    em, cm = setup_ecs
+    path = tmp_path / "world.ats"
+    save_snapshot(path, em, cm)
+    snap = Snapshot(path)
+
+    for info in snap.header["blocks"].values():
+        assert info["offset"] % BLOCK_ALIGNMENT == 0
+
+    positions = snap.component("Position")
+    assert isinstance(positions, np.memmap)
+    assert positions.shape == (10, 3)
+    assert not positions.flags.writeable
+    assert list(snap.owners("Tag")) == list(cm.get_component_owners("Tag"))
+    assert snap.component("Tag").shape == (3,)
+
+
+def test_restore_into_paged_manager(setup_ecs, tmp_path):
+    """
+    Check snapshots restore into a caller-provided paged ComponentManager.
+    """
+    em, cm = setup_ecs
+    path = tmp_path / "world.ats"
+    save_snapshot(path, em, cm)
+
+    paged = create_component_manager(MAX_ENTITIES, storage="paged", page_size=8)
+    _, paged = Snapshot(path).restore(cm=paged)
+    assert np.array_equal(
+        paged.get_component_data("Position")[:10], cm.get_component_data("Position")[:10]
+    )
+
+
+def test_invalid_files_and_targets_are_rejected(setup_ecs, tmp_path):
+    """
+    Verify bad magic, newer versions and non-empty targets raise ValueError.
+    """
+    em, cm = setup_ecs
+    bogus = tmp_path / "bogus.ats"
+    bogus.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        Snapshot(bogus)
+
+    path = tmp_path / "world.ats"
+    save_snapshot(path, em, cm)
+    with pytest.raises(ValueError):
+        load_snapshot(path, em=em)
+
+    data = bytearray(path.read_bytes())
+    data[8] = 99
+    newer = tmp_path / "newer.ats"
+    newer.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        Snapshot(newer)
@@ -0,0 +1,126 @@
+import os
+
+import numpy as np
+import pytest
+
+from astraltrail.src.engine.ecs.component import ComponentManager
+from astraltrail.src.engine.ecs.entity import EntityManager
+from astraltrail.src.engine.ecs.stream import SnapshotStreamReader, SnapshotStreamWriter
+
+MAX_ENTITIES = 256
+
+
+@pytest.fixture
+def setup_ecs():
+    """
+    Create a world with a dense Position and a sparse Tag.
+    """
+    em = EntityManager(MAX_ENTITIES)
+    cm = ComponentManager(MAX_ENTITIES)
+    cm.register_component("Position", (3,), np.float32)
+    cm.register_component("Tag", (), np.int32, sparse=True)
+    ids = em.create_entities(100)
+    cm.add_components(ids, "Position", 0.0)
+    return em, cm
+
+
+def step(em, cm):
+    """Move one entity and occasionally tag or spawn one, then advance the tick."""
+    positions = cm.get_component_data("Position")
+    positions[cm.tick % 100] += 1.0
+    if cm.tick % 4 == 0:
+        cm.add_component(cm.tick % 100, "Tag", cm.tick)
+    if cm.tick % 7 == 0:
+        em.create_entity()
+    cm.advance_tick()
+
+
+def record(em, cm, directory, frames, **kwargs):
+    """Record `frames` frames and return the Position array seen at every tick."""
+    history = {}
+    with SnapshotStreamWriter(directory, **kwargs) as writer:
+        for _ in range(frames):
+            writer.write(em, cm)
+            history[cm.tick] = (
+                cm.get_component_data("Position").copy(),
+                em.next_id,
+                dict(zip(cm.get_component_owners("Tag"), cm.get_component_data("Tag"))),
+            )
+            step(em, cm)
+    return history
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_seek_reproduces_every_tick(setup_ecs, tmp_path, codec):
+    """
+    Verify every recorded tick restores exactly from its keyframe and deltas.
+    """
+    em, cm = setup_ecs
+    history = record(em, cm, tmp_path, 25, keyframe_interval=10, codec=codec)
+
+    reader = SnapshotStreamReader(tmp_path)
+    assert reader.ticks == sorted(history)
+    for tick, (positions, next_id, tags) in history.items():
+        em2, cm2 = reader.restore(tick)
+        assert cm2.tick == tick
+        assert em2.next_id == next_id
+        assert np.array_equal(cm2.get_component_data("Position"), positions)
+        assert dict(zip(cm2.get_component_owners("Tag"), cm2.get_component_data("Tag"))) == tags
+
+
+def test_seek_between_ticks_uses_latest_earlier_frame(setup_ecs, tmp_path):
+    """
+    Ensure seeking to an unrecorded tick returns the closest earlier frame.
+    """
+    em, cm = setup_ecs
+    with SnapshotStreamWriter(tmp_path) as writer:
+        writer.write(em, cm, tick=10)
+        cm.get_component_data("Position")[0] = 5.0
+        writer.write(em, cm, tick=20)
+        with pytest.raises(ValueError):
+            writer.write(em, cm, tick=20)
+
+    reader = SnapshotStreamReader(tmp_path)
+    assert reader.state(15).component("Position")[0, 0] == 0.0
+    assert reader.state(99).component("Position")[0, 0] == 5.0
+    with pytest.raises(KeyError):
+        reader.state(9)
+
+
+def test_deltas_are_small_and_segments_bounded(setup_ecs, tmp_path):
+    """
+    Check deltas compress far below keyframes and old segments are pruned.
+    """
+    em, cm = setup_ecs
+    em.create_entities(140)
+    cm.get_component_data("Position")[:] = np.random.default_rng(0).random((MAX_ENTITIES, 3))
+    history = record(em, cm, tmp_path, 40, keyframe_interval=10, max_segments=2)
+
+    assert len(os.listdir(tmp_path)) == 2
+    reader = SnapshotStreamReader(tmp_path)
+    assert reader.ticks == sorted(history)[-20:]
+
+    lengths = {}
+    for (_, kind, path, offset), following in zip(
+        reader.index, reader.index[1:] + [(0, 0, None, 0)]
+    ):
+        end = following[3] if following[2] == path else os.path.getsize(path)
+        lengths.setdefault(kind, []).append(end - offset)
+    assert max(lengths[1]) * 5 < min(lengths[0])
+
+
+def test_writer_refuses_to_mix_recordings(setup_ecs, tmp_path):
+    """
+    Verify a second recording into the same directory must replace the first explicitly.
+    """
+    em, cm = setup_ecs
+    record(em, cm, tmp_path, 30, keyframe_interval=10)
+
+    with pytest.raises(FileExistsError):
+        SnapshotStreamWriter(tmp_path)
+
+    cm.tick = 1
+    history = record(em, cm, tmp_path, 5, keyframe_interval=10, overwrite=True)
+    reader = SnapshotStreamReader(tmp_path)
+    assert reader.ticks == sorted(history)
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".atss")]) == 1
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock
 
@@ -127,3 +130,231 @@ def test_update_skips_disabled_systems():
 
     sm.update(None, None, 0.016, include_tags=["core"])
     sys.assert_not_called()
+
+def test_build_waves_respects_conflicts():
+    """
+    Systems touching disjoint components share a wave; conflicting ones keep order.
+    """
+    sm = SystemManager()
+    sm.register(Mock(), name="physics", reads=["Velocity"], writes=["Position"])
+    sm.register(Mock(), name="ai", reads=["Position"], writes=["Intent"])
+    sm.register(Mock(), name="animation", writes=["Pose"])
+    sm.register(Mock(), name="steering", reads=["Intent"], writes=["Velocity"])
+    sm.register(Mock(), name="legacy")  # undeclared access runs alone
+
+    waves = [[sys.name for sys in wave] for wave in sm.build_waves(sm.systems)]
+    assert waves == [["physics", "animation"], ["ai"], ["steering"], ["legacy"]]
+
+def test_parallel_update_runs_disjoint_systems_concurrently():
+    """
+    With workers enabled, non-conflicting systems must overlap in time.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def physics(cm, em, dt):
+        barrier.wait()
+        time.sleep(0.05)
+
+    def animation(cm, em, dt):
+        barrier.wait()
+        time.sleep(0.05)
+
+    sm = SystemManager(workers=2)
+    sm.register(physics, writes=["Position"])
+    sm.register(animation, writes=["Pose"])
+
+    sm.update(None, None, 0.016)
+    sm.shutdown()
+
+    trace = sm.last_trace
+    assert trace.waves == [["physics", "animation"]]
+    assert {sys.name for sys in trace.timings} == {"physics", "animation"}
+    assert trace.parallelism > 1.0
+
+def test_trace_keeps_systems_with_duplicate_names():
+    """
+    Systems sharing a name get separate timings in the schedule trace.
+    """
+    sm = SystemManager(workers=2)
+    sm.register(lambda cm, em, dt: time.sleep(0.01), name="step", writes=["A"])
+    sm.register(lambda cm, em, dt: time.sleep(0.01), name="step", writes=["B"])
+
+    sm.update(None, None, 0.016)
+    sm.shutdown()
+
+    trace = sm.last_trace
+    assert len(trace.timings) == 2
+    starts, ends = zip(*trace.timings.values())
+    assert trace.wall_time == pytest.approx(max(ends) - min(starts))
+
+def test_parallel_update_preserves_conflicting_order():
+    """
+    Systems that write the same component run sequentially in registration order.
+    """
+    call_order = []
+
+    def first(cm, em, dt): call_order.append("first")
+    def second(cm, em, dt): call_order.append("second")
+
+    sm = SystemManager(workers=4)
+    sm.register(first, writes=["Position"])
+    sm.register(second, reads=["Position"], writes=["Velocity"])
+
+    for _ in range(5):
+        sm.update(None, None, 0.016)
+    sm.shutdown()
+
+    assert call_order == ["first", "second"] * 5
+    assert sm.last_trace.waves == [["first"], ["second"]]
+
+def test_parallel_update_propagates_exceptions():
+    """
+    Errors raised inside worker threads surface from update().
+    """
+    def broken(cm, em, dt): raise RuntimeError("boom")
+
+    sm = SystemManager(workers=2)
+    sm.register(broken, writes=["A"])
+    sm.register(Mock(), name="other", writes=["B"])
+
+    with pytest.raises(RuntimeError):
+        sm.update(None, None, 0.016)
+    sm.shutdown()
+
+def test_dispatch_list_is_cached_and_invalidated():
+    """
+    Verify dispatch lists are reused between updates and rebuilt on register/set_enabled.
+    """
+    sm = SystemManager()
+    sm.register(Mock(), name="a", tags=["physics"])
+    sm.register(Mock(), name="b", tags=["render"])
+
+    first = sm.dispatch_list("update", ["physics"])
+    assert [sys.name for sys in first] == ["a"]
+    assert sm.dispatch_list("update", ["physics"]) is first
+
+    sm.set_enabled("a", False)
+    assert sm.dispatch_list("update", ["physics"]) == []
+    sm.set_enabled("a", True)
+
+    sm.register(Mock(), name="c", tags=["physics"])
+    assert [sys.name for sys in sm.dispatch_list("update", ["physics"])] == ["a", "c"]
+    assert [sys.name for sys in sm.dispatch_list()] == ["a", "b", "c"]
+
+def test_set_enabled_same_value_keeps_cache():
+    """
+    Ensure toggling a system to its current state does not invalidate cached lists.
+    """
+    sm = SystemManager()
+    sm.register(Mock(), name="a")
+    cached = sm.dispatch_list()
+    sm.set_enabled("a", True)
+    sm.set_enabled("missing", False)
+    assert sm.dispatch_list() is cached
+
+def test_interval_systems_are_staggered_and_get_accumulated_dt():
+    """
+    Verify low-rate systems run every N-th update, staggered, with the elapsed time as dt.
+    """
+    calls = {"a": [], "b": []}
+    sm = SystemManager()
+    sm.register(lambda cm, em, dt: calls["a"].append(dt), name="a", interval=2)
+    sm.register(lambda cm, em, dt: calls["b"].append(dt), name="b", interval=2)
+
+    for _ in range(4):
+        sm.update(None, None, 0.25)
+
+    assert calls["a"] == [0.25, 0.5]
+    assert calls["b"] == [0.5, 0.5]
+
+def test_frame_budget_defers_deferrable_systems():
+    """
+    Ensure deferrable systems are postponed once the budget is spent, and run next frame.
+    """
+    calls = []
+    sm = SystemManager(frame_budget=0.001, max_deferrals=2)
+    sm.register(lambda cm, em, dt: time.sleep(0.005), name="slow")
+    sm.register(lambda cm, em, dt: calls.append(dt), name="ai", deferrable=True)
+
+    sm.begin_frame()
+    sm.update(None, None, 0.1)
+    assert sm.deferred == ["ai"]
+    assert calls == []
+
+    sm.set_enabled("slow", False)
+    sm.begin_frame()
+    sm.update(None, None, 0.1)
+    assert sm.deferred == []
+    assert calls == [pytest.approx(0.2)]
+    assert sm.deferred_counts == {"ai": 1}
+
+def test_end_frame_stops_budget_clock():
+    """
+    After end_frame(), updates measure the budget from their own start instead of a
+    stale frame start.
+    """
+    calls = []
+    sm = SystemManager(frame_budget=0.01)
+    sm.register(lambda cm, em, dt: calls.append(dt), name="ai", deferrable=True)
+
+    sm.begin_frame()
+    sm.end_frame()
+    time.sleep(0.02)
+    for _ in range(3):
+        sm.update(None, None, 0.1)
+
+    assert len(calls) == 3
+    assert sm.deferred_counts == {}
+
+def test_interval_slot_advances_once_per_frame():
+    """
+    Updating a phase twice in one frame (e.g. with different tag filters) must not
+    advance interval scheduling twice.
+    """
+    calls = []
+    sm = SystemManager()
+    sm.register(lambda cm, em, dt: calls.append(dt), name="ai", tags=["ai", "slow"],
+                interval=2, offset=0)
+
+    for _ in range(4):
+        sm.begin_frame()
+        sm.update(None, None, 0.1, include_tags=["ai"])
+        sm.update(None, None, 0.0, include_tags=["slow"])
+        sm.end_frame()
+
+    assert calls == [pytest.approx(0.1), 0.0, pytest.approx(0.2), 0.0]
+
+def test_deferrals_are_capped():
+    """
+    Verify a deferrable system still runs after max_deferrals consecutive postponements.
+    """
+    calls = []
+    sm = SystemManager(frame_budget=0.0, max_deferrals=1)
+    sm.register(lambda cm, em, dt: time.sleep(0.001), name="slow")
+    sm.register(lambda cm, em, dt: calls.append(dt), name="ai", deferrable=True)
+
+    for _ in range(2):
+        sm.begin_frame()
+        sm.update(None, None, 0.1)
+
+    assert calls == [pytest.approx(0.2)]
+    assert sm.deferred_counts == {"ai": 1}
+
+def test_frame_traces_cover_every_phase_of_the_frame():
+    """
+    Schedule traces of all phases run since begin_frame() are kept, not only the last.
+    """
+    sm = SystemManager(workers=2)
+    for phase in ("pre", "update", "post"):
+        sm.register(lambda cm, em, dt: time.sleep(0.005), name=phase, phase=phase, writes=[phase])
+
+    for _ in range(2):
+        sm.begin_frame()
+        for phase in ("pre", "update", "post"):
+            sm.update(None, None, 0.016, phase=phase)
+        sm.end_frame()
+    sm.shutdown()
+
+    assert [trace.phase for trace in sm.frame_traces] == ["pre", "update", "post"]
+    assert sm.last_trace is sm.frame_traces[-1]
+    assert sm.frame_parallelism == pytest.approx(1.0, rel=0.2)